@@ -1,6 +1,9 @@
 """
 When executed, this file will create a configurable number of valid save files, for testing
 purposes. The username and password are the same as the save file's name.
+
+The saves are generated from a seed, so the same command always creates the same saves, no
+matter how many processes are used. Run with --help for the available options.
 """
 
 # TODO: Update copyright
@@ -24,26 +27,180 @@ purposes. The username and password are the same as the save file's name.
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # ------------------------------------------------------------------------------
 
-from random import randint
+import argparse
+import datetime
+import logging
+import os
+import random
+import string
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, List, NamedTuple, Optional, Sequence, Tuple
 
+from src.core.state import migrations
 from src.core.state.game_state import GameState
-from src.core.state.save_manager import SaveManager
+from src.core.state.save_format import CODECS
+from src.core.state.save_manager import SAVE_DIRECTORY, SAVEFILE_EXTENSION, shard_path
 
 NUM_SAVES = 5
+DEFAULT_BRANDS = "ether-industries=6,arch=1,manjaro=1,actif=1,secret=1"
+
+# How many saves each task of the process pool creates
+CHUNK_SIZE = 500
+
+SAVE_CREATION = "Created by create_valid_saves.py"
+FIRST_SAVE_DATE = datetime.date(2146, 1, 1)
+
+logger = logging.getLogger(__name__)
+
+
+class Options(NamedTuple):
+    """
+    The options shared by every task of the process pool.
+    """
+
+    directory: Path
+    seed: int
+    payload_size: int
+    brands: Sequence[str]
+    brand_weights: Sequence[float]
+    compression: Optional[str]
+    sharded: bool
+
+
+def parse_brands(text: str) -> Tuple[List[str], List[float]]:
+    """
+    Parse a brand distribution such as "arch=2,manjaro=1" into a list of brands and a list of
+    weights.
+    """
+    brands = []
+    weights = []
+    for item in text.split(","):
+        brand, _, weight = item.partition("=")
+        brands.append(brand.strip())
+        weights.append(float(weight) if weight else 1.0)
+    return brands, weights
+
+
+def create_save_data(number: int, options: Options) -> Tuple[str, Any]:
+    """
+    Return the filename and the data of save number <number>. Only depends on <number> and on
+    the options, not on the other saves.
+    """
+    rng = random.Random(f"{options.seed}-{number}")
+
+    name = str(rng.randint(0, 10000))
+    save_date = FIRST_SAVE_DATE + datetime.timedelta(days=rng.randint(0, 365 * 10))
+    brand = rng.choices(options.brands, options.brand_weights)[0]
+
+    data = migrations.new_save_data(
+        name=name,
+        username=name,
+        password=name,
+        save_date=str(save_date),
+        brand=brand,
+    )
+    data["metadata"]["save_creation"] = SAVE_CREATION
+    data["note"] = "".join(
+        rng.choices(string.ascii_letters + " ", k=options.payload_size)
+    )
+
+    filename = str(uuid.UUID(int=rng.getrandbits(128), version=4)) + SAVEFILE_EXTENSION
+    return filename, data
+
+
+def create_saves(start: int, stop: int, options: Options) -> int:
+    """
+    Create the saves numbered from <start> to <stop> (excluded). Runs in a worker process.
+
+    :return: the number of created saves
+    """
+    for number in range(start, stop):
+        filename, data = create_save_data(number, options)
+
+        state = GameState()
+        state.data = data
+        state.compression = options.compression
+        if options.sharded:
+            path = shard_path(options.directory, filename)
+            path.parent.mkdir(parents=True, exist_ok=True)
+        else:
+            path = options.directory / filename
+        state.save(path)
+
+    return stop - start
+
+
+def quiet_logging() -> None:
+    """
+    Only log warnings, logging every save would take longer than creating them.
+    """
+    logging.getLogger().setLevel(logging.WARNING)
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parse the command line arguments.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "-n", "--count", type=int, default=NUM_SAVES, help="number of saves to create"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="seed of the generated saves")
+    parser.add_argument(
+        "--payload-size",
+        type=int,
+        default=0,
+        help="number of characters of the note of each save",
+    )
+    parser.add_argument(
+        "--brands",
+        default=DEFAULT_BRANDS,
+        help="computer brands and their weights, as brand=weight,brand=weight",
+    )
+    parser.add_argument(
+        "--compression", choices=sorted(CODECS), default=None, help="save compression"
+    )
+    parser.add_argument(
+        "--sharded", action="store_true", help="use the sharded save directory layout"
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=os.cpu_count(), help="number of processes"
+    )
+    parser.add_argument(
+        "--directory", type=Path, default=SAVE_DIRECTORY, help="where to create the saves"
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    """
+    main
+    """
+    args = parse_args()
+    quiet_logging()
+
+    brands, brand_weights = parse_brands(args.brands)
+    options = Options(
+        args.directory,
+        args.seed,
+        args.payload_size,
+        brands,
+        brand_weights,
+        args.compression,
+        args.sharded,
+    )
+    args.directory.mkdir(parents=True, exist_ok=True)
+
+    starts = range(0, args.count, CHUNK_SIZE)
+    stops = [min(start + CHUNK_SIZE, args.count) for start in starts]
 
-manager = SaveManager()
+    with ProcessPoolExecutor(args.jobs, initializer=quiet_logging) as executor:
+        created = sum(executor.map(create_saves, starts, stops, [options] * len(starts)))
 
-for number in range(NUM_SAVES):
-    state = GameState()
-    save_creation = "Created by create_valid_saves.py"
-    rnd = randint(0, 10000)
-    rnd = str(rnd)
+    print(f"Created {created} saves in '{args.directory}'")
 
-    state.data["name"] = str(rnd)
-    state.data["metadata"]["save_creation"] = str(save_creation)
-    state.data["metadata"]["save_date"] = str(save_creation)
-    state.data["name"] = rnd
-    state.data["user"]["password"] = rnd
-    state.data["user"]["username"] = rnd
 
-    manager.save_state(state)
+if __name__ == "__main__":
+    main()
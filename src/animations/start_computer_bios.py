@@ -34,12 +34,18 @@ from src.core.render import CursesRenderer
 logger = logging.getLogger(__name__)
 
 
-def create_animation(renderer: CursesRenderer) -> BootAnimation:
-    """create a boot animation and returns it"""
+def init_colors() -> None:
+    """init the color pairs used by the animation"""
     curses.init_pair(1, curses.COLOR_YELLOW, curses.COLOR_BLACK)
     curses.init_pair(2, curses.COLOR_GREEN, curses.COLOR_BLACK)
     curses.init_pair(3, curses.COLOR_RED, curses.COLOR_BLACK)
 
+
+def create_animation(renderer: CursesRenderer) -> BootAnimation:
+    """
+    create a boot animation and returns it. init_colors() must be called before it
+    is started. It does not use curses, so it can be created in another thread.
+    """
     # text definition
     init = StyledText(renderer, "EtherBIOS v2.3.1 initialising...", 1)
     self_test = StyledText(renderer, "STARTING SELF-TEST...", 1)
@@ -37,13 +37,19 @@ from src.core.render import CursesRenderer
 logger = logging.getLogger(__name__)
 
 
-def create_animation(renderer: CursesRenderer) -> BootAnimation:
-    """create a boot animation and returns it"""
+def init_colors() -> None:
+    """init the color pairs used by the animation"""
     curses.init_pair(4, curses.COLOR_YELLOW, curses.COLOR_BLACK)  # info
     curses.init_pair(5, curses.COLOR_YELLOW, curses.COLOR_BLACK)  # progress
     curses.init_pair(2, curses.COLOR_GREEN, curses.COLOR_BLACK)  # good
     curses.init_pair(3, curses.COLOR_RED, curses.COLOR_BLACK)  # bad
 
+
+def create_animation(renderer: CursesRenderer) -> BootAnimation:
+    """
+    create a boot animation and returns it. init_colors() must be called before it
+    is started. It does not use curses, so it can be created in another thread.
+    """
     progress = StyledText(renderer, "IN PROGRESS", 5, invert=True, blink=True)
     # finished = StyledText(renderer, ["[", "OK", "]"], 2, bold=True)
     finished = StyledText(
@@ -22,7 +22,6 @@ animations with progress updates.
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # ------------------------------------------------------------------------------
 
-from time import sleep
 from typing import List, Optional, Union, Sequence
 
 from src.core.boot_animation.stage import Stage
@@ -65,7 +64,7 @@ class InfoStage:
                 step.start(x_pos, y_pos)
                 y_pos += 1
 
-        sleep(self.delay)
+        self.renderer.clock.sleep(self.delay)
 
         return y_pos - 1
 
@@ -105,14 +104,14 @@ class SimultaneousStage:
                 y_pos += 1
                 # noinspection PyProtectedMember
                 stage._start(x_pos, y_pos)  # pylint: disable=W0212
-                sleep(self.delay_between)
-            sleep(self.delay)
+                self.renderer.clock.sleep(self.delay_between)
+            self.renderer.clock.sleep(self.delay)
             y_pos = start_y
             for stage in self.stages:
                 y_pos += 1
                 # noinspection PyProtectedMember
                 stage._stop(y_pos)  # pylint: disable=W0212
-                sleep(self.delay_between)
+                self.renderer.clock.sleep(self.delay_between)
 
         return y_pos
 
@@ -153,7 +152,7 @@ class BootAnimation:
         for stage in self.stages:
             y_pos = stage.start(y_pos)
             y_pos = y_pos + 1  # we need to increment this to draw on a free line
-        sleep(self.delay)
+        self.renderer.clock.sleep(self.delay)
 
         assert isinstance(y_pos, int)
         return y_pos
@@ -21,8 +21,7 @@ This file contains the Stage class, which is used to hold information about a bo
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # ------------------------------------------------------------------------------
 
-from time import sleep
-from typing import Optional, List, Sized
+from typing import Optional, List
 
 from src.core.boot_animation.step import Step
 from src.core.boot_animation.styled_text import StyledText
@@ -68,7 +67,7 @@ class Stage:
         y_pos = start_y
         self._start(x_pos, y_pos)
 
-        sleep(self.delay)
+        self.renderer.clock.sleep(self.delay)
 
         for step in self.steps:
             y_pos += 1
@@ -81,8 +80,7 @@ class Stage:
 
     def _stop(self, start_y: int) -> None:
         if self.progress is not None:
-            assert isinstance(self.progress.text, Sized)
-            self.renderer.addtext(self.status_x, start_y, len(self.progress.text) * " ")
+            self.renderer.addtext(self.status_x, start_y, self.progress.width * " ")
         if self.finished is not None:
             self.finished.show(self.status_x, start_y)
 
@@ -20,8 +20,7 @@ This file contains the Step class, a class that holds information about a boot s
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # ------------------------------------------------------------------------------
-from time import sleep
-from typing import Optional, Sized
+from typing import Optional
 
 from src.core.boot_animation.styled_text import StyledText
 from src.core.render import CursesRenderer
@@ -58,7 +57,8 @@ class Step:
         """
         self._start(x_pos, y_pos)
 
-        sleep(self.delay)
+        assert self.renderer is not None
+        self.renderer.clock.sleep(self.delay)
 
         self._stop(y_pos)
 
@@ -67,8 +67,7 @@ class Step:
 
         # replace the previous status with whitespace
         if self.progress is not None:
-            assert isinstance(self.progress.text, Sized)
-            self.renderer.addtext(self.status_x, y_pos, len(self.progress.text) * " ")
+            self.renderer.addtext(self.status_x, y_pos, self.progress.width * " ")
         if self.finished is not None:
             self.finished.show(self.status_x, y_pos)
 
@@ -30,6 +30,7 @@ import curses
 from typing import Optional, Union, List
 
 from src.core.render import CursesRenderer
+from src.core.text_width import text_width
 
 
 class StyledText:
@@ -109,6 +110,18 @@ class StyledText:
             )
         return method
 
+    @property
+    def width(self) -> int:
+        """
+        Get the number of cells taken by the text on the screen.
+        """
+        if isinstance(self.text, str):
+            return text_width(self.text)
+        return sum(
+            text.width if isinstance(text, StyledText) else text_width(text)
+            for text in self.text
+        )
+
     def __len__(self) -> int:
         if self.method.startswith("List"):
             lens = [len(text) for text in self.text]
@@ -131,7 +144,7 @@ class StyledText:
             for text in self.text:
                 assert isinstance(text, str)
                 self.renderer.addtext(x_pos, y_pos, text, self.font)
-                x_pos += len(text)
+                x_pos += text_width(text)
 
         elif self.method == "List[StyledText]":
             assert isinstance(self.text, list)
@@ -139,7 +152,7 @@ class StyledText:
             for text in self.text:
                 assert isinstance(text, StyledText)
                 text.show(x_pos, y_pos)
-                x_pos += len(text)
+                x_pos += text.width
         else:
             raise NotImplementedError(
                 "Please try using one of the supported text types."
@@ -0,0 +1,193 @@
+"""
+This file contains the clocks used for every delay of the game: Clock, which uses the real time,
+and VirtualClock, which advances instantly, for scripted runs and tests. ScriptedInput is a
+VirtualClock that also presses the keys of a script.
+"""
+
+# ------------------------------------------------------------------------------
+#  This file is part of Universal Sandbox.
+#
+#  Copyright (C) © 2020 Khaïs COLIN <logistic-bot@protonmail.com>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+import logging
+import time
+from collections import deque
+from typing import Deque, Iterable, List, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class Clock:
+    """
+    The real time.
+
+    Every delay of the game goes through the clock of the renderer (CursesRenderer.clock), so
+    that it can be replaced with a VirtualClock.
+
+    waits is False for clocks whose timeouts do not wait. Code checking for something else while
+    waiting for a key press, in a loop of timeouts, should then check once and wait for the key
+    press without a timeout, since the loop would never end.
+    """
+
+    waits = True
+
+    def now(self) -> float:
+        """
+        Return the current time, in seconds. Only the difference between two times is
+        meaningful.
+        """
+        return time.monotonic()
+
+    def sleep(self, seconds: float) -> None:
+        """
+        Wait for <seconds> seconds.
+        """
+        time.sleep(seconds)
+
+    def timeout(self, seconds: float) -> float:
+        """
+        Return the number of seconds a wait of <seconds> seconds that is not done by the clock,
+        for example a curses timeout waiting for a key press, should really last.
+        """
+        return seconds
+
+
+class Wait(NamedTuple):
+    """
+    A wait recorded by a VirtualClock: it started at <start>, and lasted <seconds>.
+    """
+
+    start: float
+    seconds: float
+
+
+class VirtualClock(Clock):
+    """
+    A clock that never waits: sleeping advances its time instantly, and waits for key presses
+    time out immediately.
+
+    Every wait is recorded in timeline, so that the timing of a scripted run can be checked
+    after it finished.
+    """
+
+    waits = False
+
+    def __init__(self, start: float = 0) -> None:
+        self.time = start
+        self.timeline: List[Wait] = []
+
+    def now(self) -> float:
+        return self.time
+
+    def sleep(self, seconds: float) -> None:
+        self.timeline.append(Wait(self.time, seconds))
+        self.time += max(seconds, 0)
+
+    def timeout(self, seconds: float) -> float:
+        if seconds > 0:  # polling for keys already pressed is not a wait
+            self.sleep(seconds)
+        return 0
+
+    def advance(self, seconds: float) -> None:
+        """
+        Advance the time by <seconds> seconds, without recording a wait. For example, to
+        simulate time spent computing.
+        """
+        self.time += seconds
+
+    @property
+    def elapsed(self) -> float:
+        """
+        Return the total time spent waiting.
+        """
+        return sum(wait.seconds for wait in self.timeline)
+
+
+class ScriptEnded(EOFError):
+    """
+    Raised by ScriptedInput when a key is waited for after the last key of the script.
+    """
+
+
+class ScriptedInput(VirtualClock):
+    """
+    A VirtualClock that presses the keys of a script, to run the game without a player. Give it
+    as the clock of the renderer, and its read_char() to the renderer to read the keys from.
+
+    The script is a list of (delay, keys): <keys> are typed at once, <delay> seconds after the
+    keys before them were read. A wait for a key press ends when the next keys are typed, and
+    waiting for a key press without a timeout advances the time until then. Once every key was
+    read, waiting for a key press without a timeout raises ScriptEnded.
+    """
+
+    def __init__(self, script: Iterable[Tuple[float, str]], start: float = 0) -> None:
+        super().__init__(start)
+        self.script: Deque[Tuple[float, str]] = deque(script)
+        self.typed: Deque[str] = deque()
+        # the time at which the next keys of the script are typed
+        self.due: Optional[float] = None
+        self._schedule()
+
+    def _schedule(self) -> None:
+        if self.script:
+            self.due = self.time + self.script[0][0]
+        else:
+            self.due = None
+
+    def _type(self) -> None:
+        """
+        Type the next keys of the script, if they are due.
+        """
+        if not self.typed and self.due is not None and self.due <= self.time:
+            self.typed.extend(self.script.popleft()[1])
+
+    def _wait_for_keys(self) -> None:
+        """
+        Wait until the next keys of the script are typed, and type them.
+        """
+        assert self.due is not None
+        if self.due > self.time:
+            self.timeline.append(Wait(self.time, self.due - self.time))
+            self.time = self.due  # exactly, so that the keys are due
+        self._type()
+
+    def timeout(self, seconds: float) -> float:
+        if self.typed:
+            return 0  # a key is already pressed
+        if self.due is not None and self.due - self.time <= seconds:
+            self._wait_for_keys()
+            return 0
+        return super().timeout(seconds)
+
+    def read_char(self, timeout: Optional[float]) -> Optional[str]:
+        """
+        Return the next typed character, like CursesRenderer.read_char(). The timeout was
+        already waited by timeout(), so the character is only waited for if <timeout> is None.
+
+        :raise ScriptEnded: if there is no character left to wait for
+        """
+        self._type()
+        if not self.typed and timeout is None:
+            if self.due is None:
+                raise ScriptEnded("Every key of the script was read")
+            self._wait_for_keys()
+        if not self.typed:
+            return None
+
+        char = self.typed.popleft()
+        if not self.typed:
+            self._schedule()
+        return char
@@ -22,27 +22,110 @@ Game engine
 
 
 import logging
-from typing import Optional
+from collections import deque
+from typing import Deque, List, NamedTuple, Optional, Type
 
 from src.core import render
+from src.core.clock import Clock
+from src.core.input_decoder import ReadChar
+from src.core.prefetch import PREFETCHER, Prefetcher
 from src.core.scene import Scene
 from src.core.state import game_state
+from src.core.state.snapshot import StateSnapshot
 from src.scenes.startup import StartupScene
 
 logger = logging.getLogger(__name__)
 
+# How many checkpoints are kept. Older checkpoints are forgotten.
+MAX_CHECKPOINTS = 64
+
+# How many scenes away from the current scene the resources are prefetched.
+PREFETCH_DEPTH = 2
+
+
+class Checkpoint(NamedTuple):
+    """
+    A snapshot of the game state taken when the game entered a scene.
+    """
+
+    scene: str
+    state: game_state.GameState
+    snapshot: StateSnapshot
+
 
 class Engine:  # pylint: disable=R0903
     """
     Game engine
+
+    Every delay of the game uses <clock>, the real time by default. A
+    VirtualClock can be given to run the game without waiting.
+
+    Keys are read from the terminal, or from <read_char> if it is given. To
+    run the game without a player, give a ScriptedInput as clock, and its
+    read_char(): the game ends when every key of the script was read.
     """
 
-    def __init__(self) -> None:
-        self.renderer = render.CursesRenderer()
+    def __init__(
+        self, clock: Optional[Clock] = None, read_char: Optional[ReadChar] = None
+    ) -> None:
+        self.renderer = render.CursesRenderer(clock=clock, read_char=read_char)
         self.game_state = game_state.GameState()
+        self.checkpoints: Deque[Checkpoint] = deque(maxlen=MAX_CHECKPOINTS)
+        self.prefetcher: Prefetcher = PREFETCHER
 
         logger.info("Created game engine.")
 
+    def checkpoint(self, scene: Scene) -> None:
+        """
+        Take a snapshot of the state of <scene>, before it starts.
+
+        See GameState.snapshot(): each checkpoint only copies what changed
+        since the previous checkpoint of the same state.
+        """
+        name = type(scene).__name__
+        logger.info("Checkpoint before scene %s", name)
+        self.checkpoints.append(Checkpoint(name, scene.state, scene.state.snapshot()))
+
+    def rollback(self, checkpoint: Checkpoint) -> None:
+        """
+        Restore the state saved in <checkpoint>.
+        """
+        logger.info("Rolling back to checkpoint before scene %s", checkpoint.scene)
+        checkpoint.state.restore(checkpoint.snapshot)
+
+    def prefetch(self, scene: Scene) -> None:
+        """
+        Start loading the resources of the scenes that can follow <scene>, and
+        of the scenes that can follow them, up to PREFETCH_DEPTH scenes away, so
+        that they are ready when they are needed.
+
+        The resources that neither <scene> nor these scenes need are forgotten,
+        so that they are not used once out of date.
+        """
+        scenes: List[Type[Scene]] = []
+        following = list(scene.next_scenes())
+        for _ in range(PREFETCH_DEPTH):
+            following = [
+                next_scene for next_scene in following if next_scene not in scenes
+            ]
+            scenes.extend(following)
+            following = [
+                next_scene
+                for previous_scene in following
+                for next_scene in previous_scene.next_scenes()
+            ]
+
+        resources = [
+            resource
+            for next_scene in scenes
+            for resource in next_scene.resources(self.renderer)
+        ]
+        # the resources of <scene> were prefetched by the previous scene
+        needed = {resource.name for resource in scene.resources(self.renderer)}
+        needed.update(resource.name for resource in resources)
+        self.prefetcher.retain(needed)
+        self.prefetcher.prefetch(resources)
+
     # noinspection PyBroadException
     def start(self) -> None:
         """
@@ -60,10 +143,14 @@ class Engine:  # pylint: disable=R0903
             while current_scene is not None:
                 logger.info("Current scene: %s", current_scene)
 
+                self.checkpoint(current_scene)
+                self.prefetch(current_scene)
                 current_scene = current_scene.start()
 
         except KeyboardInterrupt:
             logger.critical("KeyboardInterrupt", exc_info=True)
+        except EOFError:
+            logger.info("The input ended")
         except:  # noqa: E722 pylint: disable=W0702
             logger.critical("An exception occurred.", exc_info=True)
 
@@ -71,4 +158,5 @@ class Engine:  # pylint: disable=R0903
             logger.info("Tearing down curses, and exiting game")
 
             self.renderer.tear_down()
+            self.prefetcher.shutdown()
             print("The game exited.")
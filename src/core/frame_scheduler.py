@@ -0,0 +1,87 @@
+"""
+This file contains the FrameScheduler class, which reveals a drawing progressively, refreshing the
+screen once per frame.
+"""
+
+# ------------------------------------------------------------------------------
+#  This file is part of Universal Sandbox.
+#
+#  Copyright (C) © 2020 Khaïs COLIN <logistic-bot@protonmail.com>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+import logging
+from typing import Any, Callable, Sequence
+
+from src.core.render import CursesRenderer
+
+logger = logging.getLogger(__name__)
+
+# Number of seconds between two frames.
+FRAME_DURATION = 1 / 60
+
+DrawStep = Callable[[], Any]
+
+
+class FrameScheduler:
+    """
+    Runs drawing steps (for example calls to CursesRenderer.fill() or blit()) spread over a
+    duration, instead of sleeping after each of them.
+
+    Each frame runs the steps that are due, refreshes the screen once, and waits for the next
+    frame. The steps that are due depend on the time elapsed since the start, so the duration
+    does not depend on how long drawing takes. The time is read from the clock of the renderer.
+    Like FullScreenScene.sleep_key(), pressing a key skips the animation: the remaining steps
+    are all run in a single last frame.
+    """
+
+    def __init__(
+        self, renderer: CursesRenderer, frame_duration: float = FRAME_DURATION
+    ) -> None:
+        self.renderer = renderer
+        self.frame_duration = frame_duration
+
+    def reveal(self, steps: Sequence[DrawStep], duration: float) -> bool:
+        """
+        Run <steps> in order, spread evenly over <duration> seconds.
+
+        :return: True if the steps were revealed until the end, False if a key was pressed
+        """
+        start = self.renderer.clock.now()
+        done = 0
+        frames = 0
+        skipped = False
+        while done < len(steps):
+            frame_start = self.renderer.clock.now()
+            if skipped or duration <= 0:
+                due = len(steps)
+            else:
+                progress = (frame_start - start) / duration
+                due = min(int(len(steps) * progress) + 1, len(steps))
+
+            for step in steps[done:due]:
+                step()
+            done = due
+            self.renderer.refresh()
+            frames += 1
+
+            if done < len(steps):
+                spent = self.renderer.clock.now() - frame_start
+                delay = max(self.frame_duration - spent, 0)
+                if self.renderer.wait_keypress_delay(delay) is not None:
+                    logger.debug("Skipped the remaining %s steps", len(steps) - done)
+                    skipped = True
+
+        logger.debug("Revealed %s steps in %s frames", len(steps), frames)
+        return not skipped
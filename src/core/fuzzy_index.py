@@ -0,0 +1,196 @@
+"""
+This file contains the FuzzyIndex class, an incrementally updated search index used to filter
+lists of names as the user types.
+"""
+
+# ------------------------------------------------------------------------------
+#  This file is part of Universal Sandbox.
+#
+#  Copyright (C) © 2020 Khaïs COLIN <logistic-bot@protonmail.com>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+import logging
+from collections import Counter
+from typing import Dict, Generic, Hashable, List, Set, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+Key = TypeVar("Key", bound=Hashable)
+
+# Matches that only share trigrams with the query need to share at least this fraction of the
+# query's trigrams to be returned.
+MIN_TRIGRAM_SIMILARITY = 0.5
+
+
+def fold(text: str) -> str:
+    """
+    Return the normalized form of <text> that is indexed and searched.
+    """
+    return text.casefold()
+
+
+def trigrams(text: str) -> Set[str]:
+    """
+    Return the set of all 3-character substrings of <text>.
+    """
+    return {text[index:index + 3] for index in range(len(text) - 2)}
+
+
+class _TrieNode(Generic[Key]):
+    """
+    A node of the prefix trie of FuzzyIndex. keys contains every key that has a word starting
+    with the prefix leading to this node.
+    """
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_TrieNode[Key]"] = {}
+        self.keys: Set[Key] = set()
+
+
+class FuzzyIndex(Generic[Key]):
+    """
+    A search index mapping keys to texts.
+
+    Texts are indexed once, when they are added, in two structures:
+     - a prefix trie of the whole text and of each of its words, used for
+       short queries and to rank prefix matches first
+     - trigram postings (trigram -> keys), used for substring and typo tolerant
+       matches
+
+    Texts can be added, updated and removed at any time, without rebuilding the
+    index. Searching does not look at the texts that do not match.
+    """
+
+    def __init__(self) -> None:
+        self._texts: Dict[Key, str] = {}
+        self._trie: _TrieNode[Key] = _TrieNode()
+        self._postings: Dict[str, Set[Key]] = {}
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._texts
+
+    def add(self, key: Key, text: str) -> None:
+        """
+        Index <text> under <key>. If <key> is already indexed, its text is
+        replaced.
+        """
+        if key in self._texts:
+            self.remove(key)
+
+        folded = fold(text)
+        self._texts[key] = folded
+
+        for word in self._words(folded):
+            node = self._trie
+            node.keys.add(key)
+            for char in word:
+                node = node.children.setdefault(char, _TrieNode())
+                node.keys.add(key)
+
+        for trigram in trigrams(folded):
+            self._postings.setdefault(trigram, set()).add(key)
+
+    def update(self, key: Key, text: str) -> None:
+        """
+        Replace the text indexed under <key>.
+        """
+        self.add(key, text)
+
+    def remove(self, key: Key) -> None:
+        """
+        Remove <key> from the index. Does nothing if it is not indexed.
+        """
+        folded = self._texts.pop(key, None)
+        if folded is None:
+            return
+
+        self._remove_words(self._words(folded), key)
+
+        for trigram in trigrams(folded):
+            keys = self._postings[trigram]
+            keys.discard(key)
+            if not keys:
+                del self._postings[trigram]
+
+    def search(self, query: str) -> List[Key]:
+        """
+        Return the keys matching <query>, best matches first.
+
+        Texts starting with the query come first, then texts with a word
+        starting with the query, then texts sharing enough trigrams with the
+        query. Ties are ordered alphabetically.
+        """
+        folded = fold(query)
+        if not folded:
+            return sorted(self._texts, key=self._texts.__getitem__)
+
+        scores: Dict[Key, Tuple[int, float]] = {}
+        for key in self._prefix_matches(folded):
+            rank = 2 if self._texts[key].startswith(folded) else 1
+            scores[key] = (rank, 1.0)
+
+        query_trigrams = trigrams(folded)
+        if query_trigrams:
+            counts: Counter[Key] = Counter()
+            for trigram in query_trigrams:
+                counts.update(self._postings.get(trigram, ()))
+            for key, count in counts.items():
+                similarity = count / len(query_trigrams)
+                if key not in scores and similarity >= MIN_TRIGRAM_SIMILARITY:
+                    scores[key] = (0, similarity)
+
+        return sorted(
+            scores,
+            key=lambda key: (-scores[key][0], -scores[key][1], self._texts[key]),
+        )
+
+    def _prefix_matches(self, prefix: str) -> Set[Key]:
+        node = self._trie
+        for char in prefix:
+            child = node.children.get(char)
+            if child is None:
+                return set()
+            node = child
+        return node.keys
+
+    def _remove_words(self, words: Set[str], key: Key) -> None:
+        for word in words:
+            node = self._trie
+            node.keys.discard(key)
+            for char in word:
+                node = node.children[char]
+                node.keys.discard(key)
+
+        # A node only contains keys that are also in its parent, so a node without keys can be
+        # pruned with all its children.
+        for word in words:
+            node = self._trie
+            for char in word:
+                child = node.children.get(char)
+                if child is None:
+                    break
+                if not child.keys:
+                    del node.children[char]
+                    break
+                node = child
+
+    @staticmethod
+    def _words(folded: str) -> Set[str]:
+        words = set(folded.split())
+        words.add(folded)
+        return words
@@ -0,0 +1,280 @@
+"""
+This file contains the InputDecoder class, which turns the characters read from the terminal into
+normalised key events, decoding the escape sequences of function and arrow keys itself.
+"""
+
+# ------------------------------------------------------------------------------
+#  This file is part of Universal Sandbox.
+#
+#  Copyright (C) © 2020 Khaïs COLIN <logistic-bot@protonmail.com>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+import curses
+import logging
+from collections import deque
+from typing import Callable, Deque, Dict, Mapping, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+# Number of seconds to wait for the next character of an escape sequence. Terminals send a whole
+# sequence at once, so this only needs to cover the latency of the connection. A bare Escape
+# key press is reported after this delay.
+ESCAPE_TIMEOUT = 0.025
+
+ESCAPE = "\x1b"
+# Control Sequence Introducer, which starts most escape sequences.
+CSI = ESCAPE + "["
+ENTER = "\n"
+BACKSPACE = "KEY_BACKSPACE"
+
+# Prefix of the name of keys pressed with Alt, as in curses.keyname().
+ALT_PREFIX = "M-"
+
+# The keys sent in several ways by different terminals, and the name they are reported as.
+NORMALISED_KEYS = {
+    "\r": ENTER,
+    "KEY_ENTER": ENTER,
+    "\x7f": BACKSPACE,
+    "\b": BACKSPACE,
+}
+
+# The terminfo capabilities of the keys that are decoded, and the curses name of each key.
+TERMINFO_KEYS = {
+    "kcuu1": "KEY_UP",
+    "kcud1": "KEY_DOWN",
+    "kcub1": "KEY_LEFT",
+    "kcuf1": "KEY_RIGHT",
+    "khome": "KEY_HOME",
+    "kend": "KEY_END",
+    "kpp": "KEY_PPAGE",
+    "knp": "KEY_NPAGE",
+    "kich1": "KEY_IC",
+    "kdch1": "KEY_DC",
+    "kcbt": "KEY_BTAB",
+    "kbs": BACKSPACE,
+    "kent": ENTER,
+    **{f"kf{number}": f"KEY_F({number})" for number in range(1, 13)},
+}
+
+# The sequences sent by most terminals, for the keys missing from the terminfo entry. Arrow keys
+# are sent with CSI or SS3 depending on the cursor key mode of the terminal.
+DEFAULT_SEQUENCES = {
+    **{
+        f"\x1b{introducer}{final}": name
+        for introducer in "[O"
+        for final, name in (
+            ("A", "KEY_UP"),
+            ("B", "KEY_DOWN"),
+            ("C", "KEY_RIGHT"),
+            ("D", "KEY_LEFT"),
+            ("H", "KEY_HOME"),
+            ("F", "KEY_END"),
+        )
+    },
+    "\x1b[1~": "KEY_HOME",
+    "\x1b[2~": "KEY_IC",
+    "\x1b[3~": "KEY_DC",
+    "\x1b[4~": "KEY_END",
+    "\x1b[5~": "KEY_PPAGE",
+    "\x1b[6~": "KEY_NPAGE",
+    "\x1b[Z": "KEY_BTAB",
+    "\x1bOP": "KEY_F(1)",
+    "\x1bOQ": "KEY_F(2)",
+    "\x1bOR": "KEY_F(3)",
+    "\x1bOS": "KEY_F(4)",
+}
+
+# Reads a character, waiting at most the given number of seconds, or forever if it is None.
+# Returns None if no character was read before the timeout.
+ReadChar = Callable[[Optional[float]], Optional[str]]
+
+
+def normalise_key(key: str) -> str:
+    """
+    Return the name <key> is reported as.
+    """
+    return NORMALISED_KEYS.get(key, key)
+
+
+def key_repr(name: str) -> str:
+    """
+    Return a readable representation of the key named <name>, for example to show it on the
+    screen.
+    """
+    if name == ENTER:
+        return "KEY_ENTER"
+    if name == " ":
+        return "KEY_SPACE"
+    if name == ESCAPE:
+        return "KEY_ESCAPE"
+    if name.startswith(ALT_PREFIX):
+        return ALT_PREFIX + key_repr(name[len(ALT_PREFIX):])
+    return name
+
+
+class KeyEvent(NamedTuple):
+    """
+    A key press. key is a single character or a curses key name (for example "KEY_UP"),
+    normalised with normalise_key().
+    """
+
+    key: str
+    alt: bool = False
+
+    @property
+    def name(self) -> str:
+        """
+        Return the name of the key, with ALT_PREFIX if Alt was held.
+        """
+        return ALT_PREFIX + self.key if self.alt else self.key
+
+
+class SequenceTrie:
+    """
+    A trie of escape sequences. Each node is reached by the characters of a prefix of a
+    sequence, and a node ending a sequence holds the name of its key.
+    """
+
+    def __init__(self) -> None:
+        self.children: Dict[str, SequenceTrie] = {}
+        self.key: Optional[str] = None
+
+    def insert(self, sequence: str, key: str) -> None:
+        """
+        Decode <sequence> as <key>.
+        """
+        node = self
+        for char in sequence:
+            node = node.children.setdefault(char, SequenceTrie())
+        node.key = key
+
+    @classmethod
+    def from_sequences(cls, sequences: Mapping[str, str]) -> "SequenceTrie":
+        """
+        Return a trie decoding each sequence of <sequences> as the key it is mapped to.
+        """
+        trie = cls()
+        for sequence, key in sequences.items():
+            trie.insert(sequence, key)
+        return trie
+
+
+def terminfo_sequences() -> Dict[str, str]:
+    """
+    Return the escape sequences of the current terminal, mapped to the name of their key. The
+    keys missing from the terminfo entry use DEFAULT_SEQUENCES.
+
+    curses.setupterm() or curses.initscr() must have been called.
+    """
+    sequences = dict(DEFAULT_SEQUENCES)
+    for capability, key in TERMINFO_KEYS.items():
+        try:
+            sequence = curses.tigetstr(capability)
+        except curses.error:
+            sequence = None
+        if sequence:
+            sequences[sequence.decode("latin-1")] = key
+
+    logger.debug("Loaded %s key sequences", len(sequences))
+    return sequences
+
+
+class InputDecoder:
+    """
+    Decodes the characters returned by <read_char> into KeyEvents.
+
+    Escape sequences are matched against a SequenceTrie, one character at a time, so that a
+    sequence is decoded as soon as its last character arrives. After an Escape, the next
+    character is only waited for <escape_timeout> seconds: if none arrives, the Escape key
+    itself was pressed. An Escape followed by a character that does not start a sequence is
+    that character pressed with Alt. A sequence that is not in the trie is reported as a key
+    named after the whole sequence, so that it is ignored instead of being typed.
+    """
+
+    def __init__(
+        self,
+        read_char: ReadChar,
+        sequences: Mapping[str, str] = DEFAULT_SEQUENCES,
+        escape_timeout: float = ESCAPE_TIMEOUT,
+    ) -> None:
+        self.read_char = read_char
+        self.trie = SequenceTrie.from_sequences(sequences)
+        self.escape_timeout = escape_timeout
+        self.pending_chars: Deque[str] = deque()
+
+    def _read(self, timeout: Optional[float]) -> Optional[str]:
+        if self.pending_chars:
+            return self.pending_chars.popleft()
+        return self.read_char(timeout)
+
+    def read_key(self, timeout: Optional[float] = None) -> Optional[KeyEvent]:
+        """
+        Wait at most <timeout> seconds, or forever if it is None, for a key press, and return it.
+        Return None if no key was pressed before the timeout.
+        """
+        char = self._read(timeout)
+        if char is None:
+            return None
+
+        node = self.trie.children.get(char)
+        if node is None or not node.children:
+            # a character, or a single character sequence
+            key = node.key if node is not None and node.key is not None else char
+            return KeyEvent(normalise_key(key))
+
+        sequence = char
+        while node.children:
+            char = self._read(self.escape_timeout)
+            if char is None:
+                break  # the sequence was cut short
+            child = node.children.get(char)
+            if child is None:
+                if sequence == ESCAPE and char != ESCAPE:
+                    # Escape followed by a key that does not start a sequence
+                    return KeyEvent(normalise_key(char), alt=True)
+                if sequence.startswith(CSI):
+                    return self._unknown(self._read_control_sequence(sequence + char))
+                self.pending_chars.appendleft(char)
+                break
+            sequence += char
+            node = child
+
+        if node.key is not None:
+            return KeyEvent(normalise_key(node.key))
+        if sequence == ESCAPE:
+            return KeyEvent(ESCAPE)
+        if len(sequence) == 2 and sequence[0] == ESCAPE:
+            # Alt with a key that starts a sequence, for example Alt+[
+            return KeyEvent(normalise_key(sequence[1]), alt=True)
+
+        return self._unknown(sequence)
+
+    def _read_control_sequence(self, sequence: str) -> str:
+        """
+        Read the rest of the control sequence starting with <sequence>, up to its final
+        character, and return the whole sequence.
+        """
+        # parameter and intermediate characters are in 0x20-0x3F, the final character is not
+        while " " <= sequence[-1] <= "?":
+            char = self._read(self.escape_timeout)
+            if char is None:
+                break
+            sequence += char
+        return sequence
+
+    @staticmethod
+    def _unknown(sequence: str) -> KeyEvent:
+        logger.debug("Unknown key sequence: %r", sequence)
+        return KeyEvent(sequence)
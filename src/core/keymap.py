@@ -0,0 +1,120 @@
+"""
+This file contains the Keymap class, a table mapping keys to the actions they trigger.
+"""
+
+# ------------------------------------------------------------------------------
+#  This file is part of Universal Sandbox.
+#
+#  Copyright (C) © 2020 Khaïs COLIN <logistic-bot@protonmail.com>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+import logging
+from typing import Any, Callable, Dict, Iterable, NamedTuple, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+Action = Callable[[], Any]
+Fallback = Callable[[str], Any]
+
+NAVIGATION_KEYS = ("KEY_UP", "KEY_DOWN", "KEY_LEFT", "KEY_RIGHT")
+
+
+class Binding(NamedTuple):
+    """
+    The action bound to a key.
+
+    If repeatable is True, the action only moves something on the screen, so
+    that several queued presses of the key can be handled before drawing the
+    screen again.
+    """
+
+    action: Action
+    repeatable: bool
+
+
+class Keymap:
+    """
+    A table of key bindings.
+
+    Looking up a key is a dictionary lookup. Keys that are not bound are
+    looked up in the parent keymap, if there is one, and then given to the
+    fallback, if there is one.
+    """
+
+    def __init__(
+        self, parent: Optional["Keymap"] = None, fallback: Optional[Fallback] = None
+    ) -> None:
+        self.parent = parent
+        self.fallback = fallback
+        self.bindings: Dict[str, Binding] = {}
+
+    def bind(
+        self, keys: Union[str, Iterable[str]], action: Action, repeatable: bool = False
+    ) -> None:
+        """
+        Bind <action> to <keys>, a key or an iterable of keys. See Binding for
+        the meaning of <repeatable>.
+        """
+        if isinstance(keys, str):
+            keys = (keys,)
+        for key in keys:
+            self.bindings[key] = Binding(action, repeatable)
+
+    def unbind(self, key: str) -> None:
+        """
+        Remove the binding of <key>. Does nothing if it is not bound.
+        """
+        self.bindings.pop(key, None)
+
+    def lookup(self, key: str) -> Optional[Binding]:
+        """
+        Return the binding of <key> in this keymap or its parents, or None.
+        """
+        keymap: Optional[Keymap] = self
+        while keymap is not None:
+            binding = keymap.bindings.get(key)
+            if binding is not None:
+                return binding
+            keymap = keymap.parent
+        return None
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self.lookup(key) is not None
+
+    def is_repeatable(self, key: str) -> bool:
+        """
+        Return True if <key> is bound to a repeatable action.
+        """
+        binding = self.lookup(key)
+        return binding is not None and binding.repeatable
+
+    def dispatch(self, key: str) -> Any:
+        """
+        Run the action bound to <key>, or the fallback, and return its result.
+        Return None if the key is not handled.
+        """
+        binding = self.lookup(key)
+        if binding is not None:
+            logger.debug("Dispatching key '%s' to %s", key, binding.action)
+            return binding.action()
+
+        keymap: Optional[Keymap] = self
+        while keymap is not None:
+            if keymap.fallback is not None:
+                return keymap.fallback(key)
+            keymap = keymap.parent
+
+        logger.debug("Key '%s' is not bound", key)
+        return None
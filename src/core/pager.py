@@ -0,0 +1,134 @@
+"""
+This file contains the Pager class, which splits a long text into pages that fit on the screen.
+"""
+
+# ------------------------------------------------------------------------------
+#  This file is part of Universal Sandbox.
+#
+#  Copyright (C) © 2020 Khaïs COLIN <logistic-bot@protonmail.com>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+import logging
+from typing import Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Number of lines of a page shown again at the top of the next page.
+PAGE_OVERLAP = 0
+
+
+class Pager:
+    """
+    Splits a text into pages of <height> lines, and keeps track of the current page.
+
+    The text is split into lines once. The page index (the first line of each page) is built
+    once per page height, and is a range, so it takes constant memory. Showing a page, going to
+    the next or previous page, or jumping to any page only slices the lines of that page.
+
+    When the height changes, for example because the terminal was resized, call set_height():
+    the index is built again, and the current page becomes the one showing the first line of
+    the previous current page.
+    """
+
+    def __init__(self, text: str, height: int, overlap: int = PAGE_OVERLAP) -> None:
+        self.lines: List[str] = text.splitlines()
+        self.overlap = overlap
+        self.height = height
+        self.page_starts = self.build_index(height)
+        self.page_number = 0
+
+        logger.debug(
+            "Created Pager with %s lines, %s pages", len(self.lines), self.page_count
+        )
+
+    def build_index(self, height: int) -> range:
+        """
+        Return the first line of each page, for pages of <height> lines.
+        """
+        assert height > self.overlap, "The pages must be taller than their overlap"
+        step = height - self.overlap
+        # the last page starts before the last line that is not only shown as overlap
+        return range(0, max(len(self.lines) - self.overlap, 1), step)
+
+    def set_height(self, height: int) -> None:
+        """
+        Use pages of <height> lines from now on.
+        """
+        if height == self.height:
+            return
+
+        first_line = self.page_starts[self.page_number]
+        self.height = height
+        self.page_starts = self.build_index(height)
+        self.page_number = min(
+            first_line // self.page_starts.step, self.page_count - 1
+        )
+        logger.debug("Pager height set to %s, now on page %s", height, self.page_number)
+
+    @property
+    def page_count(self) -> int:
+        """
+        Return the number of pages.
+        """
+        return len(self.page_starts)
+
+    def page(self, number: Optional[int] = None) -> List[str]:
+        """
+        Return the lines of page <number>, or of the current page if it is None.
+        """
+        if number is None:
+            number = self.page_number
+        start = self.page_starts[number]  # raises IndexError for missing pages
+        return self.lines[start:start + self.height]
+
+    def go_to(self, number: int) -> None:
+        """
+        Make page <number> the current page. Negative numbers count from the last page, like
+        list indices.
+        """
+        if not -self.page_count <= number < self.page_count:
+            raise IndexError(f"There is no page {number}, there are {self.page_count}")
+        self.page_number = number % self.page_count
+
+    def next_page(self) -> bool:
+        """
+        Go to the next page. Return False if the current page is the last one.
+        """
+        if self.page_number + 1 >= self.page_count:
+            return False
+        self.page_number += 1
+        return True
+
+    def previous_page(self) -> bool:
+        """
+        Go to the previous page. Return False if the current page is the first one.
+        """
+        if self.page_number == 0:
+            return False
+        self.page_number -= 1
+        return True
+
+    def pages(self) -> Iterator[List[str]]:
+        """
+        Yield the lines of the current page, and then of each following page, going to the next
+        page every time.
+
+        Only one page is built at a time, and the height of the pages can be changed between
+        them.
+        """
+        while True:
+            yield self.page()
+            if not self.next_page():
+                return
@@ -0,0 +1,152 @@
+"""
+This file contains the Prefetcher class, which loads the resources of the next scenes (saves,
+animations, ...) in a worker thread while the current scene runs.
+"""
+
+# ------------------------------------------------------------------------------
+#  This file is part of Universal Sandbox.
+#
+#  Copyright (C) © 2020 Khaïs COLIN <logistic-bot@protonmail.com>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+from typing import Any, Callable, Collection, Dict, Iterable, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+# Number of worker threads loading resources.
+PREFETCH_WORKERS = 1
+
+
+class Resource(NamedTuple):
+    """
+    Something a scene needs, and that takes time to get: <load> is called without arguments
+    and returns it. Resources with the same <name> are the same resource.
+
+    If the resource can change, <version> is called without arguments and returns a value that
+    changes with it, so that a prefetched copy that is out of date is loaded again.
+
+    load must not use curses, since it can be called in a worker thread.
+    """
+
+    name: str
+    load: Callable[[], Any]
+    version: Optional[Callable[[], Any]] = None
+
+
+class _Prefetch(NamedTuple):
+    # the version of the resource when it started loading, see Resource.version
+    future: "Future[Any]"
+    version: Any
+
+
+class Prefetcher:
+    """
+    Loads resources in worker threads before they are needed.
+
+    The engine calls prefetch() with the resources of the scenes that can follow the current
+    scene (see Scene.next_scenes()), and the scenes call take() when they need a resource.
+    take() returns the prefetched resource, waiting for it if it is still being loaded, or
+    loads it in the calling thread if it was not prefetched or its loading failed.
+
+    A prefetched resource is given to a single take(): the next take() of the same resource
+    loads it again, so that a resource that can change, like the saves, is not reused. It is
+    also loaded again if its version changed since it was prefetched, and retain() forgets the
+    resources that are not needed anymore.
+
+    The worker threads are only started by the first prefetch(), and are stopped by shutdown().
+    """
+
+    def __init__(self, workers: int = PREFETCH_WORKERS) -> None:
+        self.workers = workers
+        self.executor: Optional[ThreadPoolExecutor] = None
+        self.futures: Dict[str, _Prefetch] = {}
+        self.lock = Lock()
+
+    def prefetch(self, resources: Iterable[Resource]) -> None:
+        """
+        Start loading <resources> in the background. Resources that are already loaded or being
+        loaded are skipped.
+        """
+        with self.lock:
+            for resource in resources:
+                if resource.name in self.futures:
+                    continue
+                if self.executor is None:
+                    self.executor = ThreadPoolExecutor(
+                        self.workers, thread_name_prefix="prefetch"
+                    )
+                logger.debug("Prefetching resource '%s'", resource.name)
+                version = resource.version() if resource.version is not None else None
+                self.futures[resource.name] = _Prefetch(
+                    self.executor.submit(resource.load), version
+                )
+
+    def retain(self, names: Collection[str]) -> None:
+        """
+        Forget the resources that are not named in <names>, and cancel their loading if it did
+        not start yet.
+        """
+        with self.lock:
+            for name in [name for name in self.futures if name not in names]:
+                logger.debug("Forgetting resource '%s'", name)
+                self.futures.pop(name).future.cancel()
+
+    def take(self, resource: Resource) -> Any:
+        """
+        Return <resource>, prefetched if possible.
+        """
+        with self.lock:
+            prefetch = self.futures.pop(resource.name, None)
+
+        if prefetch is not None and resource.version is not None:
+            if resource.version() != prefetch.version:
+                logger.debug("Resource '%s' changed since it was prefetched", resource.name)
+                prefetch.future.cancel()
+                prefetch = None
+
+        if prefetch is not None and not prefetch.future.cancelled():
+            future = prefetch.future
+            if not future.done():
+                logger.debug("Waiting for resource '%s'", resource.name)
+            try:
+                return future.result()
+            except Exception:  # pylint: disable=W0703
+                logger.warning(
+                    "Could not prefetch resource '%s'", resource.name, exc_info=True
+                )
+
+        logger.debug("Loading resource '%s'", resource.name)
+        return resource.load()
+
+    def shutdown(self) -> None:
+        """
+        Forget the resources that were not taken, and stop the worker threads once the
+        resources being loaded are loaded. The prefetcher can still be used: the next
+        prefetch() starts new worker threads.
+        """
+        with self.lock:
+            for prefetch in self.futures.values():
+                prefetch.future.cancel()
+            self.futures.clear()
+            executor, self.executor = self.executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+# The prefetcher used by the engine and the scenes. It starts no thread until it is used.
+PREFETCHER = Prefetcher()
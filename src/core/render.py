@@ -23,9 +23,19 @@ This is where the rendering happens.
 
 import curses
 import logging
-from curses import textpad
-from time import sleep
-from typing import Any, Optional
+from collections import deque
+from typing import Any, Deque, Optional
+
+from src.core.clock import Clock
+from src.core.input_decoder import (
+    ESCAPE_TIMEOUT,
+    InputDecoder,
+    KeyEvent,
+    ReadChar,
+    key_repr,
+    terminfo_sequences,
+)
+from src.core.text_width import pad, skip_cells, text_width, truncate
 
 logger = logging.getLogger(__name__)
 # logger.level = logging.INFO  # comment out this line if you are trying to debug this
@@ -34,19 +44,46 @@ logger = logging.getLogger(__name__)
 class CursesRenderer:
     """
     A renderer using the curses library
+
+    Keys given back with unget_key() are returned by the next calls to
+    get_key() and get_key_timeout(), before the keys pressed afterwards.
+
+    Keys are decoded by an InputDecoder instead of curses, so that a bare
+    Escape is reported after <escape_timeout> seconds instead of ESCDELAY.
+
+    Every delay of the game uses <clock>, the real time by default.
+
+    Keys are read from the terminal, or from <read_char> if it is given, for
+    example the read_char() of a ScriptedInput.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        escape_timeout: float = ESCAPE_TIMEOUT,
+        clock: Optional[Clock] = None,
+        read_char: Optional[ReadChar] = None,
+    ) -> None:
         logger.debug("Crate CursesRenderer and init curses")
         self.stdscr: Any = curses.initscr()  # pylint: disable=E1101
 
         self.debug = False
+        self.clock = clock if clock is not None else Clock()
+        self.pending_keys: Deque[str] = deque()
+        # the pad copy() goes through, see _scratch_pad()
+        self.scratch: Any = None
 
         curses.noecho()
         curses.cbreak()
         curses.curs_set(0)
         curses.start_color()
-        self.stdscr.keypad(True)
+        # escape sequences are decoded by self.input_decoder
+        self.stdscr.keypad(False)
+
+        self.input_decoder = InputDecoder(
+            read_char if read_char is not None else self.read_char,
+            terminfo_sequences(),
+            escape_timeout,
+        )
 
         self.stdscr.box()
 
@@ -80,46 +117,91 @@ class CursesRenderer:
         """
         Wait for a key to be pressed, and return a string representing it.
         """
-        key: str = self.stdscr.getkey()
+        if self.pending_keys:
+            return self.pending_keys.popleft()
 
-        logger.debug("Got key: %s", key)
+        event = self.input_decoder.read_key()
+        assert event is not None, "read_key() can not time out without a timeout"
 
-        return key
+        logger.debug("Got key: %s", event)
+
+        return event.name
+
+    def get_key_timeout(self, delay: float) -> Optional[str]:
+        """
+        Wait for a key to be pressed for at most <delay> seconds, and return a
+        string representing it, or None if no key was pressed.
+
+        With a delay of 0, only return a key that was already pressed.
+        """
+        if self.pending_keys:
+            return self.pending_keys.popleft()
+
+        event: Optional[KeyEvent] = self.input_decoder.read_key(
+            self.clock.timeout(delay)
+        )
+
+        logger.debug("Got key: %s", event)
+
+        return event.name if event is not None else None
+
+    def read_char(self, timeout: Optional[float]) -> Optional[str]:
+        """
+        Wait at most <timeout> seconds, or forever if it is None, for a
+        character, and return it. Return None if no character was read.
+
+        Keys that curses reports as a number, like KEY_RESIZE, are returned by
+        name.
+        """
+        if timeout is not None:
+            self.stdscr.timeout(round(timeout * 1000))
+        try:
+            char = self.stdscr.get_wch()
+        except curses.error:  # nothing was read before the timeout
+            return None
+        finally:
+            if timeout is not None:
+                self.stdscr.timeout(-1)
+
+        if isinstance(char, int):
+            return str(curses.keyname(char), "ascii")
+        return str(char)
+
+    def unget_key(self, key: str) -> None:
+        """
+        Give <key> back, so that it is returned by the next get_key().
+        """
+        self.pending_keys.appendleft(key)
 
     @staticmethod
     def get_key_repr(key: str) -> str:
         """
         Return a string representation of the given key
         """
-        if key == "\n":
-            key_repr = "KEY_ENTER"
-        elif key == " ":
-            key_repr = "KEY_SPACE"
-        else:
-            key_repr = key
+        representation = key_repr(key)
 
-        logger.debug("Got key representation: %s", key_repr)
+        logger.debug("Got key representation: %s", representation)
 
-        return key_repr
+        return representation
 
-    def wait_keypress_delay(self, delay: float) -> int:
+    def wait_keypress_delay(self, delay: float) -> Optional[str]:
         """
-        Wait for a key press or for the delay to pass, then return the pressed key. If no key was
-        pressed, return -1.
+        Wait for a key press or for the delay to pass, then return the pressed
+        key. If no key was pressed, return None.
+
+        Like get_key_timeout(), keys given back with unget_key() are returned
+        first, and escape sequences are decoded, so that none of their
+        characters are left for the next get_key().
 
         :param delay: For how long to wait for a key press, in seconds.
-        :return: The key pressed, or -1 if no key was pressed.
+        :return: The key pressed, or None if no key was pressed.
         """
-        self.stdscr.timeout(round(delay * 1000))  # the delay is given in seconds, but
-        # milliseconds are expected.
-        key: int = self.stdscr.getch()
-        if key != -1:
+        key = self.get_key_timeout(delay)
+        if key is not None:
             logger.debug("skipped delay")
         else:
             logger.debug("did not skip delay")
 
-        self.stdscr.timeout(-1)
-
         return key
 
     def tear_down(self) -> None:
@@ -173,7 +255,7 @@ class CursesRenderer:
         """
         logger.debug("Waiting for key")
 
-        self.stdscr.getkey()
+        self.get_key()
 
     def clear_screen(self) -> None:
         """
@@ -203,7 +285,7 @@ class CursesRenderer:
 
         if self.debug:
             self.refresh()
-            sleep(0.03)
+            self.clock.sleep(0.03)
 
     def addinto(self, x_pos: int, y_pos: int, text: str) -> None:
         """
@@ -218,6 +300,138 @@ class CursesRenderer:
         self._move_cursoryx(y_pos + 1, x_pos + 1)
         self.stdscr.addstr(text)
 
+    def _put_row(self, x_pos: int, y_pos: int, text: str, color_pair: int) -> None:
+        """
+        Write <text> at (<x_pos>, <y_pos>), clipped to the screen.
+        """
+        max_x = self.max_x
+        if not 0 <= y_pos < self.max_y or x_pos >= max_x or not text:
+            return
+        if x_pos < 0:
+            text = skip_cells(text, -x_pos)
+            x_pos = 0
+        text = truncate(text, max_x - x_pos)
+        try:
+            self.stdscr.addstr(y_pos, x_pos, text, color_pair)
+        except curses.error:
+            # curses writes the text, and then fails to move the cursor after the
+            # bottom-right cell
+            if y_pos != self.max_y - 1:
+                raise
+
+    def fill(  # pylint: disable=R0913
+        self,
+        x_pos: int,
+        y_pos: int,
+        width: int,
+        height: int,
+        pattern: str = " ",
+        color_pair: Optional[int] = None,
+    ) -> None:
+        """
+        Fill the rectangle of <width> x <height> cells at (<x_pos>, <y_pos>) with
+        <pattern>, repeated along each row. The rectangle is clipped to the
+        screen. The screen is not refreshed.
+
+        :param pattern: a single line of text, for example " " to erase the rectangle
+        :raise ValueError: if the pattern does not take any cell
+        """
+        logger.debug(
+            "Filling (%s, %s) %sx%s with '%s'", x_pos, y_pos, width, height, pattern
+        )
+        pattern_width = text_width(pattern)
+        if pattern_width == 0:
+            raise ValueError(f"Empty fill pattern: {pattern!r}")
+        if color_pair is None:
+            color_pair = curses.color_pair(0)
+        # a wide character cut by the right edge is replaced with a space
+        row = pad(truncate(pattern * (width // pattern_width + 1), width), width)
+        for y_offset in range(height):
+            self._put_row(x_pos, y_pos + y_offset, row, color_pair)
+
+    def blit(
+        self, x_pos: int, y_pos: int, block: str, color_pair: Optional[int] = None
+    ) -> None:
+        """
+        Draw the lines of <block> one below the other, starting at (<x_pos>,
+        <y_pos>). The block is clipped to the screen. The screen is not
+        refreshed.
+        """
+        lines = block.splitlines()
+        logger.debug("Blitting %s lines at (%s, %s)", len(lines), x_pos, y_pos)
+        if color_pair is None:
+            color_pair = curses.color_pair(0)
+        for y_offset, line in enumerate(lines):
+            self._put_row(x_pos, y_pos + y_offset, line, color_pair)
+
+    def copy(  # pylint: disable=R0913
+        self,
+        x_pos: int,
+        y_pos: int,
+        width: int,
+        height: int,
+        dest_x_pos: int,
+        dest_y_pos: int,
+    ) -> None:
+        """
+        Copy the rectangle of <width> x <height> cells at (<x_pos>, <y_pos>),
+        with its colors, to (<dest_x_pos>, <dest_y_pos>). The rectangles may
+        overlap, but must be inside the screen. The screen is not refreshed.
+        """
+        logger.debug(
+            "Copying (%s, %s) %sx%s to (%s, %s)",
+            x_pos,
+            y_pos,
+            width,
+            height,
+            dest_x_pos,
+            dest_y_pos,
+        )
+        if width <= 0 or height <= 0:
+            return
+        # go through a pad, so that overlapping rectangles are copied correctly
+        scratch = self._scratch_pad(width, height)
+        self.stdscr.overwrite(scratch, y_pos, x_pos, 0, 0, height - 1, width - 1)
+        scratch.overwrite(
+            self.stdscr,
+            0,
+            0,
+            dest_y_pos,
+            dest_x_pos,
+            dest_y_pos + height - 1,
+            dest_x_pos + width - 1,
+        )
+
+    def _scratch_pad(self, width: int, height: int) -> Any:
+        """
+        Return a pad of at least <width> x <height> cells, reused by every
+        copy().
+        """
+        if self.scratch is not None:
+            max_y, max_x = self.scratch.getmaxyx()
+            if max_x >= width and max_y >= height:
+                return self.scratch
+            width, height = max(width, max_x), max(height, max_y)
+        self.scratch = curses.newpad(height, width)
+        return self.scratch
+
+    def scroll(  # pylint: disable=R0913
+        self, x_pos: int, y_pos: int, width: int, height: int, lines: int = 1
+    ) -> None:
+        """
+        Scroll the content of the rectangle of <width> x <height> cells at
+        (<x_pos>, <y_pos>) up by <lines> lines, or down if it is negative. The
+        lines that are uncovered are erased. The screen is not refreshed.
+        """
+        if abs(lines) >= height:
+            self.fill(x_pos, y_pos, width, height)
+        elif lines > 0:
+            self.copy(x_pos, y_pos + lines, width, height - lines, x_pos, y_pos)
+            self.fill(x_pos, y_pos + height - lines, width, lines)
+        elif lines < 0:
+            self.copy(x_pos, y_pos, width, height + lines, x_pos, y_pos - lines)
+            self.fill(x_pos, y_pos, width, -lines)
+
     def _move_cursoryx(self, y_pos: int, x_pos: int) -> None:
         try:
             self.stdscr.move(y_pos, x_pos)
@@ -247,56 +461,6 @@ class CursesRenderer:
         self._move_cursoryx(y_pos, x_pos)
         logger.debug("Cursor moved to (%s, %s)", x_pos, y_pos)
 
-    def text_input(
-        self,
-        prompt: str,
-        x_pos: int,
-        y_pos: int,
-        length: int,
-        color_pair_progress: int = curses.A_UNDERLINE | curses.A_BOLD,
-        color_pair_done: int = curses.A_BOLD,
-    ) -> str:
-        """
-        Get some input from the user, and return it. Similar to built-in input(), but for curses
-
-        :param color_pair_progress: A curses color pair to show while the user can enter text.
-        Default is underlined and bold.
-        :param color_pair_done: A curses color pair to show when the user is done entering text.
-        Default is bold
-        :param prompt: A short text inviting the user to input something.
-        :param x_pos: The x position where the prompt should be displayed
-        :param y_pos: The y position where the prompt should be displayed
-        :param length: The length of prompt. This will also limit the length of returned text.
-        length - 1 characters can be returned.
-        :return: The text imputed by the user, terminated by a carriage return.
-        """
-        logger.info(
-            "Getting text input at (%s, %s) of max length %s", x_pos, y_pos, length
-        )
-        curses.curs_set(2)
-
-        self.addtext(x_pos, y_pos, prompt)
-        self.refresh()
-
-        correct_x_pos = x_pos + len(prompt)
-
-        win = curses.newwin(1, length, y_pos, correct_x_pos)
-        win.bkgd(" ", color_pair_progress)
-
-        pad = textpad.Textbox(win, insert_mode=True)
-        text = pad.edit()
-        text = text.strip()
-
-        win.bkgd(" ", curses.A_NORMAL)
-        win.refresh()
-        win = curses.newwin(1, len(text) + 1, y_pos, correct_x_pos)
-        win.addstr(0, 0, text, color_pair_done)
-        win.refresh()
-
-        curses.curs_set(0)
-        logger.info("The user entered: %s", text)
-        return text
-
     def add_down_bar_text(
         self,
         text: str,
@@ -317,10 +481,12 @@ class CursesRenderer:
         if mode == 0:  # Left
             self.addtext(1, self.max_y - 1, text, color_pair)
         elif mode == 1:  # Middle
-            x_pos = int((self.max_x / 2) - (len(text) / 2))
+            x_pos = int((self.max_x / 2) - (text_width(text) / 2))
             self.addtext(x_pos, self.max_y - 1, text, color_pair)
         elif mode == 2:  # Right
-            self.addtext(self.max_x - 1 - len(text), self.max_y - 1, text, color_pair)
+            self.addtext(
+                self.max_x - 1 - text_width(text), self.max_y - 1, text, color_pair
+            )
         elif mode == 3:  # Custom
             assert (
                 x_pos is not None
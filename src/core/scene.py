@@ -23,15 +23,32 @@ This file implements the FullScreenScene class, which contains convenience metho
 import curses
 import logging
 from abc import ABC
-from typing import Optional, Any, List
+from typing import Dict, Optional, Any, Sequence, Tuple, Type, cast
 
+from src.core.pager import Pager
+from src.core.prefetch import PREFETCHER, Resource
 from src.core.render import CursesRenderer
 from src.core.state.game_state import GameState
-from src.core.state.save_manager import SaveManager
+from src.core.state.save_collection import SaveCollection
+from src.core.state.save_manager import get_save_manager, saves_version
+from src.core.typesetting import Placement, typeset_centred
+from src.core.user_interface import LineEditor
 
 logger = logging.getLogger(__name__)
 
 
+def load_saves() -> SaveCollection:
+    """
+    Return a name-sorted collection of all saved games.
+    """
+    save_manager = get_save_manager()
+    return SaveCollection(save_manager.saves)
+
+
+# Every saved game, see Scene.get_saves().
+SAVES = Resource("saves", load_saves, saves_version)
+
+
 class Scene:
     """
     The base class for all Scenes, contains convenience methods.
@@ -40,6 +57,9 @@ class Scene:
     def __init__(self, renderer: CursesRenderer, state: GameState) -> None:
         self.state = state
         self.renderer = renderer
+        # the LineEditors used by prompt(), by position and prompt, so that
+        # they keep their history
+        self.editors: Dict[Tuple[int, int, str], LineEditor] = {}
 
         logger.debug("Created new Scene")
 
@@ -56,6 +76,31 @@ class Scene:
             "subclass and override the start method."
         )
 
+    @classmethod
+    def resources(cls, renderer: CursesRenderer) -> Sequence[Resource]:
+        """
+        Return the resources this scene takes (see take()) when it is created or started, so
+        that they can be prefetched while the previous scene runs. Should be overridden by
+        subclasses that take resources.
+        """
+        return ()
+
+    @classmethod
+    def next_scenes(cls) -> Sequence[Type["Scene"]]:
+        """
+        Return the scenes that can follow this one, or that this one starts. The engine
+        prefetches their resources, and the resources of the scenes that follow them, while
+        this scene runs.
+        """
+        return ()
+
+    @staticmethod
+    def take(resource: Resource) -> Any:
+        """
+        Return <resource>, prefetched if possible. See Prefetcher.take().
+        """
+        return PREFETCHER.take(resource)
+
     def sleep_key(self, delay: float) -> bool:
         """
         Wait until a key is pressed, or the delay is exceeded.
@@ -72,7 +117,7 @@ class Scene:
 
         key = self.renderer.wait_keypress_delay(delay)
 
-        if key != -1:
+        if key is not None:
             logger.debug("Sleep interrupted!")
             return False
         return True
@@ -111,9 +156,19 @@ class Scene:
         self.renderer.addtext(x_pos, y_pos, text, color_pair)
         self.refresh()
 
-    def prompt(self, x_pos: int, y_pos: int, prompt: str = "", length: int = 30) -> str:
+    def prompt(  # pylint: disable=R0913
+        self,
+        x_pos: int,
+        y_pos: int,
+        prompt: str = "",
+        length: int = 30,
+        masked: bool = False,
+    ) -> str:
         """
-        Get some input from the user. for more information, see CursesRenderer.text_input()
+        Get some input from the user. for more information, see LineEditor.
+
+        The same LineEditor is used every time the same prompt is shown at the
+        same position, so the texts entered before are in its history.
         """
         logger.debug(
             "Getting input from user at (%s, %s), with prompt %s and max length %s",
@@ -123,20 +178,26 @@ class Scene:
             length,
         )
 
-        text = self.renderer.text_input(prompt, x_pos, y_pos, length)
+        key = (x_pos, y_pos, prompt)
+        editor = self.editors.get(key)
+        if editor is None:
+            editor = LineEditor(self.renderer, x_pos, y_pos, length, prompt, masked)
+            self.editors[key] = editor
+        else:
+            editor.length = length
+            editor.masked = masked
+
+        text = editor.edit()
 
         logger.debug("Got text: %s", text)
         return text
 
     @staticmethod
-    def get_saves() -> List[GameState]:
+    def get_saves() -> SaveCollection:
         """
-        Return a name-sorted list of all saved games.
+        Return a name-sorted collection of all saved games, prefetched if possible.
         """
-        save_manager = SaveManager()
-        saves = save_manager.saves
-        saves.sort(key=lambda x: x.data["name"].lower())
-        return saves
+        return cast(SaveCollection, PREFETCHER.take(SAVES))
 
 
 class FullScreenScene(Scene, ABC):
@@ -155,35 +216,25 @@ class FullScreenScene(Scene, ABC):
             pager_delay,
             color_pair,
         )
-        all_lines = text.splitlines()
-        max_lines = self.renderer.max_y - 2
-
-        # We will first show as many lines as we can, then recurse with the remaining lines
-        next_lines = "\n".join(all_lines[:max_lines])
-        max_lines_with_buffer = max_lines - 5
-        remaining_lines = "\n".join(all_lines[max_lines_with_buffer:])
-
-        # If the text was skipped, skip will be True
-        skip = self.addinto_centred(y_pos, next_lines, delay, pager_delay, color_pair)
-
-        # We wait for an additional delay between each page. skip_all will be True if the
-        # delay is skipped, in that case we don't display the next pages.
-        self.sleep_key(pager_delay)
-        self.clear()  # clear the screen for the next page
-
-        if (
-            skip
-        ):  # If the text animation was skipped, skip the text animation for the next
-            # pages
-            # This works because the delay is reused when recursing
-            delay = 0
+        pager = Pager(text, self.renderer.max_y - 2)  # -2 for the borders
+
+        skip = False
+        for number, page in enumerate(pager.pages()):
+            if number > 0:
+                self.clear()  # clear the screen for the next page
+
+            # If the text animation was skipped, skip it for the next pages too
+            if self.addinto_centred(
+                y_pos, "\n".join(page), delay, pager_delay, color_pair
+            ):
+                skip = True
+                delay = 0
 
-        self.addinto_centred(y_pos, remaining_lines, delay, pager_delay, color_pair)  #
-        # recurse for
-        # the
-        # remaining lines
+            # We wait for an additional delay between each page.
+            self.sleep_key(pager_delay)
 
-        self.sleep_key(pager_delay)
+            # the terminal may have been resized while the page was shown
+            pager.set_height(self.renderer.max_y - 2)
 
         return skip  # if anything was skipped, return True
 
@@ -221,7 +272,9 @@ class FullScreenScene(Scene, ABC):
         if color_pair is None:
             color_pair = curses.color_pair(0)
 
-        line_count = len(text.splitlines())
+        # the text is wrapped and centred inside the borders
+        layout = typeset_centred(text, self.renderer.max_x - 2)
+        line_count = len(layout)
         max_lines = self.renderer.max_y - 2
 
         if y_pos < 1:
@@ -233,32 +286,32 @@ class FullScreenScene(Scene, ABC):
 
         # If the text is too long for the terminal, it needs to be paged.
         if line_count > max_lines:  # -2 for the borders
-            self._addinto_centred_paged(y_pos, text, delay, pager_delay, color_pair)
+            wrapped_text = "\n".join(placement.text for placement in layout)
+            self._addinto_centred_paged(
+                y_pos, wrapped_text, delay, pager_delay, color_pair
+            )
 
         else:
             # To add a delay between each line, we loop over each line
-            for idx, line in enumerate(text.splitlines()):
-                delay = self._add_line_centred(color_pair, delay, idx, line, y_pos)
+            for placement in layout:
+                delay = self._add_line_centred(color_pair, delay, placement, y_pos)
 
         return delay == 0  # If something was skipped, return True
 
     def _add_line_centred(
-        self, color_pair: int, delay: float, idx: int, line: str, y_pos: int
+        self, color_pair: int, delay: float, placement: Placement, y_pos: int
     ) -> float:
         logger.info(
-            "_add_line_centred: color_pair: '%s' delay: '%s' idx: '%s' line: '%s' y_pos: '%s'",
+            "_add_line_centred: color_pair: '%s' delay: '%s' placement: '%s' y_pos: '%s'",
             color_pair,
             delay,
-            idx,
-            line,
+            placement,
             y_pos,
         )
 
-        middle_of_screen = self.renderer.max_x / 2
-        middle_of_text = len(line) / 2
-        # we need to round this to avoid passing a float to self.renderer.add_text
-        x_pos = round(middle_of_screen - middle_of_text)
-        correct_y_pos = y_pos + idx  # Shift each new line downwards
+        x_pos = placement.x_pos + 1  # the text was typeset inside the borders
+        correct_y_pos = y_pos + placement.y_pos  # Shift each new line downwards
+        line = placement.text
         self.renderer.addtext(x_pos, correct_y_pos, line, color_pair)
         self.refresh()  # to view each line being added, we need to refresh the screen
         if line != "":
@@ -293,7 +346,7 @@ class FullScreenScene(Scene, ABC):
             color_pair,
         )
 
-        line_count = len(text.splitlines())
+        line_count = len(typeset_centred(text, self.renderer.max_x - 2))
         return self.addinto_centred(
             round(self.renderer.max_y / 2) - round(line_count / 2),
             text,
@@ -21,10 +21,15 @@ This file contains the GameState class, which is responsible for saving the curr
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # ------------------------------------------------------------------------------
 
-import json
 import logging
+import os
 from pathlib import Path
-from typing import Any, cast, Optional
+from typing import Any, cast, Dict, Iterable, Optional, Set
+
+from src.core.state import migrations, save_format
+from src.core.state.save_lock import lock_directory, lock_file
+from src.core.state.snapshot import StateSnapshot
+from src.core.state.tracked_dict import DELETED, Journal, TrackedDict
 
 logger = logging.getLogger(__name__)
 
@@ -39,18 +44,123 @@ class GameState:
     loaded from the save file. filepath contains the path where the save is
     stored.
 
-    At init time, filepath is set to None.
+    At init time, filepath is set to None, and data contains the data of a new
+    save (see migrations.new_save_data()).
 
     See the documentation for load() and save() for information on how filepath
     behaves.
+
+    data is a TrackedDict, which records which parts of it were changed since
+    the last load() or save(). save() does nothing if nothing changed, and
+    diff() returns the changed sections. Assigning a new dict to data marks the
+    whole state as changed.
+
+    compression is the save_format compression used when saving. It is set by
+    load() to the compression of the loaded file, so that saves keep their
+    format. Changing it marks the state as changed.
+
+    Loaded data is upgraded to the current schema once, by upgrade(). The
+    upgraded data is only written back the next time the state is saved.
+
+    snapshot() returns an immutable checkpoint of the data, which can later be
+    given to restore(). Successive snapshots share the sections that did not
+    change between them.
+
+    load() and save() lock the save file (see save_lock), so that several game
+    processes can use the same saves. They raise SaveLockTimeout if another
+    process holds the lock for too long.
+
+    summary is True if data only contains the sections shown in the save list
+    (name, metadata and computer brand), because the save backend listed the
+    save without loading it. SaveManager.load_data() loads the rest. A summary
+    can not be saved.
+
+    file_mtime is the modification time of the save file, in nanoseconds, when
+    it was last loaded or saved by this state, or None if it never was. See
+    SaveWatcher.
     """
 
     def __init__(self) -> None:
-        self.data: JSON = {}
+        self._data = TrackedDict()
+        self._snapshot_journal: Journal = set()
+        self._last_snapshot: Optional[StateSnapshot] = None
+        self._set_data(migrations.new_save_data())
+        self._compression: Optional[str] = None
         self.filepath: Optional[Path] = None
+        self.summary = False
+        self.file_mtime: Optional[int] = None
 
         logger.debug("Creating new empty GameState")
 
+    def _set_data(self, data: JSON) -> None:
+        """
+        Replace the data with a clean TrackedDict containing <data>.
+        """
+        self._data = TrackedDict(data)
+        self._snapshot_journal = self._data.add_journal()
+        # the new data has nothing in common with the last snapshot
+        self._snapshot_journal.add(())
+
+    def _changed_sections(self, journal: Journal, others: Iterable[str] = ()) -> Set[str]:
+        """
+        Return the top-level sections changed according to <journal>. If the
+        whole document changed, return every current section and <others>.
+        """
+        if () in journal:
+            return set(self._data) | set(others)
+        return {path[0] for path in journal}
+
+    @property
+    def data(self) -> JSON:
+        """
+        Return the data of this state. See the class documentation.
+        """
+        return self._data
+
+    @data.setter
+    def data(self, value: JSON) -> None:
+        self._set_data(value)
+        self._data.mark_dirty()
+
+    @property
+    def compression(self) -> Optional[str]:
+        """
+        Return the compression used when saving. See the class documentation.
+        """
+        return self._compression
+
+    @compression.setter
+    def compression(self, value: Optional[str]) -> None:
+        if value != self._compression:
+            self._compression = value
+            # the data did not change, only the file needs to be written again
+            self._data.journal.add(())
+
+    @property
+    def dirty(self) -> bool:
+        """
+        Return True if the data was changed since it was last loaded or saved.
+        """
+        return bool(self._data.journal)
+
+    def mark_clean(self) -> None:
+        """
+        Forget all changes, as if the data was just loaded or saved. Should be
+        used by save backends after they persisted this state.
+        """
+        self._data.mark_clean()
+
+    def diff(self) -> Dict[str, JSON]:
+        """
+        Return the top-level sections of data that changed since the last load
+        or save, mapped to their current value. Sections that were removed are
+        mapped to DELETED.
+        """
+        sections = self._changed_sections(self._data.journal)
+        return {
+            section: self._data.get(section, DELETED) for section in sorted(sections)
+        }
+
     def load(self, path: Path) -> None:
         """
         Load a save file at a specified path into this save object. The internal
@@ -60,11 +170,67 @@ class GameState:
 
         logger.info("Loading save file: '%s'", path)
 
-        with path.open("r") as file:
-            self.data = json.load(file)
+        with lock_file(path) as file:
+            data, self._compression = save_format.load(file)
+            self.file_mtime = os.fstat(file.fileno()).st_mtime_ns
+        self._set_data(data)
+        self.summary = False
+        self.upgrade()
 
         logger.info('New data: "%s"', self.data)
 
+    def upgrade(self) -> None:
+        """
+        Upgrade the data to the current save schema, if needed. The upgrade
+        marks the changed sections, so that they are written back on the next
+        save.
+        """
+        if migrations.upgrade(self._data):
+            logger.info("Upgraded save: changed sections: '%s'", self.diff())
+
+    def snapshot(self) -> StateSnapshot:
+        """
+        Return an immutable snapshot of the current data.
+
+        Only the sections that changed since the previous snapshot are copied,
+        the others are shared with it.
+        """
+        previous = self._last_snapshot
+        if previous is None:
+            snapshot = StateSnapshot(self._data)
+        else:
+            changed = self._changed_sections(self._snapshot_journal, previous)
+            logger.debug("Snapshot: changed sections: '%s'", changed)
+            snapshot = StateSnapshot(self._data, changed, previous)
+
+        self._snapshot_journal.clear()
+        self._last_snapshot = snapshot
+        return snapshot
+
+    def restore(self, snapshot: StateSnapshot) -> None:
+        """
+        Restore the data to what it was when <snapshot> was taken.
+
+        Only the sections that differ between the current data and the
+        snapshot are copied back. The restored sections are marked as changed,
+        so the next save writes them.
+        """
+        changed = self._changed_sections(self._snapshot_journal, snapshot)
+        if self._last_snapshot is None:
+            changed |= set(self._data) | set(snapshot)
+        else:
+            changed |= self._last_snapshot.changed_sections(snapshot)
+
+        logger.info("Restoring snapshot: changed sections: '%s'", changed)
+        for section in changed:
+            if section in snapshot:
+                self._data[section] = snapshot[section]
+            elif section in self._data:
+                del self._data[section]
+
+        self._snapshot_journal.clear()
+        self._last_snapshot = snapshot
+
     @property
     def lastsave(self) -> str:
         """
@@ -79,24 +245,40 @@ class GameState:
 
     def save(self, path: Optional[Path] = None) -> None:
         """
-        Save this game state to a given file, in JSON format. Does not update
-        the internal path.
+        Save this game state to a given file, in JSON format, compressed if
+        compression is set. Does not update the internal path.
+
+        If the file is the internal path, it already exists, and nothing
+        changed since the last load or save, nothing is written.
 
         :param path: the path to the file.
         """
+        assert not self.summary, "The data of a summary must be loaded before saving it"
         if path is None:
             assert (
                 self.filepath is not None
             ), "You need to provide load() or set the filepath manually at least once."
             path = self.filepath
             logger.info("Using last loaded filepath '%s'", path)
+
+        is_own_file = path == self.filepath
+        if is_own_file and not self.dirty and path.exists():
+            logger.info("Nothing changed, skipping save to file '%s'", path)
+            return
+
         logger.info("Saving state to file '%s'", path)
-        logger.info('Current data: "%s"', self.data)
+        logger.info('Changed sections: "%s"', self.diff())
 
-        path.touch(exist_ok=True)  # ensure that the file exists
+        # the file is only truncated once no other process reads or writes it
+        with lock_directory(path.parent), lock_file(path, write=True) as file:
+            file.truncate()
+            save_format.dump(self.data, file, self.compression)
+            file.flush()
+            mtime = os.fstat(file.fileno()).st_mtime_ns
 
-        with path.open("w") as file:
-            json.dump(self.data, file, indent=2, sort_keys=True)
+        if is_own_file:
+            self.mark_clean()
+            self.file_mtime = mtime
 
         logger.info("Done saving state")
 
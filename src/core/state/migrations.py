@@ -0,0 +1,125 @@
+"""
+This file contains the save schema version, and the migrations used to upgrade saves written
+with an older schema.
+"""
+
+# ------------------------------------------------------------------------------
+#  This file is part of Universal Sandbox.
+#
+#  Copyright (C) © 2020 Khaïs COLIN <logistic-bot@protonmail.com>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+import logging
+from functools import lru_cache
+from typing import Any, Callable, Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+JSON = Any
+Migration = Callable[[JSON], None]
+
+# The version of the save layout written by this version of the game. Saves without a
+# schema_version field are version 0.
+SCHEMA_VERSION = 1
+
+# Maps a schema version to the migration that upgrades a save from this version to the next one.
+MIGRATIONS: Dict[int, Migration] = {}
+
+
+def migration(from_version: int) -> Callable[[Migration], Migration]:
+    """
+    Register the decorated function as the migration from <from_version> to <from_version> + 1.
+
+    A migration modifies the save data in place. It does not need to update schema_version.
+    """
+
+    def register(function: Migration) -> Migration:
+        assert (
+            from_version not in MIGRATIONS
+        ), f"There already is a migration from version {from_version}"
+        MIGRATIONS[from_version] = function
+        return function
+
+    return register
+
+
+@lru_cache(maxsize=None)
+def _migration_chain(version: int) -> Tuple[Migration, ...]:
+    """
+    Return the migrations needed to upgrade a save from <version> to SCHEMA_VERSION.
+    """
+    return tuple(MIGRATIONS[from_version] for from_version in range(version, SCHEMA_VERSION))
+
+
+def upgrade(data: JSON) -> bool:
+    """
+    Upgrade <data> in place to SCHEMA_VERSION.
+
+    :return: True if data was changed, False if it already used the current schema.
+    """
+    version = data.get("schema_version", 0)
+    if version == SCHEMA_VERSION:
+        return False
+    if version > SCHEMA_VERSION:
+        raise ValueError(
+            f"Save schema version {version} is newer than the supported version {SCHEMA_VERSION}"
+        )
+
+    logger.info("Upgrading save from schema version %s to %s", version, SCHEMA_VERSION)
+    for function in _migration_chain(version):
+        function(data)
+    data["schema_version"] = SCHEMA_VERSION
+    return True
+
+
+def new_save_data(
+    name: str = "",
+    username: str = "",
+    password: str = "",
+    save_date: str = "",
+    brand: str = "none",
+) -> JSON:
+    """
+    Return the data of a new save, using the current schema.
+    """
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "metadata": {"save_creation": save_date, "save_date": save_date},
+        "name": name,
+        "note": "",
+        "user": {"username": username, "password": password},
+        "progress": {"computer-brand": brand},
+        "debug": {"skip-boot-animation": False},
+    }
+
+
+@migration(0)
+def _add_missing_sections(data: JSON) -> None:
+    """
+    Version 0 saves were written by hand or by older versions of the game, and any section
+    could be missing. Version 1 guarantees that every section of new_save_data() exists.
+
+    :raise ValueError: if an existing section that should hold an object holds another value
+    """
+    defaults = new_save_data()
+    for section, default in defaults.items():
+        if isinstance(default, dict):
+            values = data.setdefault(section, {})
+            if not isinstance(values, dict):
+                raise ValueError(f"Malformed save: the '{section}' section is not an object")
+            for key, value in default.items():
+                values.setdefault(key, value)
+        else:
+            data.setdefault(section, default)
@@ -0,0 +1,167 @@
+"""
+This file contains the SaveCollection class, a list of saves which is kept sorted by name.
+"""
+
+# ------------------------------------------------------------------------------
+#  This file is part of Universal Sandbox.
+#
+#  Copyright (C) © 2020 Khaïs COLIN <logistic-bot@protonmail.com>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+import logging
+from bisect import bisect_left
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    overload,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from src.core.state.game_state import GameState
+
+logger = logging.getLogger(__name__)
+
+CollationKey = Tuple[str, str, str]
+
+
+def collation_key(state: GameState) -> CollationKey:
+    """
+    Return the key used to sort saves: case-insensitive name first, then the exact name, then
+    the filepath, so that two saves never compare equal and their order is always the same.
+    """
+    name: str = state.data["name"]
+    return name.lower(), name, str(state.filepath)
+
+
+class SaveCollection(Sequence[GameState]):
+    """
+    A sequence of saves, always sorted by collation_key().
+
+    The collation key of each save is computed once, when it is added, and cached. Adding,
+    removing and finding saves uses bisection on the cached keys. When a save is renamed,
+    update() must be called to move it to its new position.
+
+    Saves can also be found by their filepath, with find().
+    """
+
+    def __init__(self, saves: Iterable[GameState] = ()) -> None:
+        self._cached_keys: Dict[GameState, CollationKey] = {
+            save: collation_key(save) for save in saves
+        }
+        self._saves: List[GameState] = sorted(
+            self._cached_keys, key=self._cached_keys.__getitem__
+        )
+        self._keys: List[CollationKey] = [self._cached_keys[save] for save in self._saves]
+        # the filepath of a save can change, see SaveManager.get_path()
+        self._filepaths: Dict[GameState, Optional[Path]] = {
+            save: save.filepath for save in self._saves
+        }
+        self._by_path: Dict[Optional[Path], GameState] = {
+            save.filepath: save for save in self._saves
+        }
+
+        logger.debug("Created SaveCollection with %s saves", len(self._saves))
+
+    @overload
+    def __getitem__(self, index: int) -> GameState:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[GameState]:
+        ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[GameState, Sequence[GameState]]:
+        return self._saves[index]
+
+    def __len__(self) -> int:
+        return len(self._saves)
+
+    def __iter__(self) -> Iterator[GameState]:
+        return iter(self._saves)
+
+    def __contains__(self, save: Any) -> bool:
+        return save in self._cached_keys
+
+    def index(self, save: Any, start: int = 0, stop: Any = None) -> int:
+        """
+        Return the index of <save>. Raises ValueError if it is not in the collection.
+        """
+        try:
+            key = self._cached_keys[save]
+        except KeyError:
+            raise ValueError(f"{save} is not in the collection")
+        return bisect_left(self._keys, key)
+
+    def add(self, save: GameState) -> int:
+        """
+        Insert <save> at its sorted position, and return this position.
+        """
+        assert save not in self._cached_keys, "This save is already in the collection"
+
+        key = collation_key(save)
+        index = bisect_left(self._keys, key)
+        self._cached_keys[save] = key
+        self._keys.insert(index, key)
+        self._saves.insert(index, save)
+        self._filepaths[save] = save.filepath
+        self._by_path[save.filepath] = save
+
+        logger.debug("Added save '%s' at index %s", save, index)
+        return index
+
+    def remove(self, save: GameState) -> int:
+        """
+        Remove <save>, and return the position it had.
+        """
+        index = self.index(save)
+        del self._cached_keys[save]
+        del self._keys[index]
+        del self._saves[index]
+        del self._by_path[self._filepaths.pop(save)]
+
+        logger.debug("Removed save '%s' from index %s", save, index)
+        return index
+
+    def update(self, save: GameState) -> Tuple[int, int]:
+        """
+        Move <save> to its new position after its name or its filepath changed.
+
+        :return: the old and the new position of the save
+        """
+        old_index = self.remove(save)
+        new_index = self.add(save)
+        return old_index, new_index
+
+    def find(self, path: Path) -> Optional[GameState]:
+        """
+        Return the save stored at <path>, or None if there is none.
+        """
+        return self._by_path.get(path)
+
+    @property
+    def names(self) -> List[str]:
+        """
+        Return the names of the saves, in order.
+        """
+        return [key[1] for key in self._keys]
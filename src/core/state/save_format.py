@@ -0,0 +1,169 @@
+"""
+This file contains the functions used to read and write save files, either as plain JSON or in
+the compressed save format.
+"""
+
+# ------------------------------------------------------------------------------
+#  This file is part of Universal Sandbox.
+#
+#  Copyright (C) © 2020 Khaïs COLIN <logistic-bot@protonmail.com>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+import json
+import logging
+import lzma
+import zlib
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+JSON = Any
+
+# Every compressed save starts with MAGIC followed by one byte identifying the codec. Plain JSON
+# saves always start with "{" (possibly after whitespace), so they can never be mistaken for a
+# compressed save.
+MAGIC = b"USMSAVE"
+CODECS: Dict[str, bytes] = {"zlib": b"z", "lzma": b"x"}
+
+# Number of bytes read from a compressed save at once, and maximum number of bytes decompressed
+# at once.
+CHUNK_SIZE = 64 * 1024
+
+COMPACT_SEPARATORS = (",", ":")
+
+
+def _compressor(compression: str) -> Any:
+    if compression == "zlib":
+        return zlib.compressobj(9)
+    if compression == "lzma":
+        return lzma.LZMACompressor()
+    raise ValueError(f"Unknown save compression: '{compression}'")
+
+
+def _decompressor(compression: str) -> Any:
+    if compression == "zlib":
+        return zlib.decompressobj()
+    if compression == "lzma":
+        return lzma.LZMADecompressor()
+    raise ValueError(f"Unknown save compression: '{compression}'")
+
+
+def _decompress(compression: str, file: BinaryIO) -> Iterator[bytes]:
+    """
+    Yield the decompressed content of <file>, in chunks of at most CHUNK_SIZE bytes, so that a
+    compressed chunk that expands a lot is never decompressed at once.
+
+    :raise ValueError: if the compressed data is corrupt, ends before the end of the compressed
+        stream, or is followed by other data
+    """
+    decompressor = _decompressor(compression)
+    chunk = file.read(CHUNK_SIZE)
+    try:
+        while chunk:
+            if compression == "zlib":
+                # zlib keeps the input it did not decompress in unconsumed_tail
+                while chunk and not decompressor.eof:
+                    yield decompressor.decompress(chunk, CHUNK_SIZE)
+                    chunk = decompressor.unconsumed_tail
+            else:
+                # lzma keeps it internally, until it needs more input
+                yield decompressor.decompress(chunk, CHUNK_SIZE)
+                while not decompressor.needs_input and not decompressor.eof:
+                    yield decompressor.decompress(b"", CHUNK_SIZE)
+            if decompressor.eof:
+                break
+            chunk = file.read(CHUNK_SIZE)
+    except (zlib.error, lzma.LZMAError) as error:
+        raise ValueError(f"Corrupt compressed save: {error}") from error
+
+    if not decompressor.eof:
+        raise ValueError("Truncated compressed save")
+    if decompressor.unused_data or file.read(1):
+        raise ValueError("Unexpected data after the end of the compressed save")
+
+
+def dump(data: JSON, file: BinaryIO, compression: Optional[str] = None) -> None:
+    """
+    Write <data> into the binary file <file>.
+
+    If compression is None, the data is written as pretty-printed JSON, which is the historical
+    save format. Otherwise it must be one of the keys of CODECS.
+
+    Compressed saves contain one line of compact JSON per top-level key of <data>, in the form
+    [key, value]. This allows load() to decode them one line at a time.
+    """
+    if compression is None:
+        logger.debug("Writing plain JSON save")
+        file.write(json.dumps(data, indent=2, sort_keys=True).encode("utf-8"))
+        return
+
+    logger.debug("Writing save compressed with '%s'", compression)
+    compressor = _compressor(compression)
+    file.write(MAGIC + CODECS[compression])
+    for key in sorted(data):
+        line = json.dumps([key, data[key]], separators=COMPACT_SEPARATORS, sort_keys=True)
+        file.write(compressor.compress(line.encode("utf-8") + b"\n"))
+    file.write(compressor.flush())
+
+
+def load(file: BinaryIO) -> Tuple[JSON, Optional[str]]:
+    """
+    Read a save from the binary file <file>. The format is detected using the first bytes of
+    the file.
+
+    Compressed saves are decompressed and parsed one chunk at a time, so that the whole
+    decompressed text is never held in memory at once.
+
+    :return: the data, and the compression that was used (None for plain JSON)
+    :raise ValueError: if the save is corrupt, truncated, or followed by other data
+    """
+    header = file.read(len(MAGIC) + 1)
+    compression = detect(header)
+
+    if compression is None:
+        logger.debug("Reading plain JSON save")
+        return json.loads(header + file.read()), None
+
+    logger.debug("Reading save compressed with '%s'", compression)
+    data: Dict[str, JSON] = {}
+    pending: List[bytes] = []  # the beginning of a line that is not complete yet
+
+    for decompressed in _decompress(compression, file):
+        pending.append(decompressed)
+        if b"\n" in decompressed:
+            *lines, last = b"".join(pending).split(b"\n")
+            pending = [last]
+            for line in lines:
+                key, value = json.loads(line)
+                data[key] = value
+
+    if b"".join(pending).strip():
+        raise ValueError("Truncated compressed save")
+
+    return data, compression
+
+
+def detect(header: bytes) -> Optional[str]:
+    """
+    Return the compression used by a save starting with <header>, or None if it is plain JSON.
+    """
+    if header[:len(MAGIC)] != MAGIC:
+        return None
+
+    codec = header[len(MAGIC):len(MAGIC) + 1]
+    for compression, compression_codec in CODECS.items():
+        if codec == compression_codec:
+            return compression
+    raise ValueError(f"Unknown save codec: {codec!r}")
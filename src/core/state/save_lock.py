@@ -0,0 +1,152 @@
+"""
+This file contains the advisory locks used to access saves safely from several game processes
+at the same time.
+"""
+
+# ------------------------------------------------------------------------------
+#  This file is part of Universal Sandbox.
+#
+#  Copyright (C) © 2020 Khaïs COLIN <logistic-bot@protonmail.com>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+import logging
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from time import monotonic, sleep
+from typing import BinaryIO, Iterator
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows
+    fcntl = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of seconds to wait for a lock held by another process.
+LOCK_TIMEOUT = 5.0
+
+# Number of seconds between two attempts to take a lock. The delay doubles after each attempt,
+# up to MAX_RETRY_DELAY.
+RETRY_DELAY = 0.005
+MAX_RETRY_DELAY = 0.1
+
+
+class SaveLockTimeout(TimeoutError):
+    """
+    Raised when a save, or the save directory, stayed locked by another process for longer than
+    the lock timeout.
+    """
+
+
+def _flock(file_descriptor: int, exclusive: bool, path: Path, timeout: float) -> None:
+    """
+    Lock <file_descriptor>, waiting at most <timeout> seconds.
+    """
+    if fcntl is None:
+        return
+
+    operation = fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH
+    deadline = monotonic() + timeout
+    delay = RETRY_DELAY
+    while True:
+        try:
+            fcntl.flock(file_descriptor, operation | fcntl.LOCK_NB)
+            return
+        except BlockingIOError:
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                raise SaveLockTimeout(
+                    f"'{path}' is still locked by another process after {timeout} seconds"
+                )
+            logger.debug("'%s' is locked, retrying in %s seconds", path, delay)
+            sleep(min(delay, remaining))
+            delay = min(delay * 2, MAX_RETRY_DELAY)
+
+
+@contextmanager
+def lock_directory(
+    directory: Path, exclusive: bool = False, timeout: float = LOCK_TIMEOUT
+) -> Iterator[None]:
+    """
+    Lock <directory> while the context is active.
+
+    Adding a save to the directory or reading it takes a shared lock, so that it can happen in
+    several processes at the same time. Removing a save takes an exclusive lock.
+
+    The directory lock must always be taken before the lock of a save in it, to avoid
+    deadlocks.
+    """
+    if fcntl is None:
+        yield
+        return
+
+    file_descriptor = os.open(directory, os.O_RDONLY)
+    try:
+        _flock(file_descriptor, exclusive, directory, timeout)
+        yield
+    finally:
+        os.close(file_descriptor)  # also releases the lock
+
+
+@contextmanager
+def lock_file(
+    path: Path,
+    exclusive: bool = False,
+    write: bool = False,
+    timeout: float = LOCK_TIMEOUT,
+) -> Iterator[BinaryIO]:
+    """
+    Open <path>, lock it while the context is active, and return the open file.
+
+    Readers should take a shared lock. Writers take an exclusive lock: if <write> is True, the
+    file is opened for reading and writing, created if it does not exist, and the lock is
+    always exclusive. The file is never truncated; writers should call truncate() once they
+    hold the lock.
+
+    If the file was deleted or replaced while waiting for the lock, the new file is opened
+    and locked instead.
+
+    Raises SaveLockTimeout if the file stays locked for more than <timeout> seconds.
+    """
+    exclusive = exclusive or write
+    deadline = monotonic() + timeout
+    while True:
+        if write:
+            file_descriptor = os.open(path, os.O_RDWR | os.O_CREAT, 0o666)
+        else:
+            file_descriptor = os.open(path, os.O_RDONLY)
+
+        try:
+            _flock(file_descriptor, exclusive, path, max(deadline - monotonic(), 0))
+            locked = os.fstat(file_descriptor)
+            current = os.stat(path)
+        except FileNotFoundError:
+            os.close(file_descriptor)
+            if not write:
+                raise
+            continue  # deleted while waiting: create it again
+        except BaseException:
+            os.close(file_descriptor)
+            raise
+
+        if (locked.st_dev, locked.st_ino) == (current.st_dev, current.st_ino):
+            break
+
+        logger.debug("'%s' was replaced while waiting for its lock, retrying", path)
+        os.close(file_descriptor)
+
+    with os.fdopen(file_descriptor, "r+b" if write else "rb") as file:
+        yield file  # closing the file releases the lock
@@ -20,29 +20,160 @@ This file contains the SaveManager class, which manages a group of Saves
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # ------------------------------------------------------------------------------
+import hashlib
 import logging
+import os
+import threading
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterator, List, Optional, Tuple
 from uuid import uuid4 as uuid
 
 from src import GAME_ROOT_DIR
 from src.core.state.game_state import GameState
+from src.core.state.save_lock import lock_directory, lock_file
 
 SAVEFILE_EXTENSION = ".json"
 
+# The compression used for saves written by SaveManager, see save_format.CODECS. None writes
+# plain JSON.
+SAVE_COMPRESSION: Optional[str] = None
+
+# Whether SaveManager stores new saves in the sharded layout, see shard_path().
+SAVE_SHARDED = False
+
+# Whether the saves are stored in a single SQLite database (see
+# SqliteSaveManager) instead of one JSON file per save. See get_save_manager().
+SAVE_SQLITE = False
+
+# Number of levels of shard directories, and number of hex digits in their names.
+SHARD_LEVELS = 2
+SHARD_WIDTH = 2
+
 SAVE_DIRECTORY = GAME_ROOT_DIR / "saves"
 SAVE_DIRECTORY.mkdir(exist_ok=True)
 
 logger = logging.getLogger(__name__)
 
 
+def shard_path(directory: Path, filename: str) -> Path:
+    """
+    Return the path of the save file <filename> in the sharded layout of
+    <directory>: <directory>/ab/cd/<filename>, where abcd is a hash of
+    <filename> in hex.
+
+    Saves are spread evenly over 65536 subdirectories, so that every
+    directory stays small and creating, opening and deleting a save stays fast
+    with hundreds of thousands of saves.
+    """
+    digest = hashlib.blake2b(
+        filename.encode(), digest_size=SHARD_LEVELS * SHARD_WIDTH // 2
+    ).hexdigest()
+    for level in range(SHARD_LEVELS):
+        start = level * SHARD_WIDTH
+        directory = directory / digest[start:start + SHARD_WIDTH]
+    return directory / filename
+
+
+def is_shard_name(name: str) -> bool:
+    """
+    Return True if <name> is the name of a shard directory.
+    """
+    return len(name) == SHARD_WIDTH and all(char in "0123456789abcdef" for char in name)
+
+
+def iter_save_files(directory: Path, levels: int = SHARD_LEVELS) -> Iterator[Path]:
+    """
+    Yield the path of every save file in <directory>, in no particular order.
+    Both the flat layout and the sharded layout are supported, and they can be
+    mixed while a directory is being migrated.
+
+    :param levels: the number of levels of shard directories to look into
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            path = Path(entry.path)
+            if entry.is_dir() and is_shard_name(entry.name):
+                if levels > 0:
+                    yield from iter_save_files(path, levels - 1)
+            elif path.suffix == SAVEFILE_EXTENSION and entry.is_file():
+                yield path
+            else:
+                logger.debug("Skipping non-savefile file at '%s'", path)
+
+
+def saves_version() -> Tuple[int, int]:
+    """
+    Return a value that changes when the saves change, to tell whether saves
+    that were listed before are out of date: the number of changes made by the
+    SaveManagers of this process, and the modification time of the save
+    directory, which changes when another process adds or deletes a save in
+    the flat layout.
+    """
+    return SaveManager.generation, os.stat(SAVE_DIRECTORY).st_mtime_ns
+
+
+class _Managers(threading.local):
+    # the SaveManagers returned by get_save_manager() in the current thread, by backend
+    def __init__(self) -> None:
+        super().__init__()
+        self.by_backend: Dict[bool, SaveManager] = {}
+
+
+_MANAGERS = _Managers()
+
+
+def get_save_manager() -> "SaveManager":
+    """
+    Return the SaveManager for the save backend selected by SAVE_SQLITE. The
+    game should use it instead of creating a SaveManager directly.
+
+    One manager is created per thread and backend, and reused: a SQLite
+    connection can only be used by the thread that opened it.
+    """
+    managers = _MANAGERS.by_backend
+    manager = managers.get(SAVE_SQLITE)
+    if manager is None:
+        if SAVE_SQLITE:
+            # sqlite_save_manager imports this module
+            from src.core.state.sqlite_save_manager import (  # pylint: disable=C0415
+                SqliteSaveManager,
+            )
+
+            manager = SqliteSaveManager()
+        else:
+            manager = SaveManager()
+        managers[SAVE_SQLITE] = manager
+    return manager
+
+
 class SaveManager:
     """
     This class manages a group of Saves.
+
+    If compression is not None, every saved state is converted to this
+    compression. Otherwise, states keep the format they were loaded with.
+
+    If sharded is True, saves are stored in the sharded layout (see
+    shard_path()). Saves still in the flat layout are moved to their shard the
+    next time they are used, or all at once by migrate(). This is safe while
+    other game processes use the saves.
+
+    Every change to the saves (saving, renaming or deleting one) increments
+    generation, see saves_version().
     """
 
-    def __init__(self) -> None:
+    # Number of changes made to the saves by the SaveManagers of this process.
+    generation = 0
+
+    # Whether every save is a file in save_dir, so that SaveWatcher can watch them.
+    save_files = True
+
+    def __init__(
+        self, compression: Optional[str] = SAVE_COMPRESSION, sharded: bool = SAVE_SHARDED
+    ) -> None:
         self.save_dir = SAVE_DIRECTORY
+        self.compression = compression
+        self.sharded = sharded
         logger.info("Creating new SaveManager with save dir '%s'", self.save_dir)
 
     @property
@@ -52,20 +183,33 @@ class SaveManager:
         """
         logger.info("Getting save list")
 
+        if self.sharded:
+            self.migrate()
+
         saves = []
-        for savefile_path in self.save_dir.iterdir():
-            if savefile_path.suffix == SAVEFILE_EXTENSION:
+        with lock_directory(self.save_dir):
+            for savefile_path in iter_save_files(self.save_dir):
                 logger.info("Found save file at '%s", savefile_path)
 
                 save = GameState()
-                save.load(savefile_path)
+                try:
+                    save.load(savefile_path)
+                except FileNotFoundError:
+                    # deleted since it was listed: delete() only locks its shard
+                    logger.info("Save file '%s' was deleted", savefile_path)
+                    continue
                 saves.append(save)
-            else:
-                logger.warning("Found non-savefile file at '%s'", savefile_path)
 
         logger.info("All saves: '%s'", saves)
         return saves
 
+    def load_data(self, state: GameState) -> None:
+        """
+        Load all the data of <state>, if it is a summary (see
+        GameState.summary). The saves listed by this class are always complete,
+        so this does nothing.
+        """
+
     def save_state(self, state: GameState) -> None:
         """
         Save a given state into a file. The filename is determined by the
@@ -75,8 +219,11 @@ class SaveManager:
         """
 
         path = self.get_path(state)
+        if self.compression is not None:
+            state.compression = self.compression
         logger.info("saving state of GameState '%s' at file '%s'", state, path)
         state.save(path)
+        SaveManager.generation += 1
 
     def get_path(self, state: GameState) -> Path:
         """
@@ -86,17 +233,70 @@ class SaveManager:
         If the filepath attribute is None, an unique UUID is generated and
         stored as the filepath.
 
+        If the saves are sharded and the state is still stored in the flat
+        layout, it is moved to its shard, and its filepath is updated.
+
         :param state: the state to get the path
         :return: the path where the state is saved
         """
         path = state.filepath
         if path is None:
             logger.warning("filepath for state '%s' was not set, creating uuid", state)
-            path = self.save_dir / (str(uuid()) + ".json")
+            path = self.resolve(str(uuid()) + SAVEFILE_EXTENSION)
+            path.parent.mkdir(parents=True, exist_ok=True)
             state.filepath = path
             logger.warning("uuid filepath for state '%s': '%s'", state, path)
+        elif self.sharded and path.parent == self.save_dir and path.exists():
+            path = self.migrate_file(path)
+            state.filepath = path
         return path
 
+    def resolve(self, filename: str) -> Path:
+        """
+        Return the path of the save file named <filename> in the current layout.
+        """
+        if self.sharded:
+            return shard_path(self.save_dir, filename)
+        return self.save_dir / filename
+
+    def migrate_file(self, path: Path) -> Path:
+        """
+        Move the save file at <path>, in the flat layout, to its shard, and
+        return its new path.
+
+        If the save already exists in its shard, it is replaced: the flat copy
+        can only have been written by a process that did not know about the
+        migration, so it is the most recent one.
+        """
+        target = shard_path(self.save_dir, path.name)
+        target.parent.mkdir(parents=True, exist_ok=True)
+
+        logger.info("Moving save file '%s' to '%s'", path, target)
+        # the save leaves the save directory and enters the shard directory
+        with lock_directory(self.save_dir, exclusive=True), lock_directory(
+            target.parent
+        ):
+            try:
+                with lock_file(path, exclusive=True):
+                    os.replace(path, target)
+            except FileNotFoundError:
+                logger.info("'%s' was already moved by another process", path)
+        return target
+
+    def migrate(self) -> int:
+        """
+        Move every save in the flat layout to its shard.
+
+        :return: the number of moved saves
+        """
+        flat_saves = list(iter_save_files(self.save_dir, levels=0))
+        for path in flat_saves:
+            self.migrate_file(path)
+
+        if flat_saves:
+            logger.info("Moved %s saves to the sharded layout", len(flat_saves))
+        return len(flat_saves)
+
     def rename(self, state: GameState, new_name: str) -> None:
         """
         Rename a save
@@ -107,7 +307,8 @@ class SaveManager:
             "Rename state '%s' from '%s' to '%s'", state, state.data["name"], new_name
         )
         state.data["name"] = new_name
-        state.save()
+        state.save(self.get_path(state))
+        SaveManager.generation += 1
 
     def delete(self, state: GameState) -> None:
         """
@@ -118,4 +319,9 @@ class SaveManager:
         path = self.get_path(state)
 
         logger.warning("Deleting file: '%s'", path)
-        path.unlink()
+        # wait until no other process reads or writes the save
+        with lock_directory(path.parent, exclusive=True), lock_file(
+            path, exclusive=True
+        ):
+            path.unlink()
+        SaveManager.generation += 1
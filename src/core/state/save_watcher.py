@@ -0,0 +1,454 @@
+"""
+This file contains the SaveWatcher class, which reports saves that are added, modified or deleted
+in the save directory, for example by another instance of the game.
+"""
+
+# ------------------------------------------------------------------------------
+#  This file is part of Universal Sandbox.
+#
+#  Copyright (C) © 2020 Khaïs COLIN <logistic-bot@protonmail.com>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+import ctypes
+import ctypes.util
+import logging
+import os
+import struct
+import sys
+from pathlib import Path
+from time import monotonic
+from typing import Callable, Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+from src.core.state.save_manager import (
+    is_shard_name,
+    iter_save_files,
+    SAVE_DIRECTORY,
+    SAVEFILE_EXTENSION,
+    SHARD_LEVELS,
+)
+
+logger = logging.getLogger(__name__)
+
+ADDED = "added"
+MODIFIED = "modified"
+DELETED = "deleted"
+
+# Minimum number of seconds between two scans of the save directory, when inotify is not
+# available.
+POLL_INTERVAL = 1.0
+
+# inotify constants, from <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = (
+    IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_ONLYDIR
+)
+EVENT_HEADER = struct.Struct("iIII")
+READ_SIZE = 64 * 1024
+
+
+class SaveEvent(NamedTuple):
+    """
+    A change of a save file. kind is one of ADDED, MODIFIED and DELETED.
+    """
+
+    kind: str
+    path: Path
+
+
+SaveEventCallback = Callable[[SaveEvent], None]
+
+
+class _Listing(NamedTuple):
+    """
+    The content of a directory of the save directory when it was last listed: its modification
+    time, the modification time of each of its saves, and its shard directories.
+    """
+
+    mtime: int
+    saves: Dict[Path, int]
+    shards: List[Path]
+
+
+class _Inotify:
+    """
+    A minimal non-blocking inotify instance watching directories, using ctypes.
+    """
+
+    def __init__(self, libc: ctypes.CDLL, file_descriptor: int) -> None:
+        self.libc = libc
+        self.file_descriptor = file_descriptor
+        self.directories: Dict[int, Path] = {}
+
+    @classmethod
+    def create(cls) -> Optional["_Inotify"]:
+        """
+        Return a new inotify instance, or None if inotify is not available.
+        """
+        if not sys.platform.startswith("linux"):
+            return None
+
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            file_descriptor = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+            if file_descriptor < 0:
+                raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        except (OSError, AttributeError):
+            logger.warning("inotify is not available", exc_info=True)
+            return None
+
+        return cls(libc, file_descriptor)
+
+    def add_watch(self, directory: Path) -> None:
+        """
+        Watch <directory>. Raises OSError if it can not be watched, for example
+        because there are too many watches.
+        """
+        watch = self.libc.inotify_add_watch(
+            self.file_descriptor, os.fsencode(directory), WATCH_MASK
+        )
+        if watch < 0:
+            raise OSError(ctypes.get_errno(), f"Can not watch '{directory}'")
+        self.directories[watch] = directory
+
+    def read(self) -> Optional[List[Tuple[int, Path]]]:
+        """
+        Return the (mask, path) of every pending event, without blocking. Return None if events
+        were lost because the event queue overflowed.
+        """
+        events: List[Tuple[int, Path]] = []
+        while True:
+            try:
+                buffer = os.read(self.file_descriptor, READ_SIZE)
+            except BlockingIOError:
+                return events
+
+            offset = 0
+            while offset < len(buffer):
+                watch, mask, _, length = EVENT_HEADER.unpack_from(buffer, offset)
+                offset += EVENT_HEADER.size
+                name = os.fsdecode(buffer[offset:offset + length].rstrip(b"\0"))
+                offset += length
+
+                if mask & IN_Q_OVERFLOW:
+                    return None
+                if watch in self.directories:
+                    events.append((mask, self.directories[watch] / name))
+
+    def close(self) -> None:
+        """
+        Stop watching.
+        """
+        os.close(self.file_descriptor)
+
+
+class SaveWatcher:
+    """
+    Watches a save directory, and publishes a SaveEvent for every save that is added, modified or
+    deleted.
+
+    On Linux, inotify is used, so checking for changes costs nothing when nothing changed.
+    Elsewhere, or if inotify is not available, the directory is scanned at most once every
+    <poll_interval> seconds. A scan only lists the directories whose modification time changed
+    since the previous scan, to find the saves that were added or deleted. Writing a file does
+    not change the modification time of its directory, so the modification time of every known
+    save is also compared.
+
+    Both the flat and the sharded save layouts are supported. With inotify, every shard
+    directory is watched, including the ones created later.
+
+    The watcher never blocks: call poll() regularly, for example while waiting for a key press.
+
+    The changes are found from the moment the watcher is created. To also find the changes made
+    before, since the saves were loaded, give the modification time of each loaded save file as
+    <baseline> (see GameState.file_mtime): the first poll() returns the differences between the
+    baseline and the save directory.
+    """
+
+    def __init__(
+        self,
+        directory: Path = SAVE_DIRECTORY,
+        poll_interval: float = POLL_INTERVAL,
+        baseline: Optional[Mapping[Path, int]] = None,
+    ) -> None:
+        self.directory = directory
+        self.poll_interval = poll_interval
+        self._subscribers: List[SaveEventCallback] = []
+
+        self._inotify = _Inotify.create()
+        # the saves known by inotify, and the directories known by polling
+        self._mtimes: Dict[Path, int] = {}
+        self._listings: Dict[Path, _Listing] = {}
+        if self._inotify is not None:
+            self._watch(directory, SHARD_LEVELS)
+        self._mtimes = self._scan()
+        self._last_scan = monotonic()
+        # the changes since the baseline, returned by the first poll()
+        self._pending = (
+            self._compare(baseline, self._mtimes) if baseline is not None else []
+        )
+
+        logger.info(
+            "Watching save directory '%s' using %s",
+            directory,
+            "inotify" if self._inotify is not None else "polling",
+        )
+
+    def subscribe(self, callback: SaveEventCallback) -> None:
+        """
+        Call <callback> with each event found by poll().
+        """
+        self._subscribers.append(callback)
+
+    def poll(self) -> List[SaveEvent]:
+        """
+        Return the changes since the last call, after publishing them to the subscribers.
+        """
+        events, self._pending = self._pending, []
+        if self._inotify is not None:
+            events += self._read_inotify()
+        elif monotonic() - self._last_scan >= self.poll_interval:
+            events += self._rescan()
+
+        for event in events:
+            logger.info("Save %s: '%s'", event.kind, event.path)
+            for callback in self._subscribers:
+                callback(event)
+        return events
+
+    def close(self) -> None:
+        """
+        Stop watching the directory.
+        """
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+
+    def _watch(self, directory: Path, levels: int) -> None:
+        """
+        Watch <directory> and its shard directories, falling back to polling if
+        they can not be watched.
+        """
+        if self._inotify is None:
+            return  # already fell back to polling
+
+        try:
+            self._inotify.add_watch(directory)
+            if levels > 0:
+                with os.scandir(directory) as entries:
+                    shards = [
+                        Path(entry.path)
+                        for entry in entries
+                        if entry.is_dir() and is_shard_name(entry.name)
+                    ]
+                for shard in shards:
+                    self._watch(shard, levels - 1)
+        except OSError:
+            logger.warning(
+                "Can not watch '%s', falling back to polling", directory, exc_info=True
+            )
+            self.close()
+
+    def _levels(self, directory: Path) -> int:
+        """
+        Return the number of levels of shard directories below <directory>.
+        """
+        return SHARD_LEVELS - len(directory.relative_to(self.directory).parts)
+
+    def _scan(self) -> Dict[Path, int]:
+        """
+        List the whole save directory, and return the modification time of every save.
+        """
+        self._listings = {}
+        self._rescan_directory(self.directory, SHARD_LEVELS, [])
+        return {
+            path: mtime
+            for listing in self._listings.values()
+            for path, mtime in listing.saves.items()
+        }
+
+    def _rescan(self) -> List[SaveEvent]:
+        self._last_scan = monotonic()
+        if self._inotify is None:
+            events: List[SaveEvent] = []
+            self._rescan_directory(self.directory, SHARD_LEVELS, events)
+            return events
+
+        # inotify events were lost: compare the whole directory with the known saves
+        mtimes = self._scan()
+        events = self._compare(self._mtimes, mtimes)
+        self._mtimes = mtimes
+        return events
+
+    @staticmethod
+    def _compare(old: Mapping[Path, int], new: Mapping[Path, int]) -> List[SaveEvent]:
+        """
+        Return the changes from the saves in <old> to the saves in <new>, given as the
+        modification time of each save.
+        """
+        events = []
+        for path, mtime in new.items():
+            if path not in old:
+                events.append(SaveEvent(ADDED, path))
+            elif mtime != old[path]:
+                events.append(SaveEvent(MODIFIED, path))
+        for path in old.keys() - new.keys():
+            events.append(SaveEvent(DELETED, path))
+        return events
+
+    def _rescan_directory(
+        self, directory: Path, levels: int, events: List[SaveEvent]
+    ) -> None:
+        """
+        Add the changes in <directory> and its shard directories since they were last listed to
+        <events>. Directories that did not change are not listed again.
+        """
+        old = self._listings.get(directory)
+        try:
+            mtime = directory.stat().st_mtime_ns
+            if old is not None and old.mtime == mtime:
+                new = old
+                self._restat(old, events)
+            else:
+                new = self._list(directory, levels, mtime)
+        except FileNotFoundError:
+            self._forget(directory, events)
+            return
+
+        if new is not old:
+            old_saves = old.saves if old is not None else {}
+            for path, save_mtime in new.saves.items():
+                if path not in old_saves:
+                    events.append(SaveEvent(ADDED, path))
+                elif save_mtime != old_saves[path]:
+                    events.append(SaveEvent(MODIFIED, path))
+            for path in old_saves.keys() - new.saves.keys():
+                events.append(SaveEvent(DELETED, path))
+            for shard in set(old.shards if old is not None else ()) - set(new.shards):
+                self._forget(shard, events)
+            self._listings[directory] = new
+
+        for shard in new.shards:
+            self._rescan_directory(shard, levels - 1, events)
+
+    @staticmethod
+    def _restat(listing: _Listing, events: List[SaveEvent]) -> None:
+        """
+        Add the saves of <listing> that were modified since they were listed to <events>, and
+        update their modification time. The directory of the listing did not change, so no save
+        was added or deleted.
+        """
+        for path, save_mtime in listing.saves.items():
+            try:
+                mtime = path.stat().st_mtime_ns
+            except FileNotFoundError:
+                continue  # deleted since the directory was checked, found by the next scan
+            if mtime != save_mtime:
+                listing.saves[path] = mtime
+                events.append(SaveEvent(MODIFIED, path))
+
+    @staticmethod
+    def _list(directory: Path, levels: int, mtime: int) -> _Listing:
+        """
+        List <directory>, whose modification time is <mtime>. Raises FileNotFoundError if it
+        was deleted.
+        """
+        saves = {}
+        shards = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                path = Path(entry.path)
+                if entry.is_dir() and is_shard_name(entry.name):
+                    if levels > 0:
+                        shards.append(path)
+                elif path.suffix == SAVEFILE_EXTENSION and entry.is_file():
+                    try:
+                        saves[path] = entry.stat().st_mtime_ns
+                    except FileNotFoundError:
+                        pass  # deleted since it was listed
+        return _Listing(mtime, saves, shards)
+
+    def _forget(self, directory: Path, events: List[SaveEvent]) -> None:
+        """
+        Add the deletion of every save listed in <directory> and its shard directories to
+        <events>, after <directory> was deleted.
+        """
+        listing = self._listings.pop(directory, None)
+        if listing is None:
+            return
+        events.extend(SaveEvent(DELETED, path) for path in listing.saves)
+        for shard in listing.shards:
+            self._forget(shard, events)
+
+    def _read_inotify(self) -> List[SaveEvent]:
+        assert self._inotify is not None
+        raw_events = self._inotify.read()
+        if raw_events is None:
+            logger.warning("inotify queue overflowed, rescanning save directory")
+            return self._rescan()
+
+        # Only the last change of each file matters, and files are only reported once they
+        # have been completely written.
+        changed: Dict[Path, int] = {}
+        for mask, path in raw_events:
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO) and is_shard_name(path.name):
+                    self._add_shard(path, changed)
+            elif path.suffix == SAVEFILE_EXTENSION and not mask & IN_CREATE:
+                changed[path] = mask
+
+        events = []
+        for path, mask in changed.items():
+            if mask & (IN_DELETE | IN_MOVED_FROM):
+                if path in self._mtimes:
+                    del self._mtimes[path]
+                    events.append(SaveEvent(DELETED, path))
+                continue
+
+            # the modification time is compared by _rescan() if events are lost
+            try:
+                mtime = path.stat().st_mtime_ns
+            except FileNotFoundError:
+                continue  # deleted since, the deletion is reported next
+            kind = MODIFIED if path in self._mtimes else ADDED
+            self._mtimes[path] = mtime
+            events.append(SaveEvent(kind, path))
+
+        if self._inotify is None:
+            # a new shard could not be watched: poll from now on, starting from the saves
+            # reported above
+            self._scan()
+        return events
+
+    def _add_shard(self, directory: Path, changed: Dict[Path, int]) -> None:
+        """
+        Watch the new shard <directory>, and add the saves already written in it to <changed>.
+        """
+        levels = self._levels(directory)
+        if levels < 0:
+            return
+
+        self._watch(directory, levels)
+        # saves may have been written before the directory was watched
+        for path in iter_save_files(directory, levels):
+            changed.setdefault(path, IN_CLOSE_WRITE)
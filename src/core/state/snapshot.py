@@ -0,0 +1,96 @@
+"""
+This file contains the StateSnapshot class, an immutable copy of the data of a GameState which
+shares unchanged sections with the previous snapshot of the same state.
+"""
+
+# ------------------------------------------------------------------------------
+#  This file is part of Universal Sandbox.
+#
+#  Copyright (C) © 2020 Khaïs COLIN <logistic-bot@protonmail.com>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+import logging
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, Set
+
+from src.core.state.tracked_dict import untracked
+
+logger = logging.getLogger(__name__)
+
+JSON = Any
+
+
+class StateSnapshot(Mapping[str, JSON]):
+    """
+    An immutable snapshot of the data of a GameState, as a mapping from top-level sections to
+    their value. Use GameState.snapshot() to create one.
+
+    A snapshot only copies the sections that changed since the previous snapshot of the same
+    state; the other sections are the very same objects as in the previous snapshot. These
+    shared objects are never modified, which is why reading a section returns a copy.
+
+    Because unchanged sections are shared, comparing two snapshots of the same state only needs
+    an identity check per section, see changed_sections().
+    """
+
+    def __init__(
+        self,
+        data: Mapping[str, JSON],
+        changed: Optional[Iterable[str]] = None,
+        previous: Optional["StateSnapshot"] = None,
+    ) -> None:
+        """
+        Create a snapshot of <data>.
+
+        If <previous> is given, only the sections in <changed> are copied from <data>, the
+        others are shared with <previous>. Otherwise every section is copied.
+        """
+        if previous is None or changed is None:
+            self._sections: Dict[str, JSON] = {
+                section: untracked(value) for section, value in data.items()
+            }
+        else:
+            self._sections = dict(previous._sections)  # pylint: disable=W0212
+            for section in changed:
+                if section in data:
+                    self._sections[section] = untracked(data[section])
+                else:
+                    self._sections.pop(section, None)
+
+    def __getitem__(self, section: str) -> JSON:
+        return untracked(self._sections[section])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._sections)
+
+    def __len__(self) -> int:
+        return len(self._sections)
+
+    def shares(self, other: "StateSnapshot", section: str) -> bool:
+        """
+        Return True if this snapshot and <other> share the same copy of <section> (or if both
+        do not have it).
+        """
+        # pylint: disable=W0212
+        return self._sections.get(section) is other._sections.get(section)
+
+    def changed_sections(self, other: "StateSnapshot") -> Set[str]:
+        """
+        Return the sections that are not shared between this snapshot and <other>.
+
+        For two snapshots of the same state, these are the sections that changed between them
+        (or a superset of them, if a section was changed and then changed back).
+        """
+        sections = set(self._sections) | set(other._sections)  # pylint: disable=W0212
+        return {section for section in sections if not self.shares(other, section)}
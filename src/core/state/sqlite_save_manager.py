@@ -0,0 +1,257 @@
+"""
+This file contains the SqliteSaveManager class, a SaveManager that keeps all saves in a single
+SQLite database instead of one JSON file per save.
+"""
+
+# ------------------------------------------------------------------------------
+#  This file is part of Universal Sandbox.
+#
+#  Copyright (C) © 2020 Khaïs COLIN <logistic-bot@protonmail.com>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+import json
+import logging
+import sqlite3
+from pathlib import Path
+from typing import List
+
+from src import GAME_ROOT_DIR
+from src.core.state.game_state import GameState, JSON
+from src.core.state.save_manager import (
+    iter_save_files,
+    SaveManager,
+    SAVEFILE_EXTENSION,
+    SAVE_DIRECTORY,
+)
+
+SAVE_DATABASE = GAME_ROOT_DIR / "saves.sqlite3"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS saves (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    save_date TEXT,
+    brand TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS saves_name ON saves (name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS saves_save_date ON saves (save_date);
+CREATE INDEX IF NOT EXISTS saves_brand ON saves (brand);
+"""
+
+logger = logging.getLogger(__name__)
+
+
+class SqliteSaveManager(SaveManager):
+    """
+    This class manages a group of Saves stored in a single SQLite database.
+
+    Each save is one row. The name, save date and computer brand are stored in indexed columns,
+    and the full JSON data is stored in the data column.
+
+    Listing the saves only reads the indexed columns, and returns summaries (see
+    GameState.summary): the data column of a save is only read and decoded by load_data(),
+    when the save is used. Saving or renaming a summary loads its data first.
+
+    Saves are identified by the stem of their filepath (the uuid), exactly like the JSON
+    backend, so a state can be moved between both backends without changing its identity. The
+    filepath of a state loaded from the database is never written to.
+    """
+
+    save_files = False
+
+    def __init__(self, database: Path = SAVE_DATABASE) -> None:
+        super().__init__()
+        self.database = database
+        logger.info("Opening save database '%s'", self.database)
+
+        self.connection = sqlite3.connect(str(self.database))
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript(SCHEMA)
+
+    @property
+    def saves(self) -> List[GameState]:
+        """
+        Return a list of the summaries of all saves in the database, sorted by name
+        (case-insensitive).
+        """
+        logger.info("Getting save list from database")
+
+        rows = self.connection.execute(
+            "SELECT id, name, save_date, brand FROM saves ORDER BY name COLLATE NOCASE"
+        )
+
+        saves = [self._summary_from_row(*row) for row in rows]
+
+        logger.info("All saves: '%s'", saves)
+        return saves
+
+    def load_data(self, state: GameState) -> None:
+        """
+        Load all the data of <state>, if it is a summary.
+
+        :raise FileNotFoundError: if the save is no longer in the database
+        """
+        if not state.summary:
+            return
+
+        save_id = self.get_path(state).stem
+        logger.info("Loading data of save '%s' from database", save_id)
+        row = self.connection.execute(
+            "SELECT data FROM saves WHERE id = ?", (save_id,)
+        ).fetchone()
+        if row is None:
+            raise FileNotFoundError(f"There is no save '{save_id}' in the database")
+
+        state.data = json.loads(row[0])
+        state.summary = False
+        state.mark_clean()
+        state.upgrade()
+
+    def save_state(self, state: GameState) -> None:
+        """
+        Save a given state into the database, replacing the previous version of this save if
+        there was one. Nothing is written if the save is already in the database and did not
+        change.
+        :param state: The state to save
+        :return: None
+        """
+        self.load_data(state)
+        save_id = self.get_path(state).stem
+        if not state.dirty and self._contains(save_id):
+            logger.info("Nothing changed, skipping save of '%s'", save_id)
+            return
+
+        logger.info("saving state of GameState '%s' with id '%s'", state, save_id)
+        logger.info('Changed sections: "%s"', state.diff())
+
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO saves (id, name, save_date, brand, data) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    save_id,
+                    state.data["name"],
+                    state.data["metadata"]["save_date"],
+                    state.data["progress"]["computer-brand"],
+                    _dump(state.data),
+                ),
+            )
+        state.mark_clean()
+        SaveManager.generation += 1
+
+    def rename(self, state: GameState, new_name: str) -> None:
+        """
+        Rename a save. Only the row of this save is updated.
+        :param state: The save to be renamed
+        :param new_name: The new name of the save
+        """
+        self.load_data(state)
+        logger.info(
+            "Rename state '%s' from '%s' to '%s'", state, state.data["name"], new_name
+        )
+        state.data["name"] = new_name
+
+        with self.connection:
+            self.connection.execute(
+                "UPDATE saves SET name = ?, data = ? WHERE id = ?",
+                (new_name, _dump(state.data), self.get_path(state).stem),
+            )
+        state.mark_clean()
+        SaveManager.generation += 1
+
+    def delete(self, state: GameState) -> None:
+        """
+        Delete a state.
+        :param state: The state to delete.
+        """
+        save_id = self.get_path(state).stem
+        logger.warning("Deleting save from database: '%s'", save_id)
+
+        with self.connection:
+            self.connection.execute("DELETE FROM saves WHERE id = ?", (save_id,))
+        SaveManager.generation += 1
+
+    def import_json_saves(self, directory: Path = SAVE_DIRECTORY) -> int:
+        """
+        Import every JSON save in <directory>, flat or sharded, into the database, in a single
+        transaction.
+
+        Saves that are already in the database are not overwritten, so this can safely be run
+        more than once.
+
+        :param directory: the directory containing the JSON saves
+        :return: the number of imported saves
+        """
+        logger.info("Importing JSON saves from '%s'", directory)
+
+        rows = []
+        for savefile_path in iter_save_files(directory):
+            state = GameState()
+            state.load(savefile_path)
+            rows.append(
+                (
+                    savefile_path.stem,
+                    state.data["name"],
+                    state.data["metadata"]["save_date"],
+                    state.data["progress"]["computer-brand"],
+                    _dump(state.data),
+                )
+            )
+
+        with self.connection:
+            before = self.connection.total_changes
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO saves (id, name, save_date, brand, data) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            imported = self.connection.total_changes - before
+        if imported:
+            SaveManager.generation += 1
+
+        logger.info("Imported %s of %s JSON saves", imported, len(rows))
+        return imported
+
+    def close(self) -> None:
+        """
+        Close the connection to the database.
+        """
+        logger.info("Closing save database '%s'", self.database)
+        self.connection.close()
+
+    def _contains(self, save_id: str) -> bool:
+        row = self.connection.execute(
+            "SELECT 1 FROM saves WHERE id = ?", (save_id,)
+        ).fetchone()
+        return row is not None
+
+    def _summary_from_row(
+        self, save_id: str, name: str, save_date: str, brand: str
+    ) -> GameState:
+        state = GameState()
+        state.data = {
+            "name": name,
+            "metadata": {"save_date": save_date},
+            "progress": {"computer-brand": brand},
+        }
+        state.summary = True
+        state.filepath = self.save_dir / (save_id + SAVEFILE_EXTENSION)
+        state.mark_clean()
+        return state
+
+
+def _dump(data: JSON) -> str:
+    return json.dumps(data, separators=(",", ":"), sort_keys=True)
@@ -0,0 +1,292 @@
+"""
+This file contains the TrackedDict and TrackedList classes, which record which parts of a JSON
+document were changed.
+"""
+
+# ------------------------------------------------------------------------------
+#  This file is part of Universal Sandbox.
+#
+#  Copyright (C) © 2020 Khaïs COLIN <logistic-bot@protonmail.com>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+JSONPath = Tuple[Any, ...]
+Journal = Set[JSONPath]
+
+
+class _Deleted:
+    """
+    Marker used by diffs for sections that were removed.
+    """
+
+    def __repr__(self) -> str:
+        return "DELETED"
+
+
+DELETED = _Deleted()
+
+
+def _wrap(value: Any, path: JSONPath, journals: List[Journal]) -> Any:
+    """
+    Wrap dicts and lists into their tracked counterparts, so that changes to nested values are
+    recorded too. Other values are returned unchanged.
+    """
+    if isinstance(value, dict):
+        return TrackedDict(value, path, journals)
+    if isinstance(value, list):
+        return TrackedList(value, path, journals)
+    return value
+
+
+def untracked(value: Any) -> Any:
+    """
+    Return a deep copy of <value> made of plain dicts and lists.
+    """
+    if isinstance(value, dict):
+        return {key: untracked(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [untracked(item) for item in value]
+    return value
+
+
+class TrackedDict(Dict[str, Any]):
+    """
+    A dict that records the path of every key that is set or deleted, including in nested dicts
+    and lists.
+
+    All TrackedDicts and TrackedLists of the same document share their journals. A journal is
+    a set of paths. A path is a tuple of keys (and list indexes) leading from the root of the
+    document to the changed value. The empty path () means that the whole document changed.
+
+    Every change is recorded in every journal. The first journal is the main one, returned by
+    the journal property; more can be added with add_journal() by code that needs to know what
+    changed since a different point in time. Each journal is cleared by its owner.
+
+    Dirty paths are only recorded, never collapsed, so a path and one of its ancestors can both
+    be in a journal.
+    """
+
+    def __init__(
+        self,
+        data: Optional[Dict[str, Any]] = None,
+        path: JSONPath = (),
+        journals: Optional[List[Journal]] = None,
+    ) -> None:
+        super().__init__()
+        self._path = path
+        self._journals: List[Journal] = [set()] if journals is None else journals
+
+        if data is not None:
+            for key, value in data.items():
+                super().__setitem__(key, _wrap(value, path + (key,), self._journals))
+
+    @property
+    def journal(self) -> Journal:
+        """
+        Return the main set of changed paths of the whole document.
+        """
+        return self._journals[0]
+
+    def add_journal(self) -> Journal:
+        """
+        Create a new, empty journal for the whole document, and return it.
+        """
+        journal: Journal = set()
+        self._journals.append(journal)
+        return journal
+
+    def mark_dirty(self, path: JSONPath = ()) -> None:
+        """
+        Record <path> (relative to this dict) as changed in every journal.
+        """
+        for journal in self._journals:
+            journal.add(self._path + path)
+
+    def mark_clean(self) -> None:
+        """
+        Forget all changes recorded in the main journal.
+        """
+        self.journal.clear()
+
+    def _move(self, path: JSONPath) -> None:
+        """
+        Set the path of this dict to <path>, and update the paths of the nested dicts and lists.
+        Used by TrackedList when its items change index.
+        """
+        self._path = path
+        for key, value in self.items():
+            if isinstance(value, (TrackedDict, TrackedList)):
+                value._move(path + (key,))  # pylint: disable=W0212
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        super().__setitem__(key, _wrap(value, self._path + (key,), self._journals))
+        self.mark_dirty((key,))
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self.mark_dirty((key,))
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def __ior__(self, other: Any) -> "TrackedDict":  # type: ignore
+        self.update(other)
+        return self
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key: str, *args: Any) -> Any:
+        if key in self:
+            self.mark_dirty((key,))
+        return super().pop(key, *args)
+
+    def popitem(self) -> Tuple[str, Any]:
+        key, value = super().popitem()
+        self.mark_dirty((key,))
+        return key, value
+
+    def clear(self) -> None:
+        super().clear()
+        self.mark_dirty()
+
+
+class TrackedList(List[Any]):
+    """
+    A list that records itself as changed in the journal of its document whenever it is
+    modified. See TrackedDict for details.
+
+    When items change index (insert(), pop(), sort(), ...), the paths of the nested dicts and
+    lists are updated, so that their later changes are recorded at their new index.
+    """
+
+    def __init__(
+        self,
+        data: Optional[Iterable[Any]] = None,
+        path: JSONPath = (),
+        journals: Optional[List[Journal]] = None,
+    ) -> None:
+        self._path = path
+        self._journals: List[Journal] = [set()] if journals is None else journals
+        super().__init__(self._wrap_items(data or []))
+
+    def _wrap_items(self, items: Iterable[Any]) -> List[Any]:
+        return [
+            _wrap(item, self._path + (index,), self._journals)
+            for index, item in enumerate(items)
+        ]
+
+    def _mark_dirty(self) -> None:
+        for journal in self._journals:
+            journal.add(self._path)
+
+    def _move(self, path: JSONPath) -> None:
+        """
+        Set the path of this list to <path>, and update the paths of the nested dicts and lists.
+        """
+        self._path = path
+        self._reindex()
+
+    def _reindex(self, start: int = 0) -> None:
+        """
+        Update the paths of the nested dicts and lists from index <start>, after they changed
+        index.
+        """
+        for index in range(max(start, 0), len(self)):
+            value = super().__getitem__(index)
+            if isinstance(value, (TrackedDict, TrackedList)):
+                value._move(self._path + (index,))  # pylint: disable=W0212
+
+    def _index(self, index: int) -> int:
+        """
+        Return <index> counted from the start of the list, if it is negative.
+        """
+        return index + len(self) if index < 0 else index
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        if isinstance(index, slice):
+            super().__setitem__(index, self._wrap_items(value))
+            # the slice can change the length of the list
+            self._reindex()
+        else:
+            index = self._index(index)
+            super().__setitem__(index, _wrap(value, self._path + (index,), self._journals))
+        self._mark_dirty()
+
+    def __delitem__(self, index: Any) -> None:
+        start = 0 if isinstance(index, slice) else self._index(index)
+        super().__delitem__(index)
+        self._reindex(start)
+        self._mark_dirty()
+
+    def __iadd__(self, other: Iterable[Any]) -> "TrackedList":  # type: ignore
+        self.extend(other)
+        return self
+
+    def __imul__(self, count: int) -> "TrackedList":  # type: ignore
+        if count <= 0:
+            self.clear()
+        else:
+            # the copies are new dicts and lists, with their own paths
+            self.extend(untracked(list(self)) * (count - 1))
+        return self
+
+    def append(self, value: Any) -> None:
+        super().append(_wrap(value, self._path + (len(self),), self._journals))
+        self._mark_dirty()
+
+    def extend(self, values: Iterable[Any]) -> None:
+        for value in values:
+            self.append(value)
+
+    def insert(self, index: Any, value: Any) -> None:
+        index = min(max(self._index(index), 0), len(self))  # like list.insert()
+        super().insert(index, _wrap(value, self._path + (index,), self._journals))
+        self._reindex(index + 1)
+        self._mark_dirty()
+
+    def pop(self, index: Any = -1) -> Any:
+        start = self._index(index)
+        value = super().pop(index)
+        self._reindex(start)
+        self._mark_dirty()
+        return value
+
+    def remove(self, value: Any) -> None:
+        start = self.index(value)
+        super().remove(value)
+        self._reindex(start)
+        self._mark_dirty()
+
+    def clear(self) -> None:
+        super().clear()
+        self._mark_dirty()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        super().sort(*args, **kwargs)
+        self._reindex()
+        self._mark_dirty()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._reindex()
+        self._mark_dirty()
@@ -0,0 +1,139 @@
+"""
+This file contains the functions measuring the width of text on the terminal, in cells.
+
+len() is wrong for text that is not ASCII: wide characters (for example CJK ideographs) take two
+cells, and combining characters (for example accents written as a separate codepoint) take none.
+All the layout code (centring, padding, areas of widgets) should use text_width() instead.
+"""
+
+# ------------------------------------------------------------------------------
+#  This file is part of Universal Sandbox.
+#
+#  Copyright (C) © 2020 Khaïs COLIN <logistic-bot@protonmail.com>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+from bisect import bisect_right
+from functools import lru_cache
+from unicodedata import category
+
+# The codepoints taking two cells (East Asian Wide and Fullwidth characters, and emoji), as
+# sorted and non-overlapping inclusive ranges.
+WIDE_RANGES = (
+    (0x1100, 0x115F),  # Hangul Jamo initial consonants
+    (0x2329, 0x232A),  # angle brackets
+    (0x2E80, 0x303E),  # CJK radicals, Kangxi radicals, CJK symbols and punctuation
+    (0x3041, 0x33FF),  # Hiragana, Katakana, Bopomofo, Hangul compatibility Jamo, ...
+    (0x3400, 0x4DBF),  # CJK unified ideographs extension A
+    (0x4E00, 0x9FFF),  # CJK unified ideographs
+    (0xA000, 0xA4CF),  # Yi syllables and radicals
+    (0xA960, 0xA97F),  # Hangul Jamo extended A
+    (0xAC00, 0xD7A3),  # Hangul syllables
+    (0xF900, 0xFAFF),  # CJK compatibility ideographs
+    (0xFE10, 0xFE19),  # vertical forms
+    (0xFE30, 0xFE6F),  # CJK compatibility forms, small form variants
+    (0xFF00, 0xFF60),  # fullwidth forms
+    (0xFFE0, 0xFFE6),  # fullwidth signs
+    (0x1F300, 0x1F64F),  # miscellaneous symbols and pictographs, emoticons
+    (0x1F900, 0x1F9FF),  # supplemental symbols and pictographs
+    (0x20000, 0x2FFFD),  # CJK unified ideographs extensions B to F
+    (0x30000, 0x3FFFD),  # CJK unified ideographs extension G
+)
+_WIDE_STARTS = [start for start, _ in WIDE_RANGES]
+
+# The general categories of the characters taking no cell: nonspacing and enclosing marks, and
+# format characters (for example the zero width joiner).
+ZERO_WIDTH_CATEGORIES = frozenset(("Mn", "Me", "Cf"))
+
+# Number of distinct strings whose width is remembered.
+WIDTH_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=None)
+def char_width(char: str) -> int:
+    """
+    Return the number of cells taken by <char> on the terminal: 0, 1 or 2.
+    """
+    codepoint = ord(char)
+    if 0x20 <= codepoint < 0x7F:
+        return 1
+
+    index = bisect_right(_WIDE_STARTS, codepoint) - 1
+    if index >= 0 and codepoint <= WIDE_RANGES[index][1]:
+        return 2
+    if category(char) in ZERO_WIDTH_CATEGORIES or 0x1160 <= codepoint <= 0x11FF:
+        # Hangul Jamo vowels and final consonants are combined with the initial consonant
+        return 0
+    if codepoint < 0x20 or 0x7F <= codepoint < 0xA0:
+        return 0  # control characters
+    return 1
+
+
+@lru_cache(maxsize=WIDTH_CACHE_SIZE)
+def _text_width(text: str) -> int:
+    return sum(map(char_width, text))
+
+
+def text_width(text: str) -> int:
+    """
+    Return the number of cells taken by <text> on the terminal.
+
+    The width of ASCII text is its length. The width of other strings is cached, so that
+    measuring the same text again on every frame costs a dictionary lookup.
+    """
+    if text.isascii():
+        return len(text)
+    return _text_width(text)
+
+
+def pad(text: str, width: int) -> str:
+    """
+    Return <text> followed by enough spaces to take <width> cells, like str.ljust().
+    """
+    return text + " " * (width - text_width(text))
+
+
+def truncate(text: str, width: int) -> str:
+    """
+    Return the longest start of <text> that takes at most <width> cells.
+    """
+    if text.isascii():
+        return text[: max(width, 0)]
+
+    used = 0
+    for index, char in enumerate(text):
+        used += char_width(char)
+        if used > width:
+            return text[:index]
+    return text
+
+
+def skip_cells(text: str, width: int) -> str:
+    """
+    Return what is left of <text> after its first <width> cells, for example to clip it at the
+    left edge of the screen. A wide character cut in half is replaced by a space, so that the
+    rest of the text stays in the same cells.
+    """
+    if width <= 0:
+        return text
+    if text.isascii():
+        return text[width:]
+
+    used = 0
+    index = 0
+    # the combining characters of the last skipped character are skipped with it
+    while index < len(text) and (used < width or char_width(text[index]) == 0):
+        used += char_width(text[index])
+        index += 1
+    return " " * (used - width) + text[index:]
@@ -0,0 +1,120 @@
+"""
+This file contains the typesetting functions, which word-wrap and centre blocks of text for a
+given screen size, and cache the result.
+"""
+
+# ------------------------------------------------------------------------------
+#  This file is part of Universal Sandbox.
+#
+#  Copyright (C) © 2020 Khaïs COLIN <logistic-bot@protonmail.com>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+import logging
+from functools import lru_cache
+from typing import List, NamedTuple, Optional, Tuple
+
+from src.core.text_width import char_width, text_width
+
+logger = logging.getLogger(__name__)
+
+# Number of (text, width, height) layouts that are remembered.
+LAYOUT_CACHE_SIZE = 256
+
+
+class Placement(NamedTuple):
+    """
+    A line of typeset text, and its position relative to the top-left corner of the area it was
+    typeset in.
+    """
+
+    x_pos: int
+    y_pos: int
+    text: str
+
+
+Layout = Tuple[Placement, ...]
+
+
+def _split_at_width(word: str, width: int) -> Tuple[str, str]:
+    """
+    Split <word> into a head at most <width> cells wide, and the rest.
+    """
+    used = 0
+    for index, char in enumerate(word):
+        used += char_width(char)
+        if used > width:
+            return word[:max(index, 1)], word[max(index, 1):]
+    return word, ""
+
+
+def wrap(text: str, width: int) -> List[str]:
+    """
+    Return the lines of <text>, with the lines wider than <width> cells broken at spaces, and
+    the words wider than <width> broken anywhere.
+
+    Lines that fit are kept as they are, including their spaces, so that ASCII art that fits on
+    the screen is not changed.
+    """
+    assert width > 0, "Can not wrap text in less than one column"
+
+    lines = []
+    for paragraph in text.splitlines():
+        if text_width(paragraph) <= width:
+            lines.append(paragraph)
+            continue
+
+        line: Optional[str] = None
+        line_width = 0
+        for word in paragraph.split(" "):
+            word_width = text_width(word)
+            if line is not None and line_width + 1 + word_width <= width:
+                line = f"{line} {word}"
+                line_width += 1 + word_width
+                continue
+
+            if line is not None:
+                lines.append(line)
+            while word_width > width:
+                head, word = _split_at_width(word, width)
+                lines.append(head)
+                word_width = text_width(word)
+            line, line_width = word, word_width
+
+        if line is not None:
+            lines.append(line)
+    return lines
+
+
+@lru_cache(maxsize=LAYOUT_CACHE_SIZE)
+def typeset_centred(text: str, width: int, height: Optional[int] = None) -> Layout:
+    """
+    Word-wrap <text> to <width> cells, and return the placement of each line centred
+    horizontally in <width>. If <height> is given, the block of lines is also centred
+    vertically in <height> (it starts at the top if it is taller).
+
+    Layouts are cached by (text, width, height): typesetting the same text for the same screen
+    size again is a dictionary lookup, and hashing a string is only done once per string. When
+    the terminal is resized, the new size gives new keys, and the layouts for the old size are
+    evicted once they are no longer used.
+    """
+    lines = wrap(text, width)
+    top = max((height - len(lines)) // 2, 0) if height is not None else 0
+    layout = tuple(
+        Placement(round(width / 2 - text_width(line) / 2), top + index, line)
+        for index, line in enumerate(lines)
+    )
+
+    logger.debug("Typeset %s lines for width %s, height %s", len(layout), width, height)
+    return layout
@@ -1,527 +1,1077 @@
-"""
-Thie module contains user_interface facilities. Various class to simplify
-building user interfaces.
-"""
-
-# ------------------------------------------------------------------------------
-#  This file is part of Unconstrained self-modification.
-#
-#  Copyright (C) © 2020 Khaïs COLIN <logistic-bot@protonmail.com>
-#
-#  This program is free software: you can redistribute it and/or modify
-#  it under the terms of the GNU General Public License as published by
-#  the Free Software Foundation, either version 3 of the License, or
-#  (at your option) any later version.
-#
-#  This program is distributed in the hope that it will be useful,
-#  but WITHOUT ANY WARRANTY; without even the implied warranty of
-#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
-#  GNU General Public License for more details.
-#
-#  You should have received a copy of the GNU General Public License
-#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
-# ------------------------------------------------------------------------------
-
-import curses
-import logging
-from typing import Optional, List, Union, cast
-
-from src.core.render import CursesRenderer
-
-logger = logging.getLogger(__name__)
-
-
-class ListRenderer:
-    """
-    Allows to render a list of strings. This can also be used to select one of
-    the strings from the list.
-    """
-
-    def __init__(
-        self,
-        renderer: CursesRenderer,
-        x_pos: int,
-        y_pos: int,
-        items: Optional[List[str]] = None,
-        select_max_length: bool = False,
-        max_length: Optional[int] = None,
-        margin: int = 0,
-    ) -> None:
-        if items is None:
-            items = []
-
-        self._max_length = max_length
-        self._selected = True
-
-        self.y_pos = y_pos
-        self.x_pos = x_pos
-        self.items = items
-        self.renderer = renderer
-        self.index = 0
-
-        self.indent_selected = False
-        self._margin = margin
-        self.select_max_length = select_max_length
-        self.highlight_selected = True
-
-        logger.info(
-            "Created new ListRenderer at (%s, %s) with items '%s'", x_pos, y_pos, items
-        )
-
-    def set_margin(self, value: int) -> None:
-        """
-        Set the margin for this ListRenderer.
-
-        The margin dictates how many spaces should be added before and after each
-        element of the list.
-
-        Examples:
-            margin = 0:
-                `element 1`
-                `element 2`
-                `element 3`
-            margin = 1:
-                ` element 1 `
-                ` element 2 `
-                ` element 3 `
-            margin = 5:
-                `     element 1     `
-                `     element 2     `
-                `     element 3     `
-
-        """
-        self._margin = value
-
-    def get_margin(self) -> int:
-        """
-        Get the current margin for this ListRenderer.
-
-        See set_margin for a description of what a margin is.
-        """
-        return self._margin
-
-    margin = property(get_margin, set_margin)
-
-    def select_next(self) -> None:
-        """
-        Select the next element element in the list.
-        """
-        self.select(self.index + 1)
-
-    def select_previous(self) -> None:
-        """
-        Select the previous element element in the list.
-        """
-        self.select(self.index - 1)
-
-    def select(self, index: int) -> None:
-        """
-        Select a specified element in the list.
-
-        If the given index is out of range, no change is made.
-
-        The selected element is highlighed when the list is drawn. It can also
-        be indented if ListRenderer.indent_selected is set to True.
-
-        :param index: The index of the element to select.
-        """
-        try:
-            assert index < len(self.items)
-            assert index >= 0
-            self.index = index
-        except AssertionError:
-            logger.warning(
-                "Tried to select item at index %s but item does not exist. Items: %s",
-                index,
-                self.items,
-            )
-
-    def check_input(self, key: str) -> None:
-        """
-        Select the next or previous element in the list if the given key is
-        KEY_DOWN or KEY_UP, respectively.
-
-        This only has an effect when this list is selected.
-
-        (Selected means that  the list can be acted upon. It also serves to give
-        the user feedback  about whether the user can act on the list. When the
-        list is selected,  the currently selected element is highlighted. When
-        the list is not  selected, the currently selected element is not
-        highlighted as much.)
-        """
-        if self.selected:
-            if key == "KEY_DOWN":
-                self.select_next()
-            elif key == "KEY_UP":
-                self.select_previous()
-
-    @property
-    def selected_item(self) -> Optional[str]:
-        """
-        Return the currently selected item. If the cureent index is not usable,
-        return the first item (items[0]). If the items list is empty, return
-        None.
-        """
-        item: Optional[str]
-        try:
-            item = self.items[self.index]
-        except IndexError:  # if the item at the index does not exist..
-            try:
-                item = self.items[0]  # we try getting the first
-            except IndexError:  # if the list is empty
-                item = None  # we return none
-        return item
-
-    def get_selected_index(self) -> int:
-        """
-        Return the index of the currently selected item.
-        """
-        return self.index
-
-    def get_selected(self) -> bool:
-        """
-        Return True if the list is currently selected, False otherwise.
-        """
-        return self._selected
-
-    def set_selected(self, value: bool) -> None:
-        """
-        When given True, the list will be selected. When given False, the list
-        will be unselected.
-        """
-        self._selected = value
-
-    selected = property(get_selected, set_selected)
-
-    def get_max_length(self) -> int:
-        """
-        Get the length of the longest element of the list, or the minimum
-        highlight length.
-
-        max_length can be in two modes: Internal or external. The mode is
-        determined by whether the max_length was set or not.
-
-        Internal mode: (default)
-            Internal mode can be obtained by setting max_length to None. It is
-            also the default mode, which is used if max_length is not set at
-            all.
-
-            While in internal mode, get_max_length will return the length of the
-            longes element of the list.
-
-            select_max_length will select the length of the longest element,
-            automatically.
-
-            (dev note: this is because select_max_length uses get_max_length
-            internally)
-
-        External mode:
-            External mode can be obtained by setting max_length to any integer.
-            If the given integer is negative, zero, or smaller that the length
-            of the shortest element of the list, it will behave as if it were in
-            internal mode.
-
-            If highlight_max_length is True, then the ListRenderer will
-            highlight up to max_length for element that are shorter than
-            max_length and the whole element for elements that are longer.
-
-            While in external mode, get_max_length will return the length set by
-            set_max_length.
-
-        (dev note: not all of the described behavior is tested, please open an
-        issues if you experience any disrepancies)
-        """
-        if self._max_length is None:
-            lens = [len(item) for item in self.items]
-            logger.debug("lens: '%s'", lens)
-            max_length = max(lens)
-        else:
-            max_length = self._max_length
-
-        logger.debug("got max_length '%s'", max_length)
-        return max_length
-
-    def set_max_length(self, value: int) -> None:
-        """
-        If value is None, set the max_length mode to Internal. If value is not
-        None, set the max_length mode to External and set the max_length to the
-        given value.
-
-        See get_max_length for an extended explanation of what External and
-        Internal modes are.
-        """
-        self._max_length = value
-
-    max_length = property(get_max_length, set_max_length)
-
-    @property
-    def actual_width(self) -> int:
-        """
-        Returns the width taken by drawing the list.
-
-        It's a measure of how much vertical space will be altered when calling
-        the draw() method.
-
-        It takes into account margins, indent_selected and get_max_length.
-        """
-        text = " " * self.max_length
-        width = len(self.get_item_margins(text))
-        if self.indent_selected:
-            width += 1
-        logger.debug("got actual_width: '%s'", width)
-        return width
-
-    def draw(self) -> None:
-        # TODO: indent_selected should be customizable, how much should it be
-        # indented
-        """
-        Draw the list.
-
-        Possible options:
-         - margin: sets how many spaces should be inserted before and after each
-           item. See also get_item_margins()
-
-        See also draw_highlight_selected() for option to highlight the selected item.
-        """
-        for index, item in enumerate(self.items):
-            item = self.get_item_margins(item)
-
-            if self.indent_selected:
-                self.renderer.addtext(
-                    self.x_pos, self.y_pos + index, " " * (len(item) + 1)
-                )
-            self.renderer.addtext(self.x_pos, self.y_pos + index, item)
-
-        self.draw_highlight_selected()
-
-    def get_item_margins(self, item: Optional[str]) -> str:
-        """
-        Given an item string, return the item with the needed margins applied.
-
-        If select_max_length is True, we need to add a corresponding number of
-        spaces to the end of the item string, to make sure that if the item is
-        selected, the needed length will be highlighted. See also
-        get_max_length() (Internal mode) for more details.
-
-        If the given item is None, return an empty string.
-
-        See also set_margin()
-        """
-        if item is None:
-            item = ""
-
-        if self.select_max_length:
-            item += " " * (self.max_length - len(item))
-            logger.debug("item: '%s'", item)
-            assert isinstance(item, str)  # mypy
-            logger.debug("item len: '%s'", len(item))
-
-        item = " " * self.margin + str(item) + " " * self.margin
-        assert isinstance(item, str)  # mypy
-        return item
-
-    def draw_highlight_selected(self) -> None:
-        """
-        Highlight the selected item so that the user can see which item is
-        selected, but only if highlight_selected is True.
-
-        Options:
-            indent_selected: If True, the selected item will be indented to the
-                right by one character.
-            selected: If the list is selected, the selected item will be
-                highlighted brightly. If not, it will be highlighted greyly.
-        """
-        if self.highlight_selected:
-            item = self.get_item_margins(self.selected_item)
-
-            selected_x_pos = self.x_pos
-            if self.indent_selected:
-                selected_x_pos += 1
-
-            if self.selected:  # if selected
-                self.renderer.addtext(
-                    self.x_pos, self.y_pos + self.index, " " * self.max_length
-                )
-
-                self.renderer.addtext(
-                    selected_x_pos,
-                    self.y_pos + self.index,
-                    item,
-                    curses.A_BOLD | curses.A_REVERSE,
-                )
-            else:  # if not selected
-                self.renderer.addtext(
-                    self.x_pos,
-                    self.y_pos + self.index,
-                    item,
-                    curses.A_DIM | curses.A_REVERSE,
-                )
-
-
-class TreeListRenderer:
-    """
-    Allows to show two or more ListRenderer one after the other, with Automatic
-    navigation between the lists.
-
-    The lists can only be shown horizontally, with list 0 being on the left.
-
-    The lists are completely independent of each other, so dynamically changing
-    one list depending on which element is selected in another is not supported
-    by this class. It can however be done manually, and this functionallity is
-    planned.
-
-    Note: whenever we talk about the 'next' or 'previous' ListRenderer, we talk
-    about the ListRenderer directly to the right and left of the currently
-    selected one, respectively.
-
-    Layout: (the number indicates the index of the list)
-    +-----+ +-----+ +-----+
-    |     | |     | |     |
-    |  0  | |  1  | |  2  |
-    |     | |     | |     |
-    +-----+ +-----+ +-----+
-    """
-
-    # TODO: Add a way to represent file systems with nested lists. This onl
-    # allows for a defined set of actions wich are independent of the selected
-    # element.
-    def __init__(
-        self,
-        renderer: CursesRenderer,
-        x_pos: int,
-        y_pos: int,
-        items: Union[List[List[str]], List[ListRenderer]],
-    ):
-        self.renderer = renderer
-        self.x_pos = x_pos
-        self.y_pos = y_pos
-
-        self.selected_list = 0
-        self.margin = 1
-
-        try:
-            if isinstance(items[0], ListRenderer):
-                logger.debug("Creating TreeListRenderer with List[ListRenderer]")
-                passed_items = items
-            elif isinstance(items[0], str):
-                logger.debug("Creating TreeListRenderer with List[List[str]]")
-                passed_items = self.convert_list_str_to_listrenderer(
-                    renderer, cast(List[List[str]], items)
-                )
-            else:
-                logger.warning(
-                    "Unexceped type %s. Assuming List[List[str]].", type(items)
-                )
-                passed_items = self.convert_list_str_to_listrenderer(
-                    renderer, cast(List[List[str]], items)
-                )
-        except IndexError:
-            logger.warning(
-                "Could not determine type of items. Type: %s. Assuming List[ListRenderer].",
-                type(items),
-            )
-            passed_items = items
-
-        self.items: List[ListRenderer] = cast(List[ListRenderer], passed_items)
-        self.set_items_position()
-        self.select_list(0)
-
-    def convert_list_str_to_listrenderer(
-        self, renderer: CursesRenderer, items: List[List[str]]
-    ) -> List[ListRenderer]:
-        """
-        Convert a list of lists of strings into a corresponding list of
-        ListRenderers. Used internally.
-        """
-        passed_items = []
-        for item in items:
-            list_renderer = ListRenderer(renderer, 0, 0, item)
-            passed_items.append(list_renderer)
-
-        return passed_items
-
-    def draw(self) -> None:
-        """
-        Draw the TreeListRenderer.
-
-        (draws each of the ListRenderers in sequence.)
-        """
-        for i in self.items:
-            i.draw()
-
-    def check_input(self, key: str) -> None:
-        """
-        Check if the given key is one of the handled keys, and execute the
-        appropriate action.
-
-        Handled keys include all the keys handled by ListRenderers, since the
-        key is first handled by each of the ListRenderers. (at the time of
-        writing, the ListRenderers can handle KEY_UP and KEY_DOWN to select the
-        next and previous item in the list if the list is selected)
-
-        KEY_RIGHT select the ListRenderer to the right of the current one, and
-        KEY_LEFT select the ListRenderer to the left of the current one
-        """
-        for item in self.items:
-            item.check_input(key)
-
-        if key == "KEY_RIGHT":
-            self.select_next_list()
-        elif key == "KEY_LEFT":
-            self.select_previous_list()
-
-    def select_next_list(self) -> None:
-        """
-        Select the ListRenderer to the right of the current one.
-        """
-        self.select_list(self.selected_list + 1)
-
-    def select_previous_list(self) -> None:
-        """
-        Select the ListRenderer to the left of the current one.
-        """
-        self.select_list(self.selected_list - 1)
-
-    def select_list(self, index: int) -> None:
-        """
-        Select the ListRenderer at the given index. See the documentation for
-        the whole class to understand how indexes work.
-
-        If the index is out of range, nothing happens.
-
-        This method will alos ensure that only one ListRenderer is currently
-        selected.
-        """
-        if index < 0 or index >= len(self.items):
-            return
-
-        self.selected_list = index
-        for list_index, item in enumerate(self.items):
-            if list_index == index:
-                item.selected = True
-            else:
-                item.selected = False
-
-    def set_items_position(self) -> None:
-        """
-        Automatically adjust the positionning of the ListRenderers so that they
-        conform to the layout described in the documentation for the whole
-        class.
-
-        This is called at initialization, and will need to be called manually if
-        one of the ListRenderer's actual_width chages.
-        """
-        sum_now = self.x_pos
-        for item in self.items:
-            item.x_pos = sum_now
-            item.y_pos = self.y_pos
-            sum_now += item.actual_width + self.margin
-
-    def get_list_item(self, index: int) -> Optional[ListRenderer]:
-        """
-        Return the ListRenderer at the given index. If the index is out of
-        range, returns None.
-        """
-        if index < 0 or index >= len(self.items):
-            return None
-        return self.items[index]
+"""
+Thie module contains user_interface facilities. Various class to simplify
+building user interfaces.
+"""
+
+# ------------------------------------------------------------------------------
+#  This file is part of Unconstrained self-modification.
+#
+#  Copyright (C) © 2020 Khaïs COLIN <logistic-bot@protonmail.com>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+
+import curses
+import logging
+from typing import Callable, Dict, Iterable, Optional, List, Union, cast
+
+from src.core.input_decoder import BACKSPACE, ENTER
+from src.core.keymap import Keymap
+from src.core.render import CursesRenderer
+from src.core.text_width import pad, text_width
+from src.core.widgets import Area, Widget
+
+logger = logging.getLogger(__name__)
+
+
+SCROLLBAR_THUMB = "█"
+SCROLLBAR_TRACK = "░"
+
+
+class ListRenderer(Widget):
+    """
+    Allows to render a list of strings. This can also be used to select one of
+    the strings from the list.
+
+    If height is set, the list is virtualized: only the <height> rows starting
+    at scroll_offset are drawn, the scroll offset follows the selected item,
+    and a scrollbar is drawn in the last column of the list (the right margin,
+    if there is one) when there are more items than rows.
+
+    The length of the longest item, the width of the list and the padded items
+    are measured once, and measured again only when items, margin, max_length,
+    select_max_length or indent_selected change. For this reason, items must
+    not be modified in place: use insert_item() and remove_item(), or set a new
+    list.
+
+    A ListRenderer is also a Widget: it invalidates itself when its items,
+    layout, position or selection change. When only the selected item changed,
+    and the list did not scroll, paint() only draws the previously selected row
+    and the newly selected row.
+    """
+
+    def __init__(
+        self,
+        renderer: CursesRenderer,
+        x_pos: int,
+        y_pos: int,
+        items: Optional[List[str]] = None,
+        select_max_length: bool = False,
+        max_length: Optional[int] = None,
+        margin: int = 0,
+        height: Optional[int] = None,
+    ) -> None:
+        super().__init__(renderer)
+
+        if items is None:
+            items = []
+
+        self._max_length = max_length
+        self._selected = True
+
+        self.y_pos = y_pos
+        self.x_pos = x_pos
+        self._items = items
+        self.renderer = renderer
+        self.index = 0
+
+        self.height = height
+        self.scroll_offset = 0
+
+        # the selected index the last time the list was drawn, and whether
+        # something else than the selection changed since then
+        self.painted_index: Optional[int] = None
+        self.layout_dirty = True
+
+        self._indent_selected = False
+        self._margin = margin
+        self._select_max_length = select_max_length
+        self._highlight_selected = True
+
+        self.keymap = Keymap()
+        self.keymap.bind("KEY_DOWN", self.select_next, repeatable=True)
+        self.keymap.bind("KEY_UP", self.select_previous, repeatable=True)
+
+        # cached measurements, see measure()
+        self._longest = self.measure_longest()
+        self._padded_items: Dict[str, str] = {}
+        self._width = self.measure_width()
+        self._width_listeners: List[Callable[[], None]] = []
+
+        logger.info(
+            "Created new ListRenderer at (%s, %s) with items '%s'", x_pos, y_pos, items
+        )
+
+    def set_margin(self, value: int) -> None:
+        """
+        Set the margin for this ListRenderer.
+
+        The margin dictates how many spaces should be added before and after each
+        element of the list.
+
+        Examples:
+            margin = 0:
+                `element 1`
+                `element 2`
+                `element 3`
+            margin = 1:
+                ` element 1 `
+                ` element 2 `
+                ` element 3 `
+            margin = 5:
+                `     element 1     `
+                `     element 2     `
+                `     element 3     `
+
+        """
+        self._margin = value
+        self.measure()
+
+    def get_margin(self) -> int:
+        """
+        Get the current margin for this ListRenderer.
+
+        See set_margin for a description of what a margin is.
+        """
+        return self._margin
+
+    margin = property(get_margin, set_margin)
+
+    def get_items(self) -> List[str]:
+        """
+        Get the items of the list.
+
+        The returned list must not be modified in place, see the documentation
+        for the whole class.
+        """
+        return self._items
+
+    def set_items(self, value: List[str]) -> None:
+        """
+        Replace the items of the list.
+        """
+        self._items = value
+        self._longest = self.measure_longest()
+        self._padded_items.clear()
+        self.measure()
+
+    items = property(get_items, set_items)
+
+    def insert_item(self, index: int, item: str) -> None:
+        """
+        Insert <item> before <index>, like list.insert().
+        """
+        self._items.insert(index, item)
+        width = text_width(item)
+        if width > self._longest:
+            self._longest = width
+            self.measure()
+        self.invalidate()
+
+    def remove_item(self, index: int) -> str:
+        """
+        Remove the item at <index>, and return it.
+        """
+        item = self._items.pop(index)
+        self._padded_items.pop(item, None)
+        if text_width(item) == self._longest:
+            self._longest = self.measure_longest()
+            self.measure()
+        self.invalidate()
+        return item
+
+    def get_indent_selected(self) -> bool:
+        """
+        Return True if the selected item is indented by one character.
+        """
+        return self._indent_selected
+
+    def set_indent_selected(self, value: bool) -> None:
+        """
+        Set whether the selected item is indented by one character.
+        """
+        self._indent_selected = value
+        self.measure()
+
+    indent_selected = property(get_indent_selected, set_indent_selected)
+
+    def get_select_max_length(self) -> bool:
+        """
+        Return True if items are padded up to max_length, so that the highlight
+        of the selected item is max_length wide.
+        """
+        return self._select_max_length
+
+    def set_select_max_length(self, value: bool) -> None:
+        """
+        Set whether items are padded up to max_length.
+        """
+        self._select_max_length = value
+        self.measure()
+
+    select_max_length = property(get_select_max_length, set_select_max_length)
+
+    def get_highlight_selected(self) -> bool:
+        """
+        Return True if the selected item is highlighted.
+        """
+        return self._highlight_selected
+
+    def set_highlight_selected(self, value: bool) -> None:
+        """
+        Set whether the selected item is highlighted.
+        """
+        if value != self._highlight_selected:
+            self._highlight_selected = value
+            self.dirty = True  # only the selected item changes
+
+    highlight_selected = property(get_highlight_selected, set_highlight_selected)
+
+    def move(self, x_pos: int, y_pos: int) -> None:
+        """
+        Move the list to (<x_pos>, <y_pos>).
+        """
+        if (x_pos, y_pos) != (self.x_pos, self.y_pos):
+            self.x_pos = x_pos
+            self.y_pos = y_pos
+            self.invalidate()
+
+    def add_width_listener(self, callback: Callable[[], None]) -> None:
+        """
+        Call <callback> every time actual_width changes.
+        """
+        self._width_listeners.append(callback)
+
+    def measure_longest(self) -> int:
+        """
+        Return the width of the longest item, or 0 if there are no items.
+        """
+        return max((text_width(item) for item in self._items), default=0)
+
+    def measure_width(self) -> int:
+        """
+        Return the width taken by drawing the list, see actual_width.
+        """
+        width: int = self.max_length + self.margin * 2
+        if self.indent_selected:
+            width += 1
+        return width
+
+    def measure(self) -> None:
+        """
+        Update the cached measurements after the layout of the list changed,
+        and notify the width listeners if the width changed.
+        """
+        self._padded_items.clear()
+        self.invalidate()
+
+        width = self.measure_width()
+        if width == self._width:
+            return
+
+        logger.debug("actual_width changed from '%s' to '%s'", self._width, width)
+        self._width = width
+        for callback in self._width_listeners:
+            callback()
+
+    def select_next(self) -> None:
+        """
+        Select the next element element in the list.
+        """
+        self.select(self.index + 1)
+
+    def select_previous(self) -> None:
+        """
+        Select the previous element element in the list.
+        """
+        self.select(self.index - 1)
+
+    def select(self, index: int) -> None:
+        """
+        Select a specified element in the list.
+
+        If the given index is out of range, no change is made.
+
+        The selected element is highlighed when the list is drawn. It can also
+        be indented if ListRenderer.indent_selected is set to True.
+
+        :param index: The index of the element to select.
+        """
+        previous = (self.index, self.scroll_offset)
+        try:
+            assert index < len(self.items)
+            assert index >= 0
+            self.index = index
+        except AssertionError:
+            logger.warning(
+                "Tried to select item at index %s but item does not exist. Items: %s",
+                index,
+                self.items,
+            )
+        self.scroll_to_selected()
+        if self.scroll_offset != previous[1]:
+            self.invalidate()
+        elif self.index != previous[0]:
+            self.dirty = True  # only the selection changed
+
+    def scroll_to_selected(self) -> None:
+        """
+        Adjust scroll_offset so that the selected item is visible. Does nothing
+        if the list is not virtualized (height is None).
+        """
+        if self.height is None:
+            return
+
+        if self.index < self.scroll_offset:
+            self.scroll_offset = self.index
+        elif self.index >= self.scroll_offset + self.height:
+            self.scroll_offset = self.index - self.height + 1
+
+        max_offset = max(len(self.items) - self.height, 0)
+        self.scroll_offset = max(min(self.scroll_offset, max_offset), 0)
+
+    @property
+    def visible_range(self) -> range:
+        """
+        Return the range of the indexes of the items that are drawn.
+        """
+        if self.height is None:
+            return range(len(self.items))
+        stop = min(self.scroll_offset + self.height, len(self.items))
+        return range(self.scroll_offset, stop)
+
+    def check_input(self, key: str) -> None:
+        """
+        Select the next or previous element in the list if the given key is
+        KEY_DOWN or KEY_UP, respectively.
+
+        This only has an effect when this list is selected.
+
+        (Selected means that  the list can be acted upon. It also serves to give
+        the user feedback  about whether the user can act on the list. When the
+        list is selected,  the currently selected element is highlighted. When
+        the list is not  selected, the currently selected element is not
+        highlighted as much.)
+
+        The handled keys are the ones bound in keymap.
+        """
+        if self.selected:
+            self.keymap.dispatch(key)
+
+    @property
+    def selected_item(self) -> Optional[str]:
+        """
+        Return the currently selected item. If the cureent index is not usable,
+        return the first item (items[0]). If the items list is empty, return
+        None.
+        """
+        item: Optional[str]
+        try:
+            item = self.items[self.index]
+        except IndexError:  # if the item at the index does not exist..
+            try:
+                item = self.items[0]  # we try getting the first
+            except IndexError:  # if the list is empty
+                item = None  # we return none
+        return item
+
+    def get_selected_index(self) -> int:
+        """
+        Return the index of the currently selected item.
+        """
+        return self.index
+
+    def get_selected(self) -> bool:
+        """
+        Return True if the list is currently selected, False otherwise.
+        """
+        return self._selected
+
+    def set_selected(self, value: bool) -> None:
+        """
+        When given True, the list will be selected. When given False, the list
+        will be unselected.
+        """
+        if value != self._selected:
+            self._selected = value
+            self.dirty = True  # only the selected item changes
+
+    selected = property(get_selected, set_selected)
+
+    def get_max_length(self) -> int:
+        """
+        Get the length of the longest element of the list, or the minimum
+        highlight length.
+
+        max_length can be in two modes: Internal or external. The mode is
+        determined by whether the max_length was set or not.
+
+        Internal mode: (default)
+            Internal mode can be obtained by setting max_length to None. It is
+            also the default mode, which is used if max_length is not set at
+            all.
+
+            While in internal mode, get_max_length will return the length of the
+            longes element of the list.
+
+            select_max_length will select the length of the longest element,
+            automatically.
+
+            (dev note: this is because select_max_length uses get_max_length
+            internally)
+
+        External mode:
+            External mode can be obtained by setting max_length to any integer.
+            If the given integer is negative, zero, or smaller that the length
+            of the shortest element of the list, it will behave as if it were in
+            internal mode.
+
+            If highlight_max_length is True, then the ListRenderer will
+            highlight up to max_length for element that are shorter than
+            max_length and the whole element for elements that are longer.
+
+            While in external mode, get_max_length will return the length set by
+            set_max_length.
+
+        (dev note: not all of the described behavior is tested, please open an
+        issues if you experience any disrepancies)
+        """
+        if self._max_length is None:
+            return self._longest
+        return self._max_length
+
+    def set_max_length(self, value: int) -> None:
+        """
+        If value is None, set the max_length mode to Internal. If value is not
+        None, set the max_length mode to External and set the max_length to the
+        given value.
+
+        See get_max_length for an extended explanation of what External and
+        Internal modes are.
+        """
+        self._max_length = value
+        self.measure()
+
+    max_length = property(get_max_length, set_max_length)
+
+    @property
+    def actual_width(self) -> int:
+        """
+        Returns the width taken by drawing the list.
+
+        It's a measure of how much vertical space will be altered when calling
+        the draw() method.
+
+        It takes into account margins, indent_selected and get_max_length.
+        """
+        return self._width
+
+    def invalidate(self) -> None:
+        """
+        Draw the whole list again on the next WidgetTree.paint().
+        """
+        super().invalidate()
+        self.layout_dirty = True
+
+    def paint(self) -> None:
+        """
+        Draw the list again. If only the selected item changed since the last
+        time the list was drawn, only draw the two rows that changed.
+        """
+        if (
+            not self.layout_dirty
+            and self.painted_index is not None
+            and self.painted_index in self.visible_range
+        ):
+            self.draw_selection_change()
+            self.dirty = False
+        else:
+            super().paint()
+        self.layout_dirty = False
+
+    @property
+    def opaque(self) -> bool:  # type: ignore
+        """
+        Return True if drawing the list draws every cell of its area, which is
+        the case when every item is padded to the same width.
+        """
+        return self.select_max_length and not self.indent_selected
+
+    @property
+    def area(self) -> Area:
+        return Area(self.x_pos, self.y_pos, self.actual_width, len(self.visible_range))
+
+    def draw(self) -> None:
+        # TODO: indent_selected should be customizable, how much should it be
+        # indented
+        """
+        Draw the list.
+
+        Possible options:
+         - margin: sets how many spaces should be inserted before and after each
+           item. See also get_item_margins()
+
+        See also draw_highlight_selected() for option to highlight the selected item.
+
+        If the list is virtualized (see the class documentation), only the
+        visible items are drawn.
+        """
+        for index in self.visible_range:
+            self.draw_item(index)
+
+        self.draw_highlight_selected()
+        self.draw_scrollbar()
+        self.painted_index = self.index
+
+    def draw_item(self, index: int) -> None:
+        """
+        Draw the item at <index>, without highlight.
+        """
+        item = self.get_item_margins(self.items[index])
+        y_pos = self.y_pos + index - self.scroll_offset
+
+        if self.indent_selected:
+            self.renderer.addtext(self.x_pos, y_pos, " " * (text_width(item) + 1))
+        self.renderer.addtext(self.x_pos, y_pos, item)
+
+    def draw_selection_change(self) -> None:
+        """
+        Draw the rows of the previously selected item and of the selected item,
+        after the selection moved without scrolling the list. This is much
+        faster than draw() for long lists.
+        """
+        assert self.painted_index is not None, "The list was never drawn"
+
+        rows = {self.painted_index, self.index}
+        for index in rows:
+            self.draw_item(index)
+        self.draw_highlight_selected()
+        self.draw_scrollbar([index - self.scroll_offset for index in rows])
+        self.painted_index = self.index
+
+    def draw_scrollbar(self, rows: Optional[Iterable[int]] = None) -> None:
+        """
+        Draw the scrollbar in the last column of the list, if the list is
+        virtualized and there are more items than rows.
+
+        :param rows: the rows of the scrollbar to draw, every row if None
+        """
+        if self.height is None or len(self.items) <= self.height:
+            return
+
+        thumb_size = max(round(self.height * self.height / len(self.items)), 1)
+        max_offset = len(self.items) - self.height
+        thumb_pos = round(self.scroll_offset * (self.height - thumb_size) / max_offset)
+
+        if rows is None:
+            rows = range(self.height)
+
+        x_pos = self.x_pos + self.actual_width - 1
+        for row in rows:
+            if thumb_pos <= row < thumb_pos + thumb_size:
+                self.renderer.addtext(x_pos, self.y_pos + row, SCROLLBAR_THUMB)
+            else:
+                self.renderer.addtext(x_pos, self.y_pos + row, SCROLLBAR_TRACK)
+
+    def get_item_margins(self, item: Optional[str]) -> str:
+        """
+        Given an item string, return the item with the needed margins applied.
+
+        If select_max_length is True, we need to add a corresponding number of
+        spaces to the end of the item string, to make sure that if the item is
+        selected, the needed length will be highlighted. See also
+        get_max_length() (Internal mode) for more details.
+
+        If the given item is None, return an empty string.
+
+        Padded items are cached until the layout of the list changes.
+
+        See also set_margin()
+        """
+        if item is None:
+            item = ""
+
+        padded = self._padded_items.get(item)
+        if padded is None:
+            padded = item
+            if self.select_max_length:
+                padded = pad(item, self.max_length)
+            padded = " " * self.margin + padded + " " * self.margin
+            self._padded_items[item] = padded
+        return padded
+
+    def draw_highlight_selected(self) -> None:
+        """
+        Highlight the selected item so that the user can see which item is
+        selected, but only if highlight_selected is True.
+
+        Options:
+            indent_selected: If True, the selected item will be indented to the
+                right by one character.
+            selected: If the list is selected, the selected item will be
+                highlighted brightly. If not, it will be highlighted greyly.
+        """
+        if self.highlight_selected:
+            item = self.get_item_margins(self.selected_item)
+
+            selected_x_pos = self.x_pos
+            if self.indent_selected:
+                selected_x_pos += 1
+
+            y_pos = self.y_pos + self.index - self.scroll_offset
+
+            if self.selected:  # if selected
+                self.renderer.addtext(self.x_pos, y_pos, " " * self.max_length)
+
+                self.renderer.addtext(
+                    selected_x_pos, y_pos, item, curses.A_BOLD | curses.A_REVERSE,
+                )
+            else:  # if not selected
+                self.renderer.addtext(
+                    self.x_pos, y_pos, item, curses.A_DIM | curses.A_REVERSE,
+                )
+
+
+class TreeListRenderer:
+    """
+    Allows to show two or more ListRenderer one after the other, with Automatic
+    navigation between the lists.
+
+    The lists can only be shown horizontally, with list 0 being on the left.
+
+    The lists are completely independent of each other, so dynamically changing
+    one list depending on which element is selected in another is not supported
+    by this class. It can however be done manually, and this functionallity is
+    planned.
+
+    Note: whenever we talk about the 'next' or 'previous' ListRenderer, we talk
+    about the ListRenderer directly to the right and left of the currently
+    selected one, respectively.
+
+    Layout: (the number indicates the index of the list)
+    +-----+ +-----+ +-----+
+    |     | |     | |     |
+    |  0  | |  1  | |  2  |
+    |     | |     | |     |
+    +-----+ +-----+ +-----+
+    """
+
+    # TODO: Add a way to represent file systems with nested lists. This onl
+    # allows for a defined set of actions wich are independent of the selected
+    # element.
+    def __init__(
+        self,
+        renderer: CursesRenderer,
+        x_pos: int,
+        y_pos: int,
+        items: Union[List[List[str]], List[ListRenderer]],
+    ):
+        self.renderer = renderer
+        self.x_pos = x_pos
+        self.y_pos = y_pos
+
+        self.selected_list = 0
+        self.margin = 1
+
+        self.keymap = Keymap()
+        self.keymap.bind("KEY_RIGHT", self.select_next_list, repeatable=True)
+        self.keymap.bind("KEY_LEFT", self.select_previous_list, repeatable=True)
+
+        try:
+            if isinstance(items[0], ListRenderer):
+                logger.debug("Creating TreeListRenderer with List[ListRenderer]")
+                passed_items = items
+            elif isinstance(items[0], str):
+                logger.debug("Creating TreeListRenderer with List[List[str]]")
+                passed_items = self.convert_list_str_to_listrenderer(
+                    renderer, cast(List[List[str]], items)
+                )
+            else:
+                logger.warning(
+                    "Unexceped type %s. Assuming List[List[str]].", type(items)
+                )
+                passed_items = self.convert_list_str_to_listrenderer(
+                    renderer, cast(List[List[str]], items)
+                )
+        except IndexError:
+            logger.warning(
+                "Could not determine type of items. Type: %s. Assuming List[ListRenderer].",
+                type(items),
+            )
+            passed_items = items
+
+        self.items: List[ListRenderer] = cast(List[ListRenderer], passed_items)
+        self.set_items_position()
+        for item in self.items:
+            item.add_width_listener(self.set_items_position)
+        self.select_list(0)
+
+    def convert_list_str_to_listrenderer(
+        self, renderer: CursesRenderer, items: List[List[str]]
+    ) -> List[ListRenderer]:
+        """
+        Convert a list of lists of strings into a corresponding list of
+        ListRenderers. Used internally.
+        """
+        passed_items = []
+        for item in items:
+            list_renderer = ListRenderer(renderer, 0, 0, item)
+            passed_items.append(list_renderer)
+
+        return passed_items
+
+    def draw(self) -> None:
+        """
+        Draw the TreeListRenderer.
+
+        (draws each of the ListRenderers in sequence.)
+        """
+        for i in self.items:
+            i.draw()
+
+    def check_input(self, key: str) -> None:
+        """
+        Check if the given key is one of the handled keys, and execute the
+        appropriate action.
+
+        Handled keys include all the keys handled by ListRenderers, since the
+        key is first handled by each of the ListRenderers. (at the time of
+        writing, the ListRenderers can handle KEY_UP and KEY_DOWN to select the
+        next and previous item in the list if the list is selected)
+
+        KEY_RIGHT select the ListRenderer to the right of the current one, and
+        KEY_LEFT select the ListRenderer to the left of the current one (see
+        keymap)
+        """
+        for item in self.items:
+            item.check_input(key)
+
+        self.keymap.dispatch(key)
+
+    def is_repeatable(self, key: str) -> bool:
+        """
+        Return True if <key> only moves a selection, in this TreeListRenderer
+        or in one of its ListRenderers. See Binding.
+        """
+        return self.keymap.is_repeatable(key) or any(
+            item.keymap.is_repeatable(key) for item in self.items
+        )
+
+    def select_next_list(self) -> None:
+        """
+        Select the ListRenderer to the right of the current one.
+        """
+        self.select_list(self.selected_list + 1)
+
+    def select_previous_list(self) -> None:
+        """
+        Select the ListRenderer to the left of the current one.
+        """
+        self.select_list(self.selected_list - 1)
+
+    def select_list(self, index: int) -> None:
+        """
+        Select the ListRenderer at the given index. See the documentation for
+        the whole class to understand how indexes work.
+
+        If the index is out of range, nothing happens.
+
+        This method will alos ensure that only one ListRenderer is currently
+        selected.
+        """
+        if index < 0 or index >= len(self.items):
+            return
+
+        self.selected_list = index
+        for list_index, item in enumerate(self.items):
+            if list_index == index:
+                item.selected = True
+            else:
+                item.selected = False
+
+    def set_items_position(self) -> None:
+        """
+        Automatically adjust the positionning of the ListRenderers so that they
+        conform to the layout described in the documentation for the whole
+        class.
+
+        This is called at initialization, and automatically every time the
+        actual_width of one of the ListRenderers changes.
+        """
+        sum_now = self.x_pos
+        for item in self.items:
+            item.move(sum_now, self.y_pos)
+            sum_now += item.actual_width + self.margin
+
+    def get_list_item(self, index: int) -> Optional[ListRenderer]:
+        """
+        Return the ListRenderer at the given index. If the index is out of
+        range, returns None.
+        """
+        if index < 0 or index >= len(self.items):
+            return None
+        return self.items[index]
+
+
+class LineEditor(Widget):
+    """
+    A single line text input, shown after a prompt. Similar to built-in
+    input(), but for curses.
+
+    The editor is a widget that can be kept and used for several inputs:
+    edit() clears it, and returns the text entered by the user. Each key press
+    only draws the row of the editor again, and no curses window is created.
+
+    Keys:
+        LEFT, RIGHT, HOME, END, ^A, ^E: move the cursor
+        BACKSPACE, DELETE: delete the character before, or under, the cursor
+        ^U: delete everything before the cursor
+        UP, DOWN: go through the history of entered texts
+        ENTER: done
+
+    If masked is True, the text is shown as mask_char characters, and is not
+    added to the history.
+
+    At most length - 1 cells of text can be entered, like
+    curses.textpad.Textbox.
+    """
+
+    opaque = True
+
+    def __init__(  # pylint: disable=R0913
+        self,
+        renderer: CursesRenderer,
+        x_pos: int,
+        y_pos: int,
+        length: int,
+        prompt: str = "",
+        masked: bool = False,
+        mask_char: str = "*",
+        history: Optional[List[str]] = None,
+        color_pair_progress: int = curses.A_UNDERLINE | curses.A_BOLD,
+        color_pair_done: int = curses.A_BOLD,
+    ) -> None:
+        super().__init__(renderer)
+        self.x_pos = x_pos
+        self.y_pos = y_pos
+        self.length = length
+        self.prompt = prompt
+        self.masked = masked
+        self.mask_char = mask_char
+        self.history: List[str] = history if history is not None else []
+        self.color_pair_progress = color_pair_progress
+        self.color_pair_done = color_pair_done
+
+        self.text = ""
+        self.cursor = 0
+        self.editing = False
+        # the index in history of the shown text, len(history) for the new text
+        self.history_index = 0
+        self.new_text = ""
+
+        self.keymap = Keymap(fallback=self.insert)
+        self.keymap.bind("KEY_LEFT", self.move_left, repeatable=True)
+        self.keymap.bind("KEY_RIGHT", self.move_right, repeatable=True)
+        self.keymap.bind(("KEY_HOME", "\x01"), self.move_home)
+        self.keymap.bind(("KEY_END", "\x05"), self.move_end)
+        self.keymap.bind(BACKSPACE, self.delete_before, repeatable=True)
+        self.keymap.bind("KEY_DC", self.delete_under, repeatable=True)
+        self.keymap.bind("\x15", self.delete_to_start)
+        self.keymap.bind("KEY_UP", self.history_previous)
+        self.keymap.bind("KEY_DOWN", self.history_next)
+
+    @property
+    def shown_text(self) -> str:
+        """
+        Return the text as it is shown on the screen.
+        """
+        if self.masked:
+            return self.mask_char * len(self.text)
+        return self.text
+
+    def set_text(self, text: str) -> None:
+        """
+        Replace the text, and move the cursor to its end.
+        """
+        self.text = text
+        self.cursor = len(text)
+        self.invalidate()
+
+    def clear(self) -> None:
+        """
+        Empty the editor, and get ready for a new input.
+        """
+        self.set_text("")
+        self.history_index = len(self.history)
+        self.new_text = ""
+
+    def insert(self, key: str) -> None:
+        """
+        Insert <key> at the cursor, if it is a printable character and there is
+        room for it.
+        """
+        if len(key) != 1 or not key.isprintable():
+            return
+        if text_width(self.shown_text) + text_width(key) > self.length - 1:
+            curses.beep()
+            return
+        self.text = self.text[:self.cursor] + key + self.text[self.cursor:]
+        self.cursor += 1
+        self.invalidate()
+
+    def move_left(self) -> None:
+        """
+        Move the cursor one character to the left.
+        """
+        if self.cursor > 0:
+            self.cursor -= 1
+            self.invalidate()
+
+    def move_right(self) -> None:
+        """
+        Move the cursor one character to the right.
+        """
+        if self.cursor < len(self.text):
+            self.cursor += 1
+            self.invalidate()
+
+    def move_home(self) -> None:
+        """
+        Move the cursor to the start of the text.
+        """
+        self.cursor = 0
+        self.invalidate()
+
+    def move_end(self) -> None:
+        """
+        Move the cursor to the end of the text.
+        """
+        self.cursor = len(self.text)
+        self.invalidate()
+
+    def delete_before(self) -> None:
+        """
+        Delete the character before the cursor.
+        """
+        if self.cursor > 0:
+            self.text = self.text[:self.cursor - 1] + self.text[self.cursor:]
+            self.cursor -= 1
+            self.invalidate()
+
+    def delete_under(self) -> None:
+        """
+        Delete the character under the cursor.
+        """
+        if self.cursor < len(self.text):
+            self.text = self.text[:self.cursor] + self.text[self.cursor + 1:]
+            self.invalidate()
+
+    def delete_to_start(self) -> None:
+        """
+        Delete everything before the cursor.
+        """
+        self.text = self.text[self.cursor:]
+        self.cursor = 0
+        self.invalidate()
+
+    def history_previous(self) -> None:
+        """
+        Show the previous text of the history.
+        """
+        if self.masked or self.history_index == 0:
+            return
+        if self.history_index == len(self.history):
+            self.new_text = self.text  # keep what was being typed
+        self.history_index -= 1
+        self.set_text(self.history[self.history_index])
+
+    def history_next(self) -> None:
+        """
+        Show the next text of the history, or the text being typed after the
+        last one.
+        """
+        if self.masked or self.history_index >= len(self.history):
+            return
+        self.history_index += 1
+        if self.history_index == len(self.history):
+            self.set_text(self.new_text)
+        else:
+            self.set_text(self.history[self.history_index])
+
+    def check_input(self, key: str) -> bool:
+        """
+        Handle <key>. Return True if the user is done, that is if <key> is
+        ENTER.
+        """
+        if key == ENTER:
+            return True
+        self.keymap.dispatch(key)
+        return False
+
+    @property
+    def area(self) -> Area:
+        return Area(self.x_pos, self.y_pos, text_width(self.prompt) + self.length, 1)
+
+    def draw(self) -> None:
+        field_x_pos = self.x_pos + text_width(self.prompt)
+        shown_text = self.shown_text
+        if self.editing:
+            # the whole field is drawn, to show where the text can be entered
+            self.renderer.addtext(
+                field_x_pos,
+                self.y_pos,
+                pad(shown_text, self.length),
+                self.color_pair_progress,
+            )
+            cursor_x_pos = field_x_pos + text_width(shown_text[: self.cursor])
+            self.renderer.move_cursorxy(cursor_x_pos, self.y_pos)
+        else:
+            self.renderer.addtext(field_x_pos, self.y_pos, " " * self.length)
+            self.renderer.addtext(
+                field_x_pos, self.y_pos, shown_text, self.color_pair_done
+            )
+
+    def edit(self) -> str:
+        """
+        Clear the editor, let the user enter a text, and return it without
+        leading and trailing spaces.
+        """
+        logger.info(
+            "Getting text input at (%s, %s) of max length %s",
+            self.x_pos,
+            self.y_pos,
+            self.length,
+        )
+        self.clear()
+        self.editing = True
+        self.renderer.addtext(self.x_pos, self.y_pos, self.prompt)
+        curses.curs_set(2)
+
+        done = False
+        while not done:
+            if self.dirty:
+                self.paint()
+                self.renderer.refresh()
+            done = self.check_input(self.renderer.get_key())
+
+        self.editing = False
+        self.text = self.text.strip()
+        self.paint()
+        self.renderer.refresh()
+        curses.curs_set(0)
+
+        if not self.masked and self.text and self.history[-1:] != [self.text]:
+            self.history.append(self.text)
+        logger.info("The user entered: %s", self.shown_text)
+        return self.text
@@ -0,0 +1,478 @@
+"""
+This file contains the retained-mode widgets: a WidgetTree keeps the widgets shown on the screen,
+and only draws again the widgets that changed.
+"""
+
+# ------------------------------------------------------------------------------
+#  This file is part of Universal Sandbox.
+#
+#  Copyright (C) © 2020 Khaïs COLIN <logistic-bot@protonmail.com>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+import curses
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, Iterable, List, NamedTuple, Optional, Sequence, TypeVar
+
+from src.core.render import CursesRenderer
+from src.core.text_width import text_width
+
+logger = logging.getLogger(__name__)
+
+
+class Area(NamedTuple):
+    """
+    A rectangle of the screen.
+    """
+
+    x_pos: int
+    y_pos: int
+    width: int
+    height: int
+
+    def contains(self, other: "Area") -> bool:
+        """
+        Return True if <other> is inside this area.
+        """
+        return (
+            self.x_pos <= other.x_pos
+            and self.y_pos <= other.y_pos
+            and other.x_pos + other.width <= self.x_pos + self.width
+            and other.y_pos + other.height <= self.y_pos + self.height
+        )
+
+
+class Widget(ABC):
+    """
+    A part of the screen that is kept by a WidgetTree, and only drawn again when it is dirty.
+
+    Widgets invalidate themselves when one of their properties changes, and can be invalidated
+    manually with invalidate(). Before a widget is drawn again, the area it covered the last
+    time it was drawn is erased, so that a widget that shrinks or moves does not leave anything
+    behind. For this reason, the widgets of a tree must not overlap.
+
+    Widgets that are opaque draw every cell of their area, so they are not erased before
+    being drawn again over the same area.
+    """
+
+    opaque = False
+
+    def __init__(self, renderer: CursesRenderer) -> None:
+        self.renderer = renderer
+        self.dirty = True
+        self.painted_area: Optional[Area] = None
+
+    def invalidate(self) -> None:
+        """
+        Draw this widget again on the next WidgetTree.paint().
+        """
+        self.dirty = True
+
+    @property
+    @abstractmethod
+    def area(self) -> Area:
+        """
+        Return the area covered by drawing the widget.
+        """
+
+    @abstractmethod
+    def draw(self) -> None:
+        """
+        Draw the widget, without refreshing the screen.
+        """
+
+    def erase(self, area: Area) -> None:
+        """
+        Erase <area>, that this widget covered the last time it was drawn.
+        """
+        blank = " " * area.width
+        for row in range(area.height):
+            self.renderer.addtext(area.x_pos, area.y_pos + row, blank)
+
+    def paint(self) -> None:
+        """
+        Erase the widget, draw it again, and mark it as clean.
+        """
+        area = self.area
+        if self.painted_area is not None and not (
+            self.opaque and area.contains(self.painted_area)
+        ):
+            self.erase(self.painted_area)
+        self.draw()
+        self.painted_area = area
+        self.dirty = False
+
+
+AnyWidget = TypeVar("AnyWidget", bound=Widget)
+
+
+class WidgetTree:
+    """
+    The widgets shown on the screen, in drawing order.
+
+    paint() draws the dirty widgets, and then refreshes the screen once, so that every change
+    appears in the same frame.
+    """
+
+    def __init__(self, renderer: CursesRenderer, widgets: Iterable[Widget] = ()) -> None:
+        self.renderer = renderer
+        self.widgets: List[Widget] = list(widgets)
+
+    def add(self, widget: AnyWidget) -> AnyWidget:
+        """
+        Add <widget> on top of the other widgets, and return it.
+        """
+        self.widgets.append(widget)
+        return widget
+
+    def invalidate_all(self) -> None:
+        """
+        Clear the screen, and draw every widget again on the next paint().
+
+        This is needed after something else than the widgets drew on the
+        screen, for example a prompt.
+        """
+        self.renderer.clear_screen()
+        for widget in self.widgets:
+            widget.painted_area = None  # already erased
+            widget.invalidate()
+
+    def paint(self) -> int:
+        """
+        Draw the dirty widgets, refresh the screen, and return the number of
+        drawn widgets.
+        """
+        painted = 0
+        for widget in self.widgets:
+            if widget.dirty:
+                widget.paint()
+                painted += 1
+
+        if painted:
+            logger.debug("Painted %s widgets", painted)
+            self.renderer.refresh()
+        return painted
+
+
+class Label(Widget):
+    """
+    A single line of text.
+    """
+
+    opaque = True
+
+    def __init__(
+        self,
+        renderer: CursesRenderer,
+        x_pos: int,
+        y_pos: int,
+        text: str = "",
+        color_pair: int = 0,
+    ) -> None:
+        super().__init__(renderer)
+        self.x_pos = x_pos
+        self.y_pos = y_pos
+        self._text = text
+        self._color_pair = color_pair
+
+    def get_text(self) -> str:
+        """
+        Get the text of the label.
+        """
+        return self._text
+
+    def set_text(self, value: str) -> None:
+        """
+        Set the text of the label.
+        """
+        if value != self._text:
+            self._text = value
+            self.invalidate()
+
+    text = property(get_text, set_text)
+
+    def get_color_pair(self) -> int:
+        """
+        Get the curses color pair and formatting of the label.
+        """
+        return self._color_pair
+
+    def set_color_pair(self, value: int) -> None:
+        """
+        Set the curses color pair and formatting of the label.
+        """
+        if value != self._color_pair:
+            self._color_pair = value
+            self.invalidate()
+
+    color_pair = property(get_color_pair, set_color_pair)
+
+    @property
+    def area(self) -> Area:
+        return Area(self.x_pos, self.y_pos, text_width(self.text), 1)
+
+    def draw(self) -> None:
+        self.renderer.addtext(self.x_pos, self.y_pos, self.text, self.color_pair)
+
+
+class Separator(Widget):
+    """
+    A vertical line.
+    """
+
+    def __init__(
+        self, renderer: CursesRenderer, x_pos: int, y_pos: int, height: int
+    ) -> None:
+        super().__init__(renderer)
+        self.x_pos = x_pos
+        self.y_pos = y_pos
+        self.height = height
+
+    @property
+    def area(self) -> Area:
+        return Area(self.x_pos, self.y_pos, 1, self.height)
+
+    def draw(self) -> None:
+        self.renderer.stdscr.vline(
+            self.y_pos, self.x_pos, curses.ACS_VLINE, self.height
+        )
+
+
+class StatusBar(Label):
+    """
+    A text in the bottom border of the screen, see CursesRenderer.add_down_bar_text().
+    """
+
+    def __init__(
+        self, renderer: CursesRenderer, text: str = "", color_pair: int = 0
+    ) -> None:
+        super().__init__(renderer, 1, renderer.max_y - 1, text, color_pair)
+
+    def erase(self, area: Area) -> None:
+        # restore the border
+        self.renderer.stdscr.hline(
+            area.y_pos, area.x_pos, curses.ACS_HLINE, area.width
+        )
+
+
+class TextPanel(Widget):
+    """
+    Lines of text, one below the other.
+
+    If reveal_delay is not 0, the lines appear one after the other, waiting reveal_delay
+    seconds between them. This breaks the single frame of WidgetTree.paint(), so it should
+    only be used for widgets that are drawn last.
+    """
+
+    def __init__(
+        self,
+        renderer: CursesRenderer,
+        x_pos: int,
+        y_pos: int,
+        lines: Sequence[str] = (),
+    ) -> None:
+        super().__init__(renderer)
+        self.x_pos = x_pos
+        self.y_pos = y_pos
+        self._lines: List[str] = list(lines)
+        self.reveal_delay: float = 0
+
+    def get_lines(self) -> List[str]:
+        """
+        Get the lines of the panel.
+        """
+        return self._lines
+
+    def set_lines(self, value: Sequence[str]) -> None:
+        """
+        Set the lines of the panel.
+        """
+        value = list(value)
+        if value != self._lines:
+            self._lines = value
+            self.invalidate()
+
+    lines = property(get_lines, set_lines)
+
+    @property
+    def origin(self) -> Area:
+        """
+        Return the position of the first line, and the size of the text.
+        """
+        width = max(map(text_width, self.lines), default=0)
+        return Area(self.x_pos, self.y_pos, width, len(self.lines))
+
+    @property
+    def area(self) -> Area:
+        return self.origin
+
+    def draw(self) -> None:
+        x_pos, y_pos, _, _ = self.origin
+        for index, line in enumerate(self.lines):
+            self.renderer.addtext(x_pos, y_pos + index, line)
+            if self.reveal_delay:
+                self.renderer.refresh()
+                self.renderer.clock.sleep(self.reveal_delay)
+
+
+class ArtPanel(TextPanel):
+    """
+    A multiline ASCII art, centred horizontally in a column starting at x_pos and width
+    characters wide, and with its last line at bottom.
+    """
+
+    def __init__(
+        self,
+        renderer: CursesRenderer,
+        x_pos: int,
+        width: int,
+        bottom: int,
+        art: str = "",
+    ) -> None:
+        super().__init__(renderer, x_pos, bottom, art.splitlines())
+        self.width = width
+        self.bottom = bottom
+
+    def get_art(self) -> str:
+        """
+        Get the ASCII art.
+        """
+        return "\n".join(self.lines)
+
+    def set_art(self, value: str) -> None:
+        """
+        Set the ASCII art.
+        """
+        self.lines = value.splitlines()
+
+    art = property(get_art, set_art)
+
+    @property
+    def origin(self) -> Area:
+        width = max(map(text_width, self.lines), default=0)
+        x_pos = self.x_pos + round(self.width / 2) - round(width / 2)
+        y_pos = self.bottom - len(self.lines) + 1
+        return Area(x_pos, y_pos, width, len(self.lines))
+
+
+class Viewport(Widget):
+    """
+    A scrollable view of a text that can be taller than the screen.
+
+    The text is drawn once into an off-screen curses pad. Drawing the viewport copies the
+    visible part of the pad to the screen with a single pad refresh, so scrolling costs the
+    same for any length of text. If centred is True, each line is centred in the viewport.
+
+    The pad is refreshed after the screen, so nothing else should be drawn in the area of the
+    viewport.
+    """
+
+    opaque = True
+
+    def __init__(  # pylint: disable=R0913
+        self,
+        renderer: CursesRenderer,
+        x_pos: int,
+        y_pos: int,
+        width: int,
+        height: int,
+        text: str = "",
+        centred: bool = False,
+    ) -> None:
+        super().__init__(renderer)
+        self.x_pos = x_pos
+        self.y_pos = y_pos
+        self.width = width
+        self.height = height
+        self.centred = centred
+        self._scroll = 0
+        self._line_count = 0
+        self._text = ""
+        self.pad: Any = None
+        self.set_text(text)
+
+    def get_text(self) -> str:
+        """
+        Get the text of the viewport.
+        """
+        return self._text
+
+    def set_text(self, value: str) -> None:
+        """
+        Set the text of the viewport, draw it into a new pad, and scroll back to the top.
+        """
+        lines = value.splitlines()
+        pad_width = max(self.width, max(map(text_width, lines), default=0))
+        # one more row, because curses can not write in the bottom-right cell of a pad
+        pad = curses.newpad(len(lines) + 1, pad_width)
+        for row, line in enumerate(lines):
+            x_pos = max((self.width - text_width(line)) // 2, 0) if self.centred else 0
+            pad.addstr(row, x_pos, line)
+
+        self._text = value
+        self._line_count = len(lines)
+        self.pad = pad
+        self._scroll = 0
+        self.invalidate()
+        logger.debug("Drew %s lines into a %s columns wide pad", len(lines), pad_width)
+
+    text = property(get_text, set_text)
+
+    @property
+    def max_scroll(self) -> int:
+        """
+        Return the scroll position showing the last line at the bottom of the viewport.
+        """
+        return max(self._line_count - self.height, 0)
+
+    def get_scroll(self) -> int:
+        """
+        Get the index of the first visible line.
+        """
+        return self._scroll
+
+    def set_scroll(self, value: int) -> None:
+        """
+        Set the index of the first visible line, between 0 and max_scroll.
+        """
+        value = min(max(value, 0), self.max_scroll)
+        if value != self._scroll:
+            self._scroll = value
+            self.invalidate()
+
+    scroll = property(get_scroll, set_scroll)
+
+    def scroll_by(self, lines: int) -> None:
+        """
+        Scroll down by <lines> lines, or up if it is negative.
+        """
+        self.scroll += lines
+
+    @property
+    def area(self) -> Area:
+        return Area(self.x_pos, self.y_pos, self.width, self.height)
+
+    def draw(self) -> None:
+        # The screen is copied first, so that it does not cover the pad when it is refreshed
+        # by WidgetTree.paint().
+        self.renderer.stdscr.noutrefresh()
+        self.pad.noutrefresh(
+            self.scroll,
+            0,
+            self.y_pos,
+            self.x_pos,
+            self.y_pos + self.height - 1,
+            self.x_pos + self.width - 1,
+        )
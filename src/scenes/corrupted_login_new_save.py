@@ -22,12 +22,16 @@ found, and a new save should be created. """
 import curses
 import datetime
 import logging
-from time import sleep
-from typing import Optional
+from functools import partial
+from typing import Optional, Sequence, Type
 
 from src.animations import ether_industries_password_corrupt
+from src.core.prefetch import Resource
+from src.core.render import CursesRenderer
 from src.core.scene import FullScreenScene, Scene
-from src.core.state.save_manager import SaveManager
+from src.core.state import migrations
+from src.core.state.save_manager import get_save_manager
+from src.core.user_interface import LineEditor
 from src.scenes.start_computer import StartComputer
 
 logger = logging.getLogger(__name__)
@@ -39,6 +43,25 @@ class CorruptedLoginNewSave(FullScreenScene):
     the new superuser creation process. It will then create a new save.
     """
 
+    @classmethod
+    def resources(cls, renderer: CursesRenderer) -> Sequence[Resource]:
+        """
+        The password corrupt animation.
+        """
+        return (
+            Resource(
+                "ether_industries_password_corrupt",
+                partial(ether_industries_password_corrupt.create_animation, renderer),
+            ),
+        )
+
+    @classmethod
+    def next_scenes(cls) -> Sequence[Type[Scene]]:
+        """
+        StartComputer, which this scene starts first.
+        """
+        return (StartComputer,)
+
     def start(self) -> Optional[Scene]:  # pylint: disable=R1711
         """
         See above
@@ -49,15 +72,19 @@ class CorruptedLoginNewSave(FullScreenScene):
         self.clear()
         curses.flushinp()
 
-        password_corrupt_animation = ether_industries_password_corrupt.create_animation(
-            self.renderer
-        )
+        (password_corrupt,) = self.resources(self.renderer)
+        ether_industries_password_corrupt.init_colors()
+        password_corrupt_animation = self.take(password_corrupt)
         password_corrupt_animation.start()
         logger.debug("Start FullScreenScene: CorruptedLoginNewSave")
 
-        username_prompt = "New superuser name: "
-        password_prompt = "New superuser password: "
-        password_confirm = "Confirm new superuser password: "
+        username_editor = LineEditor(self.renderer, 1, 5, 30, "New superuser name: ")
+        password_editor = LineEditor(
+            self.renderer, 1, 6, 30, "New superuser password: ", masked=True
+        )
+        password_confirm_editor = LineEditor(
+            self.renderer, 1, 7, 30, "Confirm new superuser password: ", masked=True
+        )
 
         logged_in = False
         logger.debug("Starting login process")
@@ -65,9 +92,9 @@ class CorruptedLoginNewSave(FullScreenScene):
         password = ""
         while not logged_in:
 
-            username = self.prompt(1, 5, username_prompt)
-            password = self.prompt(1, 6, password_prompt)
-            confirmed_password = self.prompt(1, 7, password_confirm)
+            username = username_editor.edit()
+            password = password_editor.edit()
+            confirmed_password = password_confirm_editor.edit()
 
             if password == confirmed_password:
                 # noinspection PyUnusedLocal
@@ -85,20 +112,18 @@ class CorruptedLoginNewSave(FullScreenScene):
                 self.addinto(1, 9, "Passwords do not match.")
                 logger.info("Passwords do not match.")
 
-            sleep(1)
+            self.renderer.clock.sleep(1)
 
         far_away_future = datetime.timedelta(days=365 * 126)
         save_creation = datetime.date.today() + far_away_future
 
-        data = {
-            "metadata": {
-                "save_creation": str(save_creation),
-                "save_date": str(save_creation),
-            },
-            "name": username,
-            "user": {"password": password, "username": username},
-            "progress": {"computer-brand": "ether-industries"},
-        }
+        data = migrations.new_save_data(
+            name=username,
+            username=username,
+            password=password,
+            save_date=str(save_creation),
+            brand="ether-industries",
+        )
 
         self.state.update(data)
 
@@ -106,7 +131,7 @@ class CorruptedLoginNewSave(FullScreenScene):
 
         self.addinto(1, 9, "[ether-login c198762] Creating new user database...")
 
-        save_manager = SaveManager()
+        save_manager = get_save_manager()
         save_manager.save_state(self.state)
         logger.debug("State Saved!")
 
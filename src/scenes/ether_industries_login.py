@@ -23,10 +23,10 @@ This Scene will show login for an Ether Industries computer.
 # ------------------------------------------------------------------------------
 import curses
 import logging
-from time import sleep
 from typing import Optional
 
 from src.core.scene import FullScreenScene, Scene
+from src.core.user_interface import LineEditor
 from src.scenes.story.first_turn_on import FirstTurnOnStory
 
 logger = logging.getLogger(__name__)
@@ -44,8 +44,8 @@ class EtherIndustriesLogin(FullScreenScene):
         curses.flushinp()
         logger.debug("Start Logging in")
 
-        login_prompt = "Login: "
-        password_prompt = "Password: "
+        login_editor = LineEditor(self.renderer, 1, 3, 30, "Login: ")
+        password_editor = LineEditor(self.renderer, 1, 4, 30, "Password: ", masked=True)
 
         expected_password = self.state.data["user"]["password"]
         expected_username = self.state.data["user"]["username"]
@@ -58,10 +58,10 @@ class EtherIndustriesLogin(FullScreenScene):
             self.clear()
             self.addinto(1, 1, "Ether Industry EtherOS v6.2.4 (black-hole-01) (tty1)")
 
-            username = self.prompt(1, 3, login_prompt)
-            password = self.prompt(1, 4, password_prompt)
+            username = login_editor.edit()
+            password = password_editor.edit()
 
-            sleep(0.2)
+            self.renderer.clock.sleep(0.2)
 
             if username == expected_username and password == expected_password:
                 self.addinto(1, 5, f"Last login: {self.state.lastsave}")
@@ -77,5 +77,5 @@ class EtherIndustriesLogin(FullScreenScene):
                     password,
                     expected_password,
                 )
-                sleep(1)
+                self.renderer.clock.sleep(1)
         return FirstTurnOnStory(self.renderer, self.state)
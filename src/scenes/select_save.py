@@ -23,15 +23,23 @@ be loaded.
 # ------------------------------------------------------------------------------
 import curses
 import logging
-from time import sleep
-from typing import Optional, List
+from functools import partial
+from typing import Callable, Dict, Optional, List, Sequence, Tuple, Type
 
 from src import GAME_ROOT_DIR
+from src.core.fuzzy_index import FuzzyIndex
+from src.core.input_decoder import BACKSPACE, ENTER, ESCAPE
+from src.core.keymap import Keymap, NAVIGATION_KEYS
+from src.core.prefetch import Resource
 from src.core.render import CursesRenderer
-from src.core.scene import FullScreenScene, Scene
+from src.core.scene import SAVES, FullScreenScene, Scene
 from src.core.state.game_state import GameState
-from src.core.state.save_manager import SaveManager
+from src.core.state.save_collection import SaveCollection
+from src.core.state.save_manager import get_save_manager
+from src.core.state.save_watcher import DELETED, SaveEvent, SaveWatcher
+from src.core.text_width import text_width
 from src.core.user_interface import ListRenderer, TreeListRenderer
+from src.core.widgets import ArtPanel, Label, Separator, StatusBar, TextPanel, WidgetTree
 from src.scenes.corrupted_login_new_save import CorruptedLoginNewSave
 from src.scenes.start_computer import StartComputer
 
@@ -50,24 +58,100 @@ ACTION_LIST_TITLE = " " + "Actions" + " "
 
 TITLE_Y_POS = 1
 
+SEARCH_KEY = "/"
+QUIT_KEY = "q"
+
+LOAD_SAVE = "Load save"
+RENAME_SAVE = "Rename save"
+DELETE_SAVE = "Delete save"
+CREATE_NEW_SAVE = "Create new save"
+
+# The help shown for each action, when a save is selected and when there are no saves.
+ACTION_HELPS: Dict[str, Tuple[str, str]] = {
+    LOAD_SAVE: ("ENTER: Load save '{}'", "No save to load"),
+    RENAME_SAVE: ("ENTER: Rename save '{}'", "No save to rename"),
+    DELETE_SAVE: ("ENTER: Delete save '{}'", "No save to delete"),
+    CREATE_NEW_SAVE: ("ENTER: Create new save", "ENTER: Create new save"),
+}
+
+# Number of seconds between two checks for changes in the save directory, while waiting for a
+# key press.
+WATCH_INTERVAL = 0.5
+
 
 class SelectSave(FullScreenScene):
     """
     Present the user with a list of saves, and allows him to manage them.
     """
 
-    def __init__(self, renderer: CursesRenderer, state: GameState) -> None:
+    def __init__(
+        self,
+        renderer: CursesRenderer,
+        state: GameState,
+        saves: Optional[SaveCollection] = None,
+    ) -> None:
         super().__init__(renderer, state)
         logger.info("Initialising save manager")
 
         self.last_selected_save_index = 0
 
+        # all_saves contains every save, sorted by name. saves contains the
+        # saves shown in the save list, which are filtered by search_query.
+        # The saves can be given by the previous scene, if it already got them.
+        self.all_saves = saves if saves is not None else self.get_saves()
+        self.saves: Sequence[GameState] = self.all_saves
+        self.search_index: FuzzyIndex[GameState] = FuzzyIndex()
+        for save in self.all_saves:
+            self.search_index.add(save, save.data["name"])
+        self.search_query = ""
+        self.searching = False
+
+        # saves added, modified or deleted by something else than this scene,
+        # for example another instance of the game, are shown as they happen.
+        # The watcher is only created while the scene runs, and only if the
+        # saves are files, see start().
+        self.watcher: Optional[SaveWatcher] = None
+
+        # the actions of the action list, in order. Every action but creating a
+        # new save needs a selected save.
+        self.actions: Dict[str, Callable[[], Optional[Scene]]] = {
+            LOAD_SAVE: self.load_game,
+            RENAME_SAVE: self.rename_save,
+            DELETE_SAVE: self.delete_save,
+            CREATE_NEW_SAVE: self.create_new_save,
+        }
+
         self.save_list = self.create_save_list()
         self.action_list = self.create_action_list()
         self.treelist = TreeListRenderer(
             self.renderer, TREE_X_POS, TREE_Y_POS, [self.save_list, self.action_list]
         )
 
+        self.keymap = self.create_keymap()
+        self.search_keymap = self.create_search_keymap()
+
+        # only the widgets that changed are drawn again after each key press
+        self.save_title: Label
+        self.action_title: Label
+        self.status_bar: StatusBar
+        self.infos: TextPanel
+        self.logo: ArtPanel
+        self.widgets = self.create_widgets()
+
+    @classmethod
+    def resources(cls, renderer: CursesRenderer) -> Sequence[Resource]:
+        """
+        The saves.
+        """
+        return (SAVES,)
+
+    @classmethod
+    def next_scenes(cls) -> Sequence[Type[Scene]]:
+        """
+        Loading a save, or creating a new save.
+        """
+        return StartComputer, CorruptedLoginNewSave
+
     def start(self) -> Optional[Scene]:
         """
         Present the user with a list of saves, and allows him to manage them.
@@ -77,116 +161,187 @@ class SelectSave(FullScreenScene):
 
         logger.info("Starting Scene: SelectSave")
 
-        SEPARATOR_1_POS = self.save_list.actual_width + 1
-        SEPARATOR_2_POS = (
-            self.action_list.actual_width + self.save_list.actual_width + 2
-        )
-
-        PROPERTIES_X_POS = SEPARATOR_2_POS + MARGIN + 1
-
-        ACTION_LIST_X_POS = TREE_X_POS + (MARGIN * 2) + MAX_LENGTH
-
-        key = ""
-        while key != "q":
-            if self.save_list.items == []:
-                self.save_list.selected = False
-                self.action_list.selected = True
-
-                self.save_list.highlight_selected = False
-            else:
-                self.save_list.highlight_selected = True
-
-            self.clear()
-
-            # draw
-            self.treelist.draw()
-
-            # separator
-            self.show_separator(SEPARATOR_1_POS)
-            self.show_separator(SEPARATOR_2_POS)
-
-            # title
-            if self.save_list.selected:
-                save_title_color = curses.A_BOLD | curses.A_REVERSE
-                action_title_color = 0
-            elif self.action_list.selected:
-                save_title_color = 0
-                action_title_color = curses.A_BOLD | curses.A_REVERSE
-            else:
-                save_title_color = 0
-                action_title_color = 0
-
-            self.draw_centred(
-                SAVE_LIST_TITLE,
-                TREE_X_POS,
-                SEPARATOR_1_POS,
-                TITLE_Y_POS,
-                save_title_color,
-            )
-            self.draw_centred(
-                ACTION_LIST_TITLE,
-                SEPARATOR_1_POS,
-                SEPARATOR_2_POS,
-                TITLE_Y_POS,
-                action_title_color,
-            )
+        if not get_save_manager().save_files:
+            # there is no save directory to watch
+            return self.run()
+
+        # the saves can have changed since they were loaded, before the
+        # watcher was created
+        baseline = {
+            save.filepath: save.file_mtime
+            for save in self.all_saves
+            if save.filepath is not None and save.file_mtime is not None
+        }
+        self.watcher = SaveWatcher(baseline=baseline)
+        try:
+            self.watcher.subscribe(self.on_save_event)
+            return self.run()
+        finally:
+            self.watcher.close()
+            self.watcher = None
 
-            self.addinto(
-                PROPERTIES_X_POS,
-                TITLE_Y_POS,
-                " Properties ",
-                curses.A_DIM | curses.A_REVERSE,
-            )
+    def run(self) -> Optional[Scene]:
+        """
+        Main loop of the scene: draw, then handle a key press.
+        """
+        self.widgets.invalidate_all()
 
-            self.show_help()
-            self.show_properties(
-                PROPERTIES_X_POS, INFO_Y_POS, ACTION_LIST_X_POS, MAX_LENGTH
-            )  # this should be last, because of the delay.
+        while True:
+            self.update_widgets()
+            self.widgets.paint()
 
             # key
-            key = self.get_key()
-            next_scene = self.handle_key(key)
+            key = self.get_key_or_save_event()
+            if key is None:  # the saves changed
+                continue
+            if key == QUIT_KEY and not self.searching:
+                return None  # quit
+
+            next_scene = self.handle_keys(key)
             if next_scene is not None:
                 return next_scene
 
-        return None  # if quit
+    def get_key_or_save_event(self) -> Optional[str]:
+        """
+        Wait for a key to be pressed, and return it. If the save directory
+        changes while waiting, return None instead, so that the screen can be
+        redrawn. Without a watcher (see start()), only wait for a key.
+
+        If the clock does not wait (see Clock.waits), the save directory is
+        only checked once before waiting for a key press.
+        """
+        if self.watcher is None:
+            return self.renderer.get_key()
+        if not self.renderer.clock.waits:
+            if self.watcher.poll():
+                return None
+            return self.renderer.get_key()
+
+        while True:
+            key = self.renderer.get_key_timeout(WATCH_INTERVAL)
+            if key is not None:
+                return key
+            if self.watcher.poll():
+                return None
+
+    def on_save_event(self, event: SaveEvent) -> None:
+        """
+        Update the saves, the search index and the save list after a save file
+        was added, modified or deleted. The selected save stays selected.
+        """
+        selected = self.saves[self.save_list.index] if self.saves else None
+        save = self.all_saves.find(event.path)
+
+        if event.kind == DELETED:
+            if save is None:
+                return  # deleted by this scene
+            self.search_index.remove(save)
+            index = self.all_saves.remove(save)
+            if not self.search_query:
+                self.save_list.remove_item(index)
+            self.update_selection(selected)
+            return
+
+        new_save = save is None
+        if save is None:
+            save = GameState()
+        try:
+            save.load(event.path)
+        except (OSError, ValueError):
+            logger.warning("Could not load save '%s'", event.path, exc_info=True)
+            return
+
+        name = save.data["name"]
+        self.search_index.update(save, name)
+        if new_save:
+            new_index = self.all_saves.add(save)
+        else:
+            old_index, new_index = self.all_saves.update(save)
+            if not self.search_query:
+                self.save_list.remove_item(old_index)
+        if not self.search_query:
+            self.save_list.insert_item(new_index, name)
+        self.update_selection(selected)
+
+    def update_selection(self, selected: Optional[GameState]) -> None:
+        """
+        Select <selected> in the save list after the saves changed.
+
+        With a search query, the save list is filtered again. Otherwise, the
+        save list items must already be up to date.
+        """
+        if self.search_query:
+            self.apply_search(selected)
+            return
+
+        if selected is not None and selected in self.all_saves:
+            index = self.all_saves.index(selected)
+        else:
+            # the selected save was deleted
+            index = min(self.save_list.index, len(self.save_list.items) - 1)
+        self.save_list.select(index)
 
     def load_game(self) -> StartComputer:
         """
         Load the selected save. Returns the next scene.
         """
-        self.state = self.get_saves()[self.save_list.index]
+        self.state = self.saves[self.save_list.index]
+        self.load_data(self.state)
         return StartComputer(self.renderer, self.state)
 
+    def create_new_save(self) -> CorruptedLoginNewSave:
+        """
+        Returns the scene creating a new save.
+        """
+        return CorruptedLoginNewSave(self.renderer, self.state)
+
+    def run_selected_action(self) -> Optional[Scene]:
+        """
+        Run the action selected in the action list. Returns the next scene, if
+        the action leaves this scene.
+        """
+        action = self.action_list.selected_item
+        assert action is not None, "The action list can not be empty"
+
+        if action != CREATE_NEW_SAVE and self.save_list.items == []:
+            return None
+        return self.actions[action]()
+
     def rename_save(self) -> None:
         """
         Prompt the user for a new name for the selected save, and rename this
         save.
         """
-        selected_state = self.get_saves()[self.save_list.index]
+        selected_state = self.saves[self.save_list.index]
         name = selected_state.data["name"]
 
         # prompt for name
         prompt_text = "New name for save '{}': ".format(name)
         new_name = self.prompt(
-            round(self.renderer.max_x / 2) - 15 - round(len(prompt_text) / 2),
+            round(self.renderer.max_x / 2) - 15 - round(text_width(prompt_text) / 2),
             round(self.renderer.max_y / 2),
             prompt_text,
         )
 
         # actual renameing
-        save_manager = SaveManager()
+        save_manager = get_save_manager()
         save_manager.rename(selected_state, new_name)
 
-        # update save_list names
-        self.update_save_list_names()
+        self.search_index.update(selected_state, new_name)
+        self.all_saves.update(selected_state)
+
+        # update save_list names, the renamed save stays selected
+        self.apply_search(selected_state)
+
+        # the prompt was drawn over the widgets
+        self.widgets.invalidate_all()
 
     def delete_save(self) -> None:
         """
         Prompt the user for confirmation, and if the user confirms, delete the
         selected save.
         """
-        selected_state = self.get_saves()[self.save_list.index]
+        selected_state = self.saves[self.save_list.index]
         name = selected_state.data["name"]
 
         confirmation_prompt = " Are you sure you want to delete the save '{}'? ".format(
@@ -196,29 +351,130 @@ class SelectSave(FullScreenScene):
         do_delete = self.get_confirmation(confirmation_prompt)
 
         if do_delete:
-            SaveManager().delete(selected_state)
+            get_save_manager().delete(selected_state)
+
+            self.search_index.remove(selected_state)
+            self.all_saves.remove(selected_state)
 
             # update save_list names
-            self.update_save_list_names()
+            self.apply_search()
+
+        # the confirmation was drawn over the widgets
+        self.widgets.invalidate_all()
+
+    def apply_search(self, selected: Optional[GameState] = None) -> None:
+        """
+        Filter the save list with the current search query. An empty query
+        shows every save.
+
+        See update_save_list_names() for the meaning of <selected>.
+        """
+        if self.search_query:
+            self.saves = self.search_index.search(self.search_query)
+        else:
+            self.saves = self.all_saves
+        self.update_save_list_names(selected)
+
+    def start_search(self) -> None:
+        """
+        Start typing a search query in the save list.
+        """
+        self.searching = True
+        self.treelist.select_list(0)
+
+    def stop_search(self) -> None:
+        """
+        Stop typing the search query, but keep filtering the save list.
+        """
+        self.searching = False
+
+    def clear_search(self) -> None:
+        """
+        Stop typing the search query, and show every save.
+        """
+        self.searching = False
+        self.set_search_query("")
+
+    def erase_search(self) -> None:
+        """
+        Remove the last character of the search query.
+        """
+        self.set_search_query(self.search_query[:-1])
+
+    def type_search(self, key: str) -> None:
+        """
+        Add <key> to the search query, if it is printable.
+        """
+        if len(key) == 1 and key.isprintable():
+            self.set_search_query(self.search_query + key)
+
+    def set_search_query(self, query: str) -> None:
+        """
+        Filter the save list with <query>, and select the best match.
+        """
+        self.search_query = query
+        self.apply_search()
+        # the best match is the first one
+        self.save_list.select(0)
+
+    def create_keymap(self) -> Keymap:
+        """
+        Return the keymap used when the user is not typing a search query.
+        """
+        keymap = Keymap()
+        for key in NAVIGATION_KEYS:
+            keymap.bind(key, partial(self.treelist.check_input, key), repeatable=True)
+        keymap.bind(SEARCH_KEY, self.start_search)
+        keymap.bind(ENTER, self.run_selected_action)
+        return keymap
+
+    def create_search_keymap(self) -> Keymap:
+        """
+        Return the keymap used while the user is typing a search query.
+
+        Printable keys are added to the query, backspace removes the last
+        character, ENTER stops typing but keeps the filter, and ESCAPE stops
+        typing and clears the filter. Up and down still move the selection.
+        """
+        keymap = Keymap(fallback=self.type_search)
+        for key in ("KEY_UP", "KEY_DOWN"):
+            keymap.bind(key, partial(self.treelist.check_input, key), repeatable=True)
+        keymap.bind(ENTER, self.stop_search)
+        keymap.bind(ESCAPE, self.clear_search)
+        keymap.bind(BACKSPACE, self.erase_search)
+        return keymap
+
+    @property
+    def current_keymap(self) -> Keymap:
+        """
+        Return the keymap handling the keys pressed now.
+        """
+        return self.search_keymap if self.searching else self.keymap
 
     def handle_key(self, key: str) -> Optional[Scene]:
         """
-        Handle a key event.
+        Handle a key event. Returns the next scene, if the key leaves this
+        scene.
         """
-        self.treelist.check_input(key)
+        next_scene: Optional[Scene] = self.current_keymap.dispatch(key)
+        return next_scene
 
-        if key == "\n":  # action
-            index = self.action_list.index
-            if index == 3:  # create new
-                return CorruptedLoginNewSave(self.renderer, self.state)
-            if self.save_list.items != []:
-                if index == 0:  # Load game
-                    return self.load_game()
-                if index == 1:  # Rename
-                    self.rename_save()
-                elif index == 2:  # Delete
-                    self.delete_save()
-        return None
+    def handle_keys(self, key: str) -> Optional[Scene]:
+        """
+        Handle <key>, and then every queued key that only moves a selection
+        (for example, auto-repeated arrow keys), so that the screen is drawn
+        once for all of them instead of falling behind the keyboard.
+        """
+        next_scene = self.handle_key(key)
+        while next_scene is None:
+            queued = self.renderer.get_key_timeout(0)
+            if queued is None:
+                break
+            if not self.current_keymap.is_repeatable(queued):
+                self.renderer.unget_key(queued)
+                break
+            next_scene = self.handle_key(queued)
+        return next_scene
 
     def create_save_list(self) -> ListRenderer:
         """
@@ -226,7 +482,15 @@ class SelectSave(FullScreenScene):
         alphabetically.
         """
         save_list = ListRenderer(
-            self.renderer, 0, 0, self.get_save_names(), True, MAX_LENGTH, MARGIN,
+            self.renderer,
+            0,
+            0,
+            self.get_save_names(),
+            True,
+            MAX_LENGTH,
+            MARGIN,
+            # every row between the tree and the down bar
+            self.renderer.max_y - TREE_Y_POS - 1,
         )
         return save_list
 
@@ -238,50 +502,109 @@ class SelectSave(FullScreenScene):
             self.renderer,
             0,
             0,
-            ["Load save", "Rename save", "Delete save", "Create new save"],
+            list(self.actions),
             True,
             MAX_LENGTH,
             MARGIN,
         )
         return action_list
 
-    def draw_centred(
-        self, text: str, left: int, right: int, y_pos: int, color_pair: int = 0
-    ) -> None:
+    def create_widgets(self) -> WidgetTree:
         """
-        Draw <text> centered between <left> and <right> at <y_pos> with
-        color_pair <color_pair>.
+        Return the widgets of the scene, in drawing order.
         """
-        logger.debug(
-            "Drawing centred text '%s' with left %s right %s y_pos %s.",
-            text,
-            left,
-            right,
-            y_pos,
+        separator_1_pos = self.save_list.actual_width + 1
+        separator_2_pos = (
+            self.action_list.actual_width + self.save_list.actual_width + 2
+        )
+        properties_x_pos = separator_2_pos + MARGIN + 1
+        logo_x_pos = TREE_X_POS + (MARGIN * 2) + MAX_LENGTH
+
+        widgets = WidgetTree(self.renderer)
+
+        self.save_title = widgets.add(
+            Label(
+                self.renderer,
+                self.centred_x_pos(SAVE_LIST_TITLE, TREE_X_POS, separator_1_pos),
+                TITLE_Y_POS,
+                SAVE_LIST_TITLE,
+            )
+        )
+        self.action_title = widgets.add(
+            Label(
+                self.renderer,
+                self.centred_x_pos(ACTION_LIST_TITLE, separator_1_pos, separator_2_pos),
+                TITLE_Y_POS,
+                ACTION_LIST_TITLE,
+            )
+        )
+        widgets.add(
+            Label(
+                self.renderer,
+                properties_x_pos,
+                TITLE_Y_POS,
+                " Properties ",
+                curses.A_DIM | curses.A_REVERSE,
+            )
         )
 
-        x_pos = left + round((right - left) / 2) - round(len(text) / 2)
+        for x_pos in (separator_1_pos, separator_2_pos):
+            widgets.add(Separator(self.renderer, x_pos, 1, self.renderer.max_y - 2))
 
-        logger.debug("Drawing centred text '%s' at (%s, %s)", text, x_pos, y_pos)
-        self.addinto(x_pos, y_pos, text, color_pair)
+        widgets.add(self.save_list)
+        widgets.add(self.action_list)
 
-    def get_save_names(self) -> List[str]:
+        self.status_bar = widgets.add(StatusBar(self.renderer, color_pair=curses.A_REVERSE))
+
+        # these should be last, because of the delay.
+        self.infos = widgets.add(TextPanel(self.renderer, properties_x_pos, INFO_Y_POS))
+        self.logo = widgets.add(
+            ArtPanel(self.renderer, logo_x_pos, MAX_LENGTH, self.renderer.max_y - 2)
+        )
+
+        return widgets
+
+    def update_widgets(self) -> None:
+        """
+        Update the widgets to show the current state of the scene. Only the
+        widgets that actually change will be drawn again.
+        """
+        if self.save_list.items == []:
+            self.save_list.selected = False
+            self.action_list.selected = True
+
+            self.save_list.highlight_selected = False
+        else:
+            self.save_list.highlight_selected = True
+
+        # title
+        if self.save_list.selected:
+            self.save_title.color_pair = curses.A_BOLD | curses.A_REVERSE
+            self.action_title.color_pair = 0
+        elif self.action_list.selected:
+            self.save_title.color_pair = 0
+            self.action_title.color_pair = curses.A_BOLD | curses.A_REVERSE
+        else:
+            self.save_title.color_pair = 0
+            self.action_title.color_pair = 0
+
+        self.status_bar.text = self.get_help()
+        self.update_properties()
+
+    @staticmethod
+    def centred_x_pos(text: str, left: int, right: int) -> int:
         """
-        Get a list of save names, sorted alphabetically.
+        Return the x_pos of <text> centered between <left> and <right>.
         """
-        names = []
-        for save in self.get_saves():
-            names.append(save.data["name"])
-        return names
+        return left + round((right - left) / 2) - round(text_width(text) / 2)
 
-    def show_separator(self, x_pos: int) -> None:
+    def get_save_names(self) -> List[str]:
         """
-        Show a separator at the given x_pos
-        :param x_pos: the x_pos of the separator
+        Get the names of the saves shown in the save list, in order.
         """
-        self.renderer.stdscr.vline(
-            1, x_pos, curses.ACS_VLINE, self.renderer.max_y - 2  # type: ignore
-        )
+        if isinstance(self.saves, SaveCollection):
+            return self.saves.names
+        return [save.data["name"] for save in self.saves]
 
     def get_confirmation(self, confirmation_prompt: str) -> bool:
         """
@@ -316,44 +639,37 @@ class SelectSave(FullScreenScene):
             return True
         return False
 
-    def show_infos(self, x_pos: int, y_pos: int, delay: float, save: GameState) -> None:
+    @staticmethod
+    def load_data(save: GameState) -> None:
         """
-        Show the infos.
+        Load all the data of <save>, if the save backend only listed its summary.
         """
-        infos = [
-            "Note: {d[note]}",
-            "Debug: {d[debug]}",
-            "Username: '{d[user][username]}'",
-            "Password: '{d[user][password]}'",
+        if save.summary:
+            get_save_manager().load_data(save)
+
+    def get_infos(self, save: GameState) -> List[str]:
+        """
+        Return the infos of <save>.
+        """
+        self.load_data(save)
+        infos: List[str] = []
+        if save.data["note"]:
+            infos.append("Note: {}".format(save.data["note"]))
+        debug_options = [
+            option for option, enabled in save.data["debug"].items() if enabled
         ]
+        if debug_options:
+            infos.append("Debug: {}".format(", ".join(debug_options)))
+        infos.append("Username: '{}'".format(save.data["user"]["username"]))
+        infos.append("Password: '{}'".format(save.data["user"]["password"]))
+        return infos
 
-        skipped_info_counter = 0
-        for index, info in enumerate(infos):
-            try:
-                self.addinto(
-                    x_pos,
-                    y_pos + index - skipped_info_counter,
-                    info.format(d=save.data),
-                )
-            except KeyError:
-                # if the save does not contain the given key, simply skip it.
-                # we increment this counter to make sure that there are no blank
-                # lines
-                skipped_info_counter += 1
-            else:
-                sleep(delay)
-
-    def show_properties(
-        self, x_pos: int, y_pos: int, logo_x_pos: int, logo_max_length: int
-    ) -> None:
+    def update_properties(self) -> None:
         """
         Show the properties of the currently selected save.
 
-        Actually does two thinkgs: display the infos, and display the brand
-        logo.
+        Actually does two thinkgs: show the infos, and show the brand logo.
         """
-        # TODO: split brand logo display and info display into separate methods.
-
         # the delay will be 0.02 if a different save is selected, but 0 if the
         # same save is selected. This ensures that no redraw animation is
         # displayed when selecting an action.
@@ -363,29 +679,26 @@ class SelectSave(FullScreenScene):
         else:
             self.last_selected_save_index = self.save_list.index
             delay = 0.02
+        self.infos.reveal_delay = delay
+        self.logo.reveal_delay = delay
 
         try:
-            save = self.get_saves()[self.save_list.index]
+            save = self.saves[self.save_list.index]
         except IndexError:
-            # if there are no saves, or an invalid save, do nothing and don't
-            # draw anything.
+            # if there are no saves, or an invalid save, don't show anything.
+            self.infos.lines = []
+            self.logo.art = ""
             return
 
-        self.show_infos(x_pos, y_pos, delay, save)
-        self.show_computer_brand(logo_x_pos, logo_max_length, delay, save)
+        self.infos.lines = self.get_infos(save)
+        self.logo.art = self.get_computer_brand_logo(save)
 
-    def show_computer_brand(
-        self, logo_x_pos: int, logo_max_length: int, delay: float, save: GameState
-    ) -> None:
+    @staticmethod
+    def get_computer_brand_logo(save: GameState) -> str:
         """
-        Show the brand logo for the provided save at the given x_pos.
+        Return the brand logo for the provided save.
         """
-        computer_brand = "none"
-        try:
-            logger.debug("Trying to get computer brand info from save file")
-            computer_brand = save.data["progress"]["computer-brand"]
-        except KeyError:
-            logger.warning("Failed to get computer brand info from save file")
+        computer_brand: str = save.data["progress"]["computer-brand"]
         computer_brand_path = GAME_ROOT_DIR / "assets" / "brand_logo" / computer_brand
 
         try:
@@ -395,54 +708,49 @@ class SelectSave(FullScreenScene):
             computer_brand_logo = "Asset missing"
 
         lines = computer_brand_logo.splitlines()
-        max_line_length = max([len(line) for line in lines])
+        max_line_length = max(map(text_width, lines))
         assert (
-            max_line_length < logo_max_length
+            max_line_length < MAX_LENGTH
         ), "The logo is to large to be displayed! The maximum width is {} characters".format(
-            logo_max_length
+            MAX_LENGTH
         )
-        x_pos = logo_x_pos + round(logo_max_length / 2) - round(max_line_length / 2)
-        y_pos = self.renderer.max_y - len(lines) - 1  # -1 for the border
-        for index, line in enumerate(lines):
-            self.addinto(x_pos, y_pos + index, line)
-            sleep(delay)
+        return computer_brand_logo
 
-    def update_save_list_names(self) -> None:
+    def update_save_list_names(self, selected: Optional[GameState] = None) -> None:
         """
         Update the names in the save list.
+
+        If <selected> is shown in the save list, it is selected. Otherwise the
+        selected index does not change.
         """
         index = self.save_list.index
 
-        self.save_list = self.create_save_list()
+        self.save_list.items = self.get_save_names()
 
-        self.save_list.index = index
+        if selected is not None and selected in self.saves:
+            index = self.saves.index(selected)
 
-        self.save_list.selected = False
-        self.treelist.items[0] = self.save_list
-        self.treelist.set_items_position()
+        # the selected save may have been deleted
+        self.save_list.select(min(index, len(self.save_list.items) - 1))
 
-    def show_help(self) -> None:
+    def get_help(self) -> str:
         """
-        Show a helpful message at the bottom of the screen.
+        Return a helpful message, shown at the bottom of the screen.
         """
-        if self.save_list.items == []:
-            helps = [
-                "No save to load",
-                "No save to rename",
-                "No save to delete",
-                "ENTER: Create new save",
-            ]
-            help_text = helps[self.action_list.index]
+        if self.searching:
+            help_text = "Search: {}_ (ENTER: done, ESC: clear)".format(
+                self.search_query
+            )
+        elif self.save_list.items == [] and self.search_query:
+            help_text = "No save matches '{}' (/: search again)".format(
+                self.search_query
+            )
+        elif self.save_list.items == []:
+            _, help_text = ACTION_HELPS[self.action_list.selected_item or LOAD_SAVE]
         else:
-            selected_save = self.get_saves()[self.save_list.index]
-            helps = [
-                "ENTER: Load save '{}'",
-                "ENTER: Rename save '{}'",
-                "ENTER: Delete save '{}'",
-                "ENTER: Create new save",
-            ]
+            selected_save = self.saves[self.save_list.index]
+            help_text, _ = ACTION_HELPS[self.action_list.selected_item or LOAD_SAVE]
             name = selected_save.data["name"]
-            help_text = helps[self.action_list.index]
             help_text = help_text.format(name)
 
-        self.renderer.add_down_bar_text(help_text, 0, curses.A_REVERSE)
+        return help_text
@@ -22,9 +22,13 @@ This scene is for the start of the game, this computer is the first that the use
 
 import curses
 import logging
+from functools import partial
 from pathlib import Path
+from typing import Sequence
 
 from src.animations import start_computer_bios, start_computer_boot
+from src.core.prefetch import Resource
+from src.core.render import CursesRenderer
 from src.core.scene import FullScreenScene
 from src.scenes.ether_industries_login import EtherIndustriesLogin
 
@@ -48,6 +52,22 @@ class StartComputer(FullScreenScene):
     The first computer the user can use.
     """
 
+    @classmethod
+    def resources(cls, renderer: CursesRenderer) -> Sequence[Resource]:
+        """
+        The BIOS and boot animations.
+        """
+        return (
+            Resource(
+                "start_computer_bios",
+                partial(start_computer_bios.create_animation, renderer),
+            ),
+            Resource(
+                "start_computer_boot",
+                partial(start_computer_boot.create_animation, renderer),
+            ),
+        )
+
     def start(self) -> EtherIndustriesLogin:  # pylint: disable=R0914
         """
         Shows the init sequence of the first computer.
@@ -58,16 +78,13 @@ class StartComputer(FullScreenScene):
 
         self.clear()
 
-        skip_animation = False
-        try:
-            skip_animation = self.state.data["debug"]["skip-boot-animation"]
-        except KeyError:
-            pass
-
-        if not skip_animation:
+        if self.state.data["debug"]["skip-boot-animation"]:
             logger.debug("Used debug option to skip boot animation")
+        else:
+            bios_resource, boot_resource = self.resources(self.renderer)
 
-            animation = start_computer_bios.create_animation(self.renderer)
+            start_computer_bios.init_colors()
+            animation = self.take(bios_resource)
             y_pos = animation.start()
 
             font_logo = (
@@ -76,7 +93,8 @@ class StartComputer(FullScreenScene):
             self.addinto_all_centred(LOGO_START, 0.05)
             self.addinto_all_centred(LOGO_DONE, color_pair=font_logo)
 
-            animation = start_computer_boot.create_animation(self.renderer)
+            start_computer_boot.init_colors()
+            animation = self.take(boot_resource)
             animation.start(y_pos + 1)  # leave a blank line
 
         return EtherIndustriesLogin(self.renderer, self.state)
@@ -22,12 +22,15 @@ This FullScreenScene is responsible for showing the game's title and startup mes
 
 import curses
 import logging
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import Any, Sequence, Type
 
-from src.core.scene import FullScreenScene
-from src.core.state.save_manager import SaveManager
+from src.core.input_decoder import ENTER
+from src.core.keymap import Keymap
+from src.core.scene import FullScreenScene, Scene
 from src.scenes.corrupted_login_new_save import CorruptedLoginNewSave
+from src.core.widgets import StatusBar, Viewport, WidgetTree
 from src.scenes.select_save import SelectSave
 
 logger = logging.getLogger(__name__)
@@ -43,12 +46,22 @@ with FULL_LICENSE_PATH.open("r") as f:
     licence = [line.strip() for line in f]
     FULL_LICENSE = "\n".join(licence)
 
+LICENCE_HELP = "UP/DOWN: scroll, PGUP/PGDN/SPACE: page, HOME/END, q/ENTER: continue"
+LICENCE_QUIT_KEYS = ("q", ENTER)
+
 
 class StartupScene(FullScreenScene):
     """
     This scene is called at the start of the game, in engine.py
     """
 
+    @classmethod
+    def next_scenes(cls) -> Sequence[Type[Scene]]:
+        """
+        The save selection, or the creation of a new save if there is none.
+        """
+        return SelectSave, CorruptedLoginNewSave
+
     def start(self) -> Any:  # pylint: disable=R1711
         """
         Shows a copyright notice and the game's title.
@@ -83,13 +96,45 @@ class StartupScene(FullScreenScene):
         self.clear()
         if key == "l":
             logger.info("Showing license")
-            self.addinto_all_centred("Press any key to advance.")
-            self.get_key()
-            self.addinto_all_centred(FULL_LICENSE, 0.01, 10)
-            # TODO refresh line by line, do not clear the entire screen
+            self.show_licence()
 
-        save_manager = SaveManager()
-        saves = save_manager.saves
+        saves = self.get_saves()
         if len(saves) == 0:
             return CorruptedLoginNewSave(self.renderer, self.state)
-        return SelectSave(self.renderer, self.state)
+        return SelectSave(self.renderer, self.state, saves)
+
+    def show_licence(self) -> None:
+        """
+        Show the full licence in a scrollable viewport, until the user quits it.
+        """
+        viewport = Viewport(
+            self.renderer,
+            1,
+            1,
+            self.renderer.max_x - 2,
+            self.renderer.max_y - 2,
+            FULL_LICENSE,
+            centred=True,
+        )
+        widgets = WidgetTree(
+            self.renderer, [StatusBar(self.renderer, LICENCE_HELP, curses.A_REVERSE)]
+        )
+        widgets.add(viewport)  # the viewport is refreshed last, see Viewport
+
+        page = viewport.height - 1  # keep one line of context
+        keymap = Keymap()
+        keymap.bind("KEY_DOWN", partial(viewport.scroll_by, 1))
+        keymap.bind("KEY_UP", partial(viewport.scroll_by, -1))
+        keymap.bind(("KEY_NPAGE", " "), partial(viewport.scroll_by, page))
+        keymap.bind("KEY_PPAGE", partial(viewport.scroll_by, -page))
+        keymap.bind("KEY_HOME", partial(viewport.set_scroll, 0))
+        keymap.bind("KEY_END", lambda: viewport.set_scroll(viewport.max_scroll))
+
+        widgets.invalidate_all()
+        key = ""
+        while key not in LICENCE_QUIT_KEYS:
+            widgets.paint()
+            key = self.get_key()
+            keymap.dispatch(key)
+
+        self.clear()
@@ -21,13 +21,19 @@ This FullScreenScene is responsible for showing the game's title and startup mes
 # ------------------------------------------------------------------------------
 
 import logging
+from functools import partial
 from typing import Any
 
 from src.animations.story import first_turn_on
+from src.core.frame_scheduler import FrameScheduler
 from src.core.scene import FullScreenScene
 
 logger = logging.getLogger(__name__)
 
+TAKEOVER_TEXT = "FASM-4 "
+# Number of seconds taken by FASM-4 to fill the screen.
+TAKEOVER_DURATION = 0.5
+
 
 class FirstTurnOnStory(FullScreenScene):
     """
@@ -48,14 +54,14 @@ class FirstTurnOnStory(FullScreenScene):
         animation = first_turn_on.create_animation(self.renderer)
         animation.start()
 
-        for x_pos in range(1, self.renderer.max_x, 7):
-            for y_pos in range(1, self.renderer.max_y - 1):
-                if (x_pos + 6) < self.renderer.max_x:
-                    self.renderer.addtext(x_pos, y_pos, "       ")
-                    self.renderer.addtext(x_pos, y_pos, "FASM-4")
-                    self.sleep_key(0.001)
-                else:
-                    break
+        # FASM-4 fills the screen column by column, from top to bottom
+        width = len(TAKEOVER_TEXT)
+        steps = [
+            partial(self.renderer.fill, x_pos, y_pos, width, 1, TAKEOVER_TEXT)
+            for x_pos in range(1, self.renderer.max_x - width + 1, width)
+            for y_pos in range(1, self.renderer.max_y - 1)
+        ]
+        FrameScheduler(self.renderer).reveal(steps, TAKEOVER_DURATION)
 
         self.sleep_key(1)
         return FirstTurnOnStory(self.renderer, self.state)
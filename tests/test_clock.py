@@ -0,0 +1,165 @@
+"""
+Tests for src.core.clock.
+"""
+
+# ------------------------------------------------------------------------------
+#  This file is part of Universal Sandbox.
+#
+#  Copyright (C) © 2020 Khaïs COLIN <logistic-bot@protonmail.com>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from src.core.clock import ScriptedInput, ScriptEnded, VirtualClock, Wait
+
+
+def test_virtual_clock_records_waits() -> None:
+    clock = VirtualClock(10)
+
+    clock.sleep(2)
+    assert clock.timeout(0.5) == 0
+    clock.advance(1)
+
+    assert clock.now() == 13.5
+    assert clock.timeline == [Wait(10, 2), Wait(12, 0.5)]
+    assert clock.elapsed == 2.5
+
+
+def test_polling_for_keys_is_not_a_wait() -> None:
+    clock = VirtualClock()
+
+    assert clock.timeout(0) == 0
+    assert clock.timeline == []
+
+
+def test_scripted_keys_are_typed_after_their_delay() -> None:
+    script = ScriptedInput([(2, "ab"), (1, "c")])
+
+    assert script.read_char(0) is None
+    assert script.read_char(None) == "a"
+    assert script.now() == 2
+    assert script.read_char(0) == "b"
+    assert script.read_char(None) == "c"
+    assert script.now() == 3
+
+
+def test_timeout_ends_when_keys_are_typed() -> None:
+    script = ScriptedInput([(2, "a")])
+
+    script.timeout(0.5)
+    assert script.read_char(0) is None
+    script.timeout(5)
+
+    assert script.now() == 2
+    assert script.read_char(0) == "a"
+    assert script.timeline == [Wait(0, 0.5), Wait(0.5, 1.5)]
+
+
+def test_keys_typed_during_a_sleep_are_read_after_it() -> None:
+    script = ScriptedInput([(1, "a")])
+
+    script.sleep(3)
+
+    assert script.read_char(0) == "a"
+    assert script.now() == 3
+
+
+def test_script_end() -> None:
+    script = ScriptedInput([(0, "a")])
+
+    assert script.read_char(None) == "a"
+    assert script.read_char(0) is None
+    with pytest.raises(ScriptEnded):
+        script.read_char(None)
+
+
+def run_new_game(save_directory: Path, result_path: Path) -> None:
+    # pylint: disable=C0415
+    from src.core.engine import Engine
+    from src.core.state import save_manager
+    from src.core.state.game_state import GameState
+
+    save_manager.SAVE_DIRECTORY = save_directory
+    script = ScriptedInput(
+        [
+            (60, "\n"),  # press any key to start
+            (600, "root\n"),  # new superuser name, once the boot animation ended
+            (1, "secret\n"),
+            (1, "secret\n"),
+        ]
+    )
+    start = time.monotonic()
+    engine = Engine(clock=script, read_char=script.read_char)
+    engine.start()
+    duration = time.monotonic() - start
+    username = engine.game_state.data["user"]["username"]
+    # undo the new game
+    engine.rollback(engine.checkpoints[-1])
+
+    names = []
+    for path in save_directory.iterdir():
+        save = GameState()
+        save.load(path)
+        names.append(save.data["name"])
+    result = {
+        "duration": duration,
+        "virtual_duration": script.now(),
+        "keys_left": len(script.script) + len(script.typed),
+        "saves": names,
+        "checkpoints": [checkpoint.scene for checkpoint in engine.checkpoints],
+        "username": username,
+        "rolled_back_username": engine.game_state.data["user"]["username"],
+    }
+    result_path.write_text(json.dumps(result))
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="needs a pseudo-terminal")
+def test_scripted_new_game(tmp_path: Path) -> None:
+    import pty  # pylint: disable=C0415
+
+    save_directory = tmp_path / "saves"
+    save_directory.mkdir()
+    result_path = tmp_path / "result.json"
+
+    # curses needs a terminal
+    pid, terminal = pty.fork()
+    if pid == 0:
+        try:
+            os.environ["TERM"] = "xterm"
+            run_new_game(save_directory, result_path)
+        finally:
+            os._exit(0)  # pylint: disable=W0212
+
+    try:
+        while os.read(terminal, 65536):
+            pass
+    except OSError:
+        pass  # the terminal was closed
+    os.waitpid(pid, 0)
+
+    result = json.loads(result_path.read_text())
+    assert result["saves"] == ["root"]
+    assert result["keys_left"] == 0
+    assert result["virtual_duration"] > 660
+    assert result["duration"] < 10
+    assert result["checkpoints"] == ["StartupScene", "CorruptedLoginNewSave"]
+    assert result["username"] == "root"
+    assert result["rolled_back_username"] == ""
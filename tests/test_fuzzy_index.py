@@ -0,0 +1,96 @@
+"""
+Tests for src.core.fuzzy_index.
+"""
+
+# ------------------------------------------------------------------------------
+#  This file is part of Universal Sandbox.
+#
+#  Copyright (C) © 2020 Khaïs COLIN <logistic-bot@protonmail.com>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+from src.core.fuzzy_index import FuzzyIndex
+
+
+def create_index() -> FuzzyIndex[int]:
+    index: FuzzyIndex[int] = FuzzyIndex()
+    index.add(1, "Alpha Centauri")
+    index.add(2, "Beta")
+    index.add(3, "Centaur")
+    return index
+
+
+def test_empty_query_returns_everything_sorted() -> None:
+    assert create_index().search("") == [1, 2, 3]
+
+
+def test_prefix_matches_come_before_word_matches() -> None:
+    # "Centaur" starts with the query, "Alpha Centauri" only has a word starting with it
+    assert create_index().search("cent") == [3, 1]
+
+
+def test_search_is_case_insensitive() -> None:
+    assert create_index().search("BETA") == [2]
+
+
+def test_trigram_match_finds_substrings() -> None:
+    assert create_index().search("taur") == [1, 3]
+
+
+def test_trigram_match_tolerates_typos() -> None:
+    assert create_index().search("alpah centauri") == [1]
+
+
+def test_added_key_is_found() -> None:
+    index = create_index()
+    index.add(4, "Gamma")
+
+    assert len(index) == 4
+    assert index.search("gam") == [4]
+
+
+def test_updated_key_is_only_found_by_its_new_text() -> None:
+    index = create_index()
+    index.update(2, "Delta")
+
+    assert index.search("beta") == []
+    assert index.search("del") == [2]
+    assert len(index) == 3
+
+
+def test_removed_key_is_not_found() -> None:
+    index = create_index()
+    index.remove(3)
+
+    assert 3 not in index
+    assert index.search("cent") == [1]
+    assert index.search("centaur") == [1]
+
+
+def test_removing_a_missing_key_does_nothing() -> None:
+    index = create_index()
+    index.remove(42)
+
+    assert len(index) == 3
+
+
+def test_remove_keeps_keys_sharing_a_prefix() -> None:
+    index: FuzzyIndex[int] = FuzzyIndex()
+    index.add(1, "save")
+    index.add(2, "saved game")
+    index.remove(1)
+
+    assert index.search("sav") == [2]
+    index.add(1, "save")
+    assert index.search("sav") == [1, 2]
@@ -0,0 +1,147 @@
+"""
+Tests for src.core.input_decoder.
+"""
+
+# ------------------------------------------------------------------------------
+#  This file is part of Universal Sandbox.
+#
+#  Copyright (C) © 2020 Khaïs COLIN <logistic-bot@protonmail.com>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+from collections import deque
+from typing import Deque, Iterable, List, Optional
+
+from src.core.clock import VirtualClock
+from src.core.input_decoder import ESCAPE, InputDecoder, KeyEvent
+from src.core.render import CursesRenderer
+
+
+class FakeTerminal:
+    """
+    Returns the characters given to it one at a time, like CursesRenderer.read_char(),
+    and times out once they are all read.
+    """
+
+    def __init__(self, chars: Iterable[str] = ()) -> None:
+        self.chars: Deque[str] = deque(chars)
+        self.timeouts: List[Optional[float]] = []
+
+    def read_char(self, timeout: Optional[float]) -> Optional[str]:
+        self.timeouts.append(timeout)
+        if self.chars:
+            return self.chars.popleft()
+        return None
+
+
+def create_decoder(chars: Iterable[str]) -> InputDecoder:
+    return InputDecoder(FakeTerminal(chars).read_char)
+
+
+def read_keys(decoder: InputDecoder) -> List[KeyEvent]:
+    keys = []
+    while True:
+        key = decoder.read_key(0)
+        if key is None:
+            return keys
+        keys.append(key)
+
+
+def test_characters_are_returned_as_keys() -> None:
+    assert read_keys(create_decoder("ab")) == [KeyEvent("a"), KeyEvent("b")]
+
+
+def test_csi_sequence_is_decoded() -> None:
+    assert read_keys(create_decoder("\x1b[Ax")) == [KeyEvent("KEY_UP"), KeyEvent("x")]
+
+
+def test_csi_sequence_split_across_reads() -> None:
+    # one character is read at a time, the decoder waits for the rest of the sequence
+    terminal = FakeTerminal("\x1b[B")
+    decoder = InputDecoder(terminal.read_char, escape_timeout=0.5)
+
+    assert decoder.read_key() == KeyEvent("KEY_DOWN")
+    assert terminal.timeouts == [None, 0.5, 0.5]
+    assert decoder.read_key(0) is None
+
+
+def test_unknown_csi_sequence_is_read_whole() -> None:
+    keys = read_keys(create_decoder("\x1b[1;9Zq"))
+
+    assert keys == [KeyEvent("\x1b[1;9Z"), KeyEvent("q")]
+
+
+def test_bare_escape_times_out() -> None:
+    terminal = FakeTerminal(ESCAPE)
+    decoder = InputDecoder(terminal.read_char, escape_timeout=0.5)
+
+    assert decoder.read_key() == KeyEvent(ESCAPE)
+    assert terminal.timeouts == [None, 0.5]
+
+
+def test_double_escape() -> None:
+    keys = read_keys(create_decoder(ESCAPE * 2))
+
+    assert keys == [KeyEvent(ESCAPE), KeyEvent(ESCAPE)]
+
+
+def test_alt_key() -> None:
+    keys = read_keys(create_decoder("\x1bxy"))
+
+    assert keys == [KeyEvent("x", alt=True), KeyEvent("y")]
+    assert keys[0].name == "M-x"
+
+
+def test_alt_with_a_sequence_start() -> None:
+    assert read_keys(create_decoder("\x1b[")) == [KeyEvent("[", alt=True)]
+
+
+def test_keys_are_normalised() -> None:
+    assert read_keys(create_decoder("\r\x7f")) == [
+        KeyEvent("\n"),
+        KeyEvent("KEY_BACKSPACE"),
+    ]
+
+
+def create_renderer(terminal: FakeTerminal) -> CursesRenderer:
+    # the input of the renderer does not need curses, so skip its initialisation
+    renderer = CursesRenderer.__new__(CursesRenderer)
+    renderer.clock = VirtualClock()
+    renderer.pending_keys = deque()
+    renderer.input_decoder = InputDecoder(terminal.read_char)
+    return renderer
+
+
+def test_escape_sequence_during_a_delay_is_decoded() -> None:
+    terminal = FakeTerminal("\x1b[A")
+    renderer = create_renderer(terminal)
+
+    assert renderer.wait_keypress_delay(1) == "KEY_UP"
+    assert renderer.get_key_timeout(0) is None
+
+
+def test_delay_returns_pending_keys_first() -> None:
+    terminal = FakeTerminal("b")
+    renderer = create_renderer(terminal)
+    renderer.unget_key("a")
+
+    assert renderer.wait_keypress_delay(1) == "a"
+    assert renderer.get_key_timeout(0) == "b"
+
+
+def test_delay_without_key_press() -> None:
+    renderer = create_renderer(FakeTerminal())
+
+    assert renderer.wait_keypress_delay(1) is None
+    assert renderer.clock.now() == 1
@@ -0,0 +1,63 @@
+"""
+Tests for src.core.state.migrations.
+"""
+
+# ------------------------------------------------------------------------------
+#  This file is part of Universal Sandbox.
+#
+#  Copyright (C) © 2020 Khaïs COLIN <logistic-bot@protonmail.com>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+import pytest
+
+from src.core.state.migrations import JSON, SCHEMA_VERSION, new_save_data, upgrade
+
+
+def test_upgrade_adds_missing_sections() -> None:
+    data = {"name": "old save", "user": {"username": "root"}}
+
+    assert upgrade(data)
+
+    expected = new_save_data(name="old save", username="root")
+    assert data == expected
+
+
+def test_upgrade_keeps_existing_values() -> None:
+    data: JSON = {"progress": {"computer-brand": "ether", "extra": 1}}
+
+    upgrade(data)
+
+    assert data["progress"] == {"computer-brand": "ether", "extra": 1}
+    assert data["schema_version"] == SCHEMA_VERSION
+
+
+def test_current_saves_are_not_upgraded() -> None:
+    data = new_save_data(name="new save")
+
+    assert not upgrade(data)
+    assert data == new_save_data(name="new save")
+
+
+@pytest.mark.parametrize("section", [None, "root", 3, ["root"]])
+def test_malformed_sections_are_rejected(section: object) -> None:
+    data = {"user": section}
+
+    with pytest.raises(ValueError, match="'user' section"):
+        upgrade(data)
+
+
+def test_newer_saves_are_rejected() -> None:
+    with pytest.raises(ValueError, match="newer"):
+        upgrade({"schema_version": SCHEMA_VERSION + 1})
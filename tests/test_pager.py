@@ -0,0 +1,119 @@
+"""
+Tests for src.core.pager.
+"""
+
+# ------------------------------------------------------------------------------
+#  This file is part of Universal Sandbox.
+#
+#  Copyright (C) © 2020 Khaïs COLIN <logistic-bot@protonmail.com>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+import pytest
+
+from src.core.pager import Pager
+
+TEXT = "\n".join(str(line) for line in range(10))
+
+
+def lines(*numbers: int) -> list:
+    return [str(number) for number in numbers]
+
+
+def test_pages_split_the_text() -> None:
+    pager = Pager(TEXT, 3)
+
+    assert pager.page_count == 4
+    assert list(pager.pages()) == [
+        lines(0, 1, 2),
+        lines(3, 4, 5),
+        lines(6, 7, 8),
+        lines(9),
+    ]
+
+
+def test_pages_overlap() -> None:
+    pager = Pager(TEXT, 4, overlap=1)
+
+    assert pager.page_count == 3
+    assert pager.page(1) == lines(3, 4, 5, 6)
+    # the last line does not get a page of its own, the previous page shows it
+    assert pager.page(-1) == lines(6, 7, 8, 9)
+
+
+def test_empty_text_has_one_empty_page() -> None:
+    pager = Pager("", 5)
+
+    assert pager.page_count == 1
+    assert pager.page() == []
+    assert not pager.next_page()
+
+
+def test_go_to() -> None:
+    pager = Pager(TEXT, 3)
+
+    pager.go_to(-1)
+    assert pager.page_number == 3
+    with pytest.raises(IndexError):
+        pager.go_to(4)
+    assert not pager.next_page()
+    assert pager.previous_page()
+    assert pager.page() == lines(6, 7, 8)
+
+
+def test_taller_pages_show_the_previous_first_line() -> None:
+    pager = Pager(TEXT, 3)
+    pager.go_to(2)
+
+    pager.set_height(4)
+
+    assert pager.page_count == 3
+    assert pager.page_number == 1
+    assert pager.page() == lines(4, 5, 6, 7)
+
+
+def test_shorter_pages_show_the_previous_first_line() -> None:
+    pager = Pager(TEXT, 5)
+    pager.go_to(1)
+
+    pager.set_height(2)
+
+    assert pager.page_count == 5
+    assert pager.page_number == 2
+    # the page starts before the previous first line, which is still shown
+    assert pager.page() == lines(4, 5)
+
+
+def test_taller_pages_than_the_text() -> None:
+    pager = Pager(TEXT, 3)
+    pager.go_to(-1)
+
+    pager.set_height(20)
+
+    assert pager.page_count == 1
+    assert pager.page_number == 0
+    assert pager.page() == lines(*range(10))
+
+
+def test_page_boundaries_with_overlap_after_set_height() -> None:
+    pager = Pager(TEXT, 3, overlap=1)
+    pager.go_to(3)
+    assert pager.page() == lines(6, 7, 8)
+
+    pager.set_height(4)
+
+    first_lines = [pager.page(number)[0] for number in range(pager.page_count)]
+    assert first_lines == lines(0, 3, 6)
+    assert pager.page() == lines(6, 7, 8, 9)
+    assert not pager.next_page()
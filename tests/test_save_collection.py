@@ -0,0 +1,116 @@
+"""
+Tests for src.core.state.save_collection.
+"""
+
+# ------------------------------------------------------------------------------
+#  This file is part of Universal Sandbox.
+#
+#  Copyright (C) © 2020 Khaïs COLIN <logistic-bot@protonmail.com>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+from pathlib import Path
+
+import pytest
+
+from src.core.state.game_state import GameState
+from src.core.state.save_collection import SaveCollection
+
+
+def create_save(name: str, filename: str) -> GameState:
+    save = GameState()
+    save.data["name"] = name
+    save.filepath = Path("saves") / filename
+    return save
+
+
+def test_saves_are_sorted_case_insensitively() -> None:
+    saves = SaveCollection(
+        [create_save("beta", "1"), create_save("Alpha", "2"), create_save("gamma", "3")]
+    )
+
+    assert saves.names == ["Alpha", "beta", "gamma"]
+
+
+def test_duplicate_names_are_ordered_by_filepath() -> None:
+    second = create_save("save", "b")
+    first = create_save("save", "a")
+    saves = SaveCollection([second, first])
+
+    assert list(saves) == [first, second]
+    assert saves.index(first) == 0
+    assert saves.index(second) == 1
+
+
+def test_add_inserts_at_the_sorted_position() -> None:
+    saves = SaveCollection([create_save("a", "1"), create_save("c", "2")])
+    save = create_save("B", "3")
+
+    assert saves.add(save) == 1
+    assert saves.names == ["a", "B", "c"]
+
+
+def test_add_duplicate_name() -> None:
+    existing = create_save("save", "b")
+    saves = SaveCollection([existing])
+    before = create_save("save", "a")
+    after = create_save("save", "c")
+
+    assert saves.add(after) == 1
+    assert saves.add(before) == 0
+    assert list(saves) == [before, existing, after]
+
+
+def test_remove_returns_the_old_position() -> None:
+    save = create_save("b", "2")
+    saves = SaveCollection([create_save("a", "1"), save, create_save("c", "3")])
+
+    assert saves.remove(save) == 1
+    assert save not in saves
+    assert saves.names == ["a", "c"]
+    with pytest.raises(ValueError):
+        saves.index(save)
+
+
+def test_rename_moves_the_save() -> None:
+    save = create_save("a", "1")
+    saves = SaveCollection([save, create_save("b", "2"), create_save("c", "3")])
+
+    save.data["name"] = "d"
+    assert saves.update(save) == (0, 2)
+    assert saves.names == ["b", "c", "d"]
+    assert saves.index(save) == 2
+
+
+def test_rename_to_a_duplicate_name() -> None:
+    save = create_save("z", "a")
+    other = create_save("same", "b")
+    saves = SaveCollection([save, other])
+
+    save.data["name"] = "same"
+    assert saves.update(save) == (1, 0)
+    assert list(saves) == [save, other]
+
+
+def test_find_by_filepath_follows_moves() -> None:
+    save = create_save("a", "1")
+    saves = SaveCollection([save])
+
+    assert saves.find(Path("saves") / "1") is save
+
+    save.filepath = Path("saves") / "ab" / "1"
+    saves.update(save)
+
+    assert saves.find(Path("saves") / "1") is None
+    assert saves.find(Path("saves") / "ab" / "1") is save
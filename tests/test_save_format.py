@@ -0,0 +1,105 @@
+"""
+Tests for src.core.state.save_format.
+"""
+
+# ------------------------------------------------------------------------------
+#  This file is part of Universal Sandbox.
+#
+#  Copyright (C) © 2020 Khaïs COLIN <logistic-bot@protonmail.com>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+from io import BytesIO
+from typing import Optional
+
+import pytest
+
+from src.core.state import save_format
+from src.core.state.save_format import JSON
+
+# The repeated text compresses into much fewer bytes than CHUNK_SIZE, and expands to more than
+# CHUNK_SIZE bytes.
+DATA = {
+    "name": "save",
+    "progress": {"computer-brand": "ether", "done": [1, 2, 3]},
+    "text": "abcd" * 100_000,
+}
+
+
+def dump(data: JSON, compression: Optional[str]) -> bytes:
+    file = BytesIO()
+    save_format.dump(data, file, compression)
+    return file.getvalue()
+
+
+def load(content: bytes) -> JSON:
+    data, _ = save_format.load(BytesIO(content))
+    return data
+
+
+def test_plain_json_round_trip() -> None:
+    content = dump(DATA, None)
+
+    assert content.startswith(b"{")
+    assert save_format.load(BytesIO(content)) == (DATA, None)
+
+
+@pytest.mark.parametrize("compression", save_format.CODECS)
+def test_compressed_round_trip(compression: str) -> None:
+    content = dump(DATA, compression)
+
+    assert save_format.detect(content) == compression
+    assert len(content) < save_format.CHUNK_SIZE
+    assert save_format.load(BytesIO(content)) == (DATA, compression)
+
+
+@pytest.mark.parametrize("compression", save_format.CODECS)
+def test_truncated_save_is_rejected(compression: str) -> None:
+    content = dump(DATA, compression)
+    header = len(save_format.MAGIC) + 1
+
+    for end in (header, header + 1, len(content) // 2, len(content) - 1):
+        with pytest.raises(ValueError):
+            load(content[:end])
+
+
+@pytest.mark.parametrize("compression", save_format.CODECS)
+def test_trailing_garbage_is_rejected(compression: str) -> None:
+    with pytest.raises(ValueError):
+        load(dump(DATA, compression) + b"junk")
+
+
+@pytest.mark.parametrize("compression", save_format.CODECS)
+def test_trailing_garbage_after_a_full_chunk_is_rejected(compression: str) -> None:
+    content = dump(DATA, compression)
+    padding = b"\0" * save_format.CHUNK_SIZE
+
+    with pytest.raises(ValueError):
+        load(content + padding)
+
+
+@pytest.mark.parametrize("compression", save_format.CODECS)
+def test_corrupt_save_is_rejected(compression: str) -> None:
+    content = bytearray(dump(DATA, compression))
+    start = len(save_format.MAGIC) + 1
+    end = start + 8
+    content[start:end] = b"\xff" * 8
+
+    with pytest.raises(ValueError):
+        load(bytes(content))
+
+
+def test_unknown_codec_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        load(save_format.MAGIC + b"?")
@@ -0,0 +1,113 @@
+"""
+Tests for src.core.state.snapshot, and the snapshots of GameState.
+"""
+
+# ------------------------------------------------------------------------------
+#  This file is part of Universal Sandbox.
+#
+#  Copyright (C) © 2020 Khaïs COLIN <logistic-bot@protonmail.com>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+from src.core.state.game_state import GameState
+from src.core.state.snapshot import StateSnapshot
+
+
+def create_state() -> GameState:
+    state = GameState()
+    state.data["name"] = "save"
+    state.data["user"]["username"] = "root"
+    state.mark_clean()
+    return state
+
+
+def test_restore_undoes_changes() -> None:
+    state = create_state()
+    snapshot = state.snapshot()
+
+    state.data["name"] = "changed"
+    state.data["user"]["username"] = "guest"
+    state.data["new section"] = [1, 2]
+    state.restore(snapshot)
+
+    assert state.data == create_state().data
+    assert dict(snapshot) == state.data
+
+
+def test_restore_marks_restored_sections_as_changed() -> None:
+    state = create_state()
+    snapshot = state.snapshot()
+
+    state.data["user"]["username"] = "guest"
+    state.mark_clean()
+    state.restore(snapshot)
+
+    assert state.diff() == {"user": {"username": "root", "password": ""}}
+
+
+def test_snapshots_are_not_changed_by_the_state() -> None:
+    state = create_state()
+    snapshot = state.snapshot()
+
+    state.data["user"]["username"] = "guest"
+    snapshot["user"]["username"] = "modified copy"
+
+    assert snapshot["user"] == {"username": "root", "password": ""}
+
+
+def test_snapshots_share_unchanged_sections() -> None:
+    state = create_state()
+    first = state.snapshot()
+
+    state.data["user"]["username"] = "guest"
+    second = state.snapshot()
+
+    assert first.changed_sections(second) == {"user"}
+    assert first.shares(second, "progress")
+    assert not first.shares(second, "user")
+
+
+def test_restore_an_older_snapshot() -> None:
+    state = create_state()
+    first = state.snapshot()
+    state.data["name"] = "second"
+    state.snapshot()
+    state.data["note"] = "third"
+    del state.data["debug"]
+    state.snapshot()
+    state.data["progress"]["computer-brand"] = "fourth"
+
+    state.restore(first)
+
+    assert state.data == create_state().data
+
+
+def test_restore_after_the_data_was_replaced() -> None:
+    state = create_state()
+    snapshot = state.snapshot()
+
+    state.data = {"name": "replaced"}
+    state.restore(snapshot)
+
+    assert state.data == create_state().data
+
+
+def test_snapshot_of_plain_data() -> None:
+    data = {"section": {"key": [1]}}
+    snapshot = StateSnapshot(data)
+
+    data["section"]["key"].append(2)
+
+    assert snapshot["section"] == {"key": [1]}
+    assert len(snapshot) == 1
@@ -0,0 +1,128 @@
+"""
+Tests for src.core.state.sqlite_save_manager.
+"""
+
+# ------------------------------------------------------------------------------
+#  This file is part of Universal Sandbox.
+#
+#  Copyright (C) © 2020 Khaïs COLIN <logistic-bot@protonmail.com>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from src.core.state.game_state import GameState
+from src.core.state.sqlite_save_manager import SqliteSaveManager
+
+
+@pytest.fixture(name="manager")
+def create_manager(tmp_path: Path) -> Iterator[SqliteSaveManager]:
+    manager = SqliteSaveManager(tmp_path / "saves.sqlite3")
+    yield manager
+    manager.close()
+
+
+def create_save(manager: SqliteSaveManager, name: str) -> GameState:
+    save = GameState()
+    save.data["name"] = name
+    save.data["progress"]["computer-brand"] = "ether"
+    save.data["note"] = f"note of {name}"
+    manager.save_state(save)
+    return save
+
+
+def test_saves_are_listed_as_summaries(manager: SqliteSaveManager) -> None:
+    create_save(manager, "beta")
+    create_save(manager, "Alpha")
+
+    saves = manager.saves
+
+    assert [save.data["name"] for save in saves] == ["Alpha", "beta"]
+    assert all(save.summary for save in saves)
+    assert saves[0].data["progress"]["computer-brand"] == "ether"
+    assert "note" not in saves[0].data
+
+
+def test_load_data_loads_the_whole_save(manager: SqliteSaveManager) -> None:
+    save = create_save(manager, "save")
+    (summary,) = manager.saves
+
+    manager.load_data(summary)
+
+    assert not summary.summary
+    assert summary.filepath == save.filepath
+    assert summary.data == save.data
+    assert not summary.dirty
+
+
+def test_save_a_loaded_summary(manager: SqliteSaveManager) -> None:
+    create_save(manager, "save")
+    (summary,) = manager.saves
+
+    manager.load_data(summary)
+    summary.data["name"] = "renamed"
+    manager.save_state(summary)
+
+    (save,) = manager.saves
+    manager.load_data(save)
+    assert save.data["name"] == "renamed"
+    assert save.data["note"] == "note of save"
+
+
+def test_rename(manager: SqliteSaveManager) -> None:
+    create_save(manager, "old")
+    (summary,) = manager.saves
+
+    manager.rename(summary, "new")
+
+    (save,) = manager.saves
+    assert save.data["name"] == "new"
+    manager.load_data(save)
+    assert save.data["name"] == "new"
+    assert save.data["note"] == "note of old"
+
+
+def test_delete(manager: SqliteSaveManager) -> None:
+    kept = create_save(manager, "kept")
+    deleted = create_save(manager, "deleted")
+
+    manager.delete(deleted)
+
+    assert [save.filepath for save in manager.saves] == [kept.filepath]
+
+
+def test_load_data_of_a_deleted_save(manager: SqliteSaveManager) -> None:
+    create_save(manager, "save")
+    (summary,) = manager.saves
+    manager.delete(summary)
+
+    with pytest.raises(FileNotFoundError):
+        manager.load_data(summary)
+
+
+def test_saves_persist_in_the_database(tmp_path: Path) -> None:
+    manager = SqliteSaveManager(tmp_path / "saves.sqlite3")
+    save = create_save(manager, "save")
+    manager.close()
+
+    manager = SqliteSaveManager(tmp_path / "saves.sqlite3")
+    try:
+        (loaded,) = manager.saves
+        manager.load_data(loaded)
+    finally:
+        manager.close()
+    assert loaded.data == save.data
@@ -0,0 +1,136 @@
+"""
+Tests for src.core.state.tracked_dict.
+"""
+
+# ------------------------------------------------------------------------------
+#  This file is part of Universal Sandbox.
+#
+#  Copyright (C) © 2020 Khaïs COLIN <logistic-bot@protonmail.com>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+from typing import Any, List
+
+from src.core.state.tracked_dict import Journal, TrackedDict, untracked
+
+
+def create_document() -> TrackedDict:
+    document = TrackedDict({"items": [{"value": 0}, {"value": 1}, [2]]})
+    document.mark_clean()
+    return document
+
+
+def change_every_item(items: List[Any]) -> None:
+    for item in items:
+        if isinstance(item, dict):
+            item["value"] = "changed"
+        else:
+            item.append("changed")
+
+
+def paths_of_changed_items(document: TrackedDict) -> Journal:
+    document.mark_clean()
+    change_every_item(document["items"])
+    return document.journal
+
+
+def test_nested_changes_are_recorded() -> None:
+    document = create_document()
+
+    document["items"][0]["value"] = 10
+    document["items"][2].append(3)
+
+    assert document.journal == {("items", 0, "value"), ("items", 2)}
+    assert untracked(document) == {"items": [{"value": 10}, {"value": 1}, [2, 3]]}
+
+
+def test_paths_after_insert() -> None:
+    document = create_document()
+
+    document["items"].insert(0, {"value": -1})
+
+    assert paths_of_changed_items(document) == {
+        ("items", 0, "value"),
+        ("items", 1, "value"),
+        ("items", 2, "value"),
+        ("items", 3),
+    }
+
+
+def test_paths_after_insert_with_a_negative_index() -> None:
+    document = create_document()
+
+    document["items"].insert(-1, {"value": 1.5})
+
+    assert document["items"][2] == {"value": 1.5}
+    assert paths_of_changed_items(document) == {
+        ("items", 0, "value"),
+        ("items", 1, "value"),
+        ("items", 2, "value"),
+        ("items", 3),
+    }
+
+
+def test_paths_after_pop() -> None:
+    document = create_document()
+
+    popped = document["items"].pop(0)
+
+    assert popped == {"value": 0}
+    assert paths_of_changed_items(document) == {("items", 0, "value"), ("items", 1)}
+
+
+def test_paths_after_slice_assignment() -> None:
+    document = create_document()
+
+    # one item is replaced by two, so the last item moves
+    document["items"][0:1] = [{"value": "a"}, {"value": "b"}]
+
+    assert paths_of_changed_items(document) == {
+        ("items", 0, "value"),
+        ("items", 1, "value"),
+        ("items", 2, "value"),
+        ("items", 3),
+    }
+
+
+def test_paths_after_slice_deletion() -> None:
+    document = create_document()
+
+    del document["items"][:2]
+
+    assert paths_of_changed_items(document) == {("items", 0)}
+
+
+def test_paths_after_sort_and_reverse() -> None:
+    document = TrackedDict({"items": [{"value": 2}, {"value": 1}, {"value": 0}]})
+
+    document["items"].sort(key=lambda item: item["value"])
+    document["items"].reverse()
+    document["items"].sort(key=lambda item: item["value"])
+    document.mark_clean()
+    document["items"][0]["value"] = "first"
+
+    assert document.journal == {("items", 0, "value")}
+    assert document["items"][0] == {"value": "first"}
+
+
+def test_paths_of_nested_lists_after_insert() -> None:
+    document = TrackedDict({"grid": [[{"value": 0}], [{"value": 1}]]})
+
+    document["grid"].insert(0, [])
+    document.mark_clean()
+    document["grid"][2][0]["value"] = "changed"
+
+    assert document.journal == {("grid", 2, 0, "value")}